@@ -3,14 +3,65 @@ import discord
 from discord.ext import commands
 from discord.ui import Modal, TextInput, View, Button, Select, ChannelSelect
 from contextlib import suppress
+import glob
+import hashlib
+import io
 import json
 import os
-from datetime import datetime
+import time as time_module
+from datetime import datetime, timedelta
+from apscheduler.events import EVENT_JOB_MISSED
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import gspread
 from google.oauth2.service_account import Credentials
-from gtts import gTTS
 import asyncio
+from config import ALARM_MISFIRE_GRACE, DB_FILE, SHEET_SYNC_INTERVAL
+from core.alarm_io import export_alarms, parse_import
+from core.alarm_store import LEGACY_GUILD, AlarmStore
+from core.latency import LatencyTracker
+from core.opus_audio import ensure_opus
+from core.recurrence import (
+    describe_repeat, describe_schedule, next_fire_time, normalize_repeat, parse_offset, parse_time
+)
+from core.sheet_sync import SheetSyncWorker
+from core.tts_backends import get_backend, synthesize_to_file
+from core.voice_manager import get_voice_manager, resolve_ffmpeg
+
+# 구글 시트에서 길드 ID를 적는 열 (H열, 0부터 셈)
+SHEET_GUILD_COLUMN = 7
+# 유예 시간 안에 늦게 실행되는 발동은 한 번만 실행
+JOB_DEFAULTS = {
+    'misfire_grace_time': ALARM_MISFIRE_GRACE,
+    'coalesce': True,
+    'max_instances': 1
+}
+
+
+# job store에 저장된 job이 호출할 알람 Cog (로드될 때 설정)
+_active_alarm_cog = None
+
+
+def create_scheduler():
+    """알람 스케줄러 (job은 DB_FILE에 저장되어 재시작해도 유지)"""
+    try:
+        from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+        jobstores = {'default': SQLAlchemyJobStore(url=f"sqlite:///{DB_FILE}")}
+    except ImportError:
+        print("[WARNING] SQLAlchemy가 없어 알람 job을 메모리에만 보관합니다.")
+        jobstores = {}
+    return AsyncIOScheduler(jobstores=jobstores, job_defaults=JOB_DEFAULTS)
+
+
+async def fire_slot_job(when):
+    """스케줄러 job 진입점 (timer wheel의 한 칸)
+
+    job store는 job을 직렬화해 저장하므로 Cog 메서드가 아닌 모듈 함수를 등록한다.
+    """
+    if _active_alarm_cog is None:
+        print(f"[WARNING] {when} 알람 발동 시 알람 기능이 로드되어 있지 않음")
+        return
+    await _active_alarm_cog.fire_slot(when)
 
 # 채널 선택 View
 class ChannelSelectView(View):
@@ -84,50 +135,23 @@ class AlarmTypeModal(Modal, title="알람 추가"):
             # 음성 옵션 처리
             voice_enabled = self.voice.value.lower() in {'y', 'yes', '네', '예'}
             
-            alarms = self.cog.get_alarms()
-            alarms[self.name.value] = {
+            data = {
                 "time": self.time.value,
                 "repeat": self.repeat_type,
                 "created": datetime.now().isoformat(),
                 "channel_id": self.channel_id,  # 채널 ID 저장
                 "voice": voice_enabled  # 음성 안내 설정
             }
-            self.cog.save_alarms(alarms)
+            guild_id = interaction.guild.id
+            self.cog.store.upsert(guild_id, self.name.value, data)
             
             # 구글 시트에도 저장
-            self.cog.save_to_google_sheet(self.name.value, self.time.value, self.repeat_type, self.channel_id, voice_enabled)
-            
-            # 스케줄러에 등록
-            job_id = f"alarm_{self.name.value}"
-            
-            # 기존 job이 있으면 제거
-            if self.cog.scheduler.get_job(job_id):
-                self.cog.scheduler.remove_job(job_id)
+            self.cog.save_to_google_sheet(guild_id, self.name.value, data)
             
-            if self.repeat_type == "daily":
-                # 매일 반복
-                self.cog.scheduler.add_job(
-                    self.cog.trigger_alarm,
-                    'cron',
-                    hour=hour,
-                    minute=minute,
-                    id=job_id,
-                    args=[self.channel_id, self.name.value, False, voice_enabled],
-                    replace_existing=True
-                )
-            else:
-                # 1회성 (다음 발생 시간에만 트리거)
-                self.cog.scheduler.add_job(
-                    self.cog.trigger_alarm,
-                    'cron',
-                    hour=hour,
-                    minute=minute,
-                    id=job_id,
-                    args=[self.channel_id, self.name.value, True, voice_enabled],
-                    replace_existing=True
-                )
+            # 발동 시각표에 등록 (기존 시각은 교체, 음성 안내는 지금 미리 합성)
+            self.cog.schedule_alarm(guild_id, self.name.value, data)
             
-            repeat_text = "매일" if self.repeat_type == "daily" else "1회"
+            repeat_text = describe_repeat(self.repeat_type)
             channel_text = f"<#{self.channel_id}>" if self.channel_id else "기본 채널"
             voice_text = "[OK] 사용" if voice_enabled else "[ERROR] 미사용"
             embed = discord.Embed(
@@ -192,24 +216,23 @@ class AlarmView(View):
     @discord.ui.button(label="[LIST] 목록 보기", style=discord.ButtonStyle.primary)
     async def list_button(self, interaction: discord.Interaction, button: Button):
         """목록 보기 버튼"""
-        alarms = self.cog.get_alarms()
+        alarms = self.cog.get_alarms(interaction.guild.id)
         if not alarms:
             await interaction.response.send_message("등록된 알람이 없습니다.", ephemeral=True)
             return
         
         embed = discord.Embed(title="[ALARM] 알람 목록", color=discord.Color.blue())
         
-        daily_count = 0
+        repeat_count = 0
         once_count = 0
         
         for name, data in alarms.items():
-            repeat_text = "매일" if data["repeat"] == "daily" else "1회"
-            if data["repeat"] == "daily":
-                daily_count += 1
+            if data["repeat"] != "once":
+                repeat_count += 1
             else:
                 once_count += 1
             
-            emoji = "[REPEAT]" if data["repeat"] == "daily" else "[TIME]"
+            emoji = "[REPEAT]" if data["repeat"] != "once" else "[TIME]"
             channel_id = data.get("channel_id")
             channel_text = f"<#{channel_id}>" if channel_id else "기본 채널"
             voice_enabled = data.get("voice", False)
@@ -217,40 +240,19 @@ class AlarmView(View):
             
             embed.add_field(
                 name=f"{emoji} {name} {voice_text}",
-                value=f"[TIME] {data['time']} ({repeat_text})\n[CHANNEL] {channel_text}",
+                value=f"[TIME] {describe_schedule(data['repeat'], data['time'], data.get('offset', 0))}\n[CHANNEL] {channel_text}",
                 inline=False
             )
         
-        embed.set_footer(text=f"매일: {daily_count}개 | 1회: {once_count}개")
+        embed.set_footer(text=f"반복: {repeat_count}개 | 1회: {once_count}개")
         await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.ui.button(label="[REPEAT] 새로고침", style=discord.ButtonStyle.secondary)
     async def refresh_button(self, interaction: discord.Interaction, button: Button):
         """새로고침 버튼"""
         try:
-            # 모든 알람 job 제거
-            self.cog.scheduler.remove_all_jobs()
-            
-            # 다시 등록
-            alarms = self.cog.get_alarms()
-            total_count = 0
-            for name, data in alarms.items():
-                hour, minute = map(int, data['time'].split(':'))
-                job_id = f"alarm_{name}"
-                is_once = data['repeat'] != 'daily'
-                channel_id = data.get('channel_id')
-                voice_enabled = data.get('voice', False)
-                
-                self.cog.scheduler.add_job(
-                    self.cog.trigger_alarm,
-                    'cron',
-                    hour=hour,
-                    minute=minute,
-                    id=job_id,
-                    args=[channel_id, name, is_once, voice_enabled],
-                    replace_existing=True
-                )
-                total_count += 1
+            # 이 서버의 알람 job 다시 등록
+            total_count = self.cog.rebuild_jobs(interaction.guild.id)
             
             embed = discord.Embed(
                 title="[OK] 알람 새로고침됨",
@@ -291,22 +293,54 @@ class AlarmView(View):
 class Alarm(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.alarm_file = "data/alarms.json"
-        self.scheduler = AsyncIOScheduler()
+        self.alarm_file = "data/alarms.json"  # 이전 형식 (DB로 자동 이전)
+        self.store = AlarmStore(DB_FILE)
+        self.scheduler = create_scheduler()
         self.google_sheet = None
-        self.ensure_file()
+        self.voice = get_voice_manager(bot)
+        self.voice_clips = {}  # (guild_id, 알람 이름) -> 음성 파일 미리 합성 태스크
+        self.default_channels = {}  # guild_id -> 알람 기본 채널 ID (채널 변경 시 무효화)
+        self.latency = LatencyTracker()
+        # timer wheel: 발동 시각 -> {(guild_id, 이름)}, 시각마다 scheduler job 하나
+        self.wheel = {}
+        self.next_fires = {}  # (guild_id, 이름) -> 다음 발동 시각
+        self.fire_stats = {'fired': 0, 'coalesced': 0, 'missed': 0, 'messages': 0, 'voice_batches': 0}
+        self.store.migrate_json(self.alarm_file)
         self.init_google_sheet()
+        # 시트 반영은 백그라운드에서 모아서 처리 (명령 처리 중 HTTP 대기 없음)
+        # 행 키: 이름(A열) + 길드 ID(H열)
+        self.sheet_sync = SheetSyncWorker(
+            self.google_sheet, interval=SHEET_SYNC_INTERVAL, key_columns=(0, SHEET_GUILD_COLUMN)
+        )
+        if self.google_sheet:
+            self.sheet_sync.start()
+        
+        # job store에 저장된 job이 fire_slot_job에서 이 인스턴스를 찾을 수 있도록
+        global _active_alarm_cog
+        _active_alarm_cog = self
         
+        self.scheduler.add_listener(self.on_job_missed, EVENT_JOB_MISSED)
+        # 봇이 준비되기 전에는 채널을 찾을 수 없으므로, 놓친 알람은 준비된 뒤에 실행
         if not self.scheduler.running:
-            self.scheduler.start()
+            self.scheduler.start(paused=not bot.is_ready())
         
-        # 봇 시작 시 기존 알람 로드
+        # 봇 시작 시 알람 DB로 발동 시각표 만들고 job store와 맞추기
         self.load_existing_alarms()
+        if bot.is_ready():
+            self.adopt_legacy_alarms()
 
-    def ensure_file(self):
-        """파일 생성 및 초기화"""
-        if not os.path.exists(self.alarm_file):
-            self.save_alarms({})
+    async def cog_unload(self):
+        global _active_alarm_cog
+        if _active_alarm_cog is self:
+            _active_alarm_cog = None
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        for task in self.voice_clips.values():
+            task.cancel()
+        self.store.close()
+        # 남은 시트 변경은 한 번 더 반영 시도 (실패해도 outbox에 남아 다음 시작 시 처리)
+        if self.google_sheet:
+            await self.sheet_sync.stop()
     
     def init_google_sheet(self):
         """구글 시트 초기화"""
@@ -323,7 +357,7 @@ class Alarm(commands.Cog):
                 spreadsheet = client.create('Discord_Alarms')
                 self.google_sheet = spreadsheet.sheet1
                 # 헤더 설정
-                self.google_sheet.update('A1:F1', [['이름', '시간', '반복유형', '채널ID', '생성일', '상태']])
+                self.google_sheet.update('A1:H1', [['이름', '시간', '반복유형', '채널ID', '생성일', '상태', '음성', '길드ID']])
                 print("[OK] 구글 시트 'Discord_Alarms' 생성됨")
             
             print("[OK] 구글 시트 연결 성공")
@@ -335,74 +369,273 @@ class Alarm(commands.Cog):
             self.google_sheet = None
     
     def load_existing_alarms(self):
-        """저장된 알람을 스케줄러에 등록"""
-        alarms = self.get_alarms()
-        for name, data in alarms.items():
-            hour, minute = map(int, data['time'].split(':'))
-            job_id = f"alarm_{name}"
-            is_once = data['repeat'] != 'daily'
-            channel_id = data.get('channel_id')
-            voice_enabled = data.get('voice', False)
-            
-            # 기존 job이 있으면 제거
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
-            self.scheduler.add_job(
-                self.trigger_alarm,
-                'cron',
-                hour=hour,
-                minute=minute,
-                id=job_id,
-                args=[channel_id, name, is_once, voice_enabled],
-                replace_existing=True
+        """알람 DB로 발동 시각표(timer wheel)를 만들고 job store와 맞추기
+
+        마지막 발동 이후 유예 시간 안에 놓친 발동이 있으면 그 시각으로 잡아
+        봇이 준비되면 한 번 실행되게 한다. 시각별 job은 DB에 저장되어 재시작해도
+        남아 있으므로 빠진 job만 등록하고, 시각표에 없는 job만 제거한다.
+        """
+        self.wheel.clear()
+        self.next_fires.clear()
+        
+        alarms = self.store.all_guilds()
+        lookback = self.now() - timedelta(seconds=ALARM_MISFIRE_GRACE)
+        for guild_id, name, data in alarms:
+            self.schedule_alarm(
+                guild_id, name, data, after=self.catch_up_start(data, lookback), register=False
             )
+        
+        wanted = {self.slot_job_id(when): when for when in self.wheel}
+        removed = 0
+        for job in self.scheduler.get_jobs():
+            # alarm_<이름>: 알람마다 job을 두던 이전 형식
+            if job.id.startswith("alarm_") and job.id not in wanted:
+                job.remove()
+                removed += 1
+        existing = {job.id for job in self.scheduler.get_jobs()}
+        added = 0
+        for job_id, when in wanted.items():
+            if job_id not in existing:
+                self.add_slot_job(when)
+                added += 1
+        
+        print(f"[OK] 알람 {len(alarms)}개 로드 (발동 시각 {len(self.wheel)}개, job 추가 {added}개·제거 {removed}개)")
+    
+    def now(self):
+        return datetime.now(self.scheduler.timezone)
+    
+    @staticmethod
+    def catch_up_start(data, lookback):
+        """놓친 발동을 찾기 시작할 시각 (마지막 발동·등록 이전 시각은 다시 울리지 않음)"""
+        start = lookback
+        for key in ('last_fired', 'created'):
+            with suppress(TypeError, ValueError):
+                moment = datetime.fromisoformat(data.get(key))
+                if moment.tzinfo is None:
+                    moment = moment.astimezone()  # 시스템 시간대로 저장된 값
+                start = max(start, moment)
+        return start
+    
+    def adopt_legacy_alarms(self):
+        """길드 구분 이전 알람을 길드로 옮기기
+
+        채널이 지정된 알람은 그 채널의 길드로, 채널이 없으면 봇이 한 서버에만
+        있을 때 그 서버로 옮긴다. 옮길 수 없는 알람은 그대로 두고 이전 방식으로 발동.
+        """
+        legacy = self.store.all(LEGACY_GUILD)
+        if not legacy:
+            return
+        
+        moved = 0
+        for name, data in legacy.items():
+            channel = self.bot.get_channel(data['channel_id']) if data.get('channel_id') else None
+            guild = channel.guild if channel else (self.bot.guilds[0] if len(self.bot.guilds) == 1 else None)
+            if guild is None or not self.store.move(name, LEGACY_GUILD, guild.id):
+                continue
+            self.forget_alarm(LEGACY_GUILD, name)  # 이전 키로 만든 음성 파일도 정리
+            self.schedule_alarm(guild.id, name, data)
+            # 시트의 이전 행(길드ID 빈 칸)에도 길드 ID 채우기
+            self.save_to_google_sheet(guild.id, name, data)
+            moved += 1
+        print(f"[OK] 길드 구분 이전 알람 {moved}/{len(legacy)}개를 길드로 이동")
+    
+    @staticmethod
+    def slot_job_id(when):
+        return f"alarm_slot_{when.isoformat()}"
+    
+    def add_slot_job(self, when):
+        """발동 시각의 scheduler job 등록 (시각마다 고정된 ID라 이미 있으면 교체)"""
+        self.scheduler.add_job(
+            fire_slot_job,
+            'date',
+            run_date=when,
+            args=[when],
+            id=self.slot_job_id(when),
+            replace_existing=True
+        )
+    
+    def schedule_alarm(self, guild_id, name, data, after=None, register=True):
+        """알람의 다음 발동 시각을 시각표에 넣기 (등록한 시각 반환)
+
+        같은 시각에 울리는 알람은 scheduler job 하나를 같이 쓴다.
+        register=False면 시각표만 고치고 job은 등록하지 않는다 (시작 시 job store와 맞출 때).
+        """
+        key = (guild_id, name)
+        self._unslot(key)
+        when = next_fire_time(
+            data['repeat'], data['time'], data.get('offset', 0),
+            after or self.now(), self.scheduler.timezone
+        )
+        if when is None:
+            return None
+        
+        slot = self.wheel.setdefault(when, set())
+        if not slot and register:
+            self.add_slot_job(when)
+        slot.add(key)
+        self.next_fires[key] = when
+        # 음성 알람은 발동 전에 미리 합성해 둠
+        if data.get('voice', False):
+            self.prerender_voice_clip(guild_id, name)
+        return when
+    
+    def _unslot(self, key):
+        """시각표에서 알람 빼기 (그 시각에 남은 알람이 없으면 job도 제거)"""
+        when = self.next_fires.pop(key, None)
+        slot = self.wheel.get(when)
+        if slot is None:
+            return
+        slot.discard(key)
+        if not slot:
+            del self.wheel[when]
+            with suppress(JobLookupError):
+                self.scheduler.remove_job(self.slot_job_id(when))
+    
+    def unschedule_alarm(self, guild_id, name):
+        """알람을 발동 시각표에서 제거"""
+        self._unslot((guild_id, name))
+    
+    def rebuild_jobs(self, guild_id):
+        """길드의 알람 발동 시각 다시 계산 (등록한 개수 반환)"""
+        alarms = self.get_alarms(guild_id)
+        for key in [key for key in self.next_fires if key[0] == guild_id and key[1] not in alarms]:
+            self._unslot(key)
+        for name, data in alarms.items():
+            self.schedule_alarm(guild_id, name, data)
+        return len(alarms)
+    
+    async def fire_slot(self, when):
+        """한 시각에 울리는 알람 전부 발동 (timer wheel의 한 칸)"""
+        keys = self.wheel.pop(when, set())
+        due = []
+        for key in sorted(keys):
+            if self.next_fires.get(key) == when:
+                del self.next_fires[key]
+            data = self.store.get(*key)
+            if data is not None:
+                due.append((key, data))
+        if not due:
+            return
+        
+        self.store.mark_fired([key for key, _ in due], when.isoformat())
+        # 반복 알람은 다음 발동 시각 등록 (늦게 실행돼 지나간 발동은 건너뛰어 한 번만 울림)
+        now = self.now()
+        for (guild_id, name), data in due:
+            if data['repeat'] == 'once':
+                continue
+            following = self.schedule_alarm(guild_id, name, data, after=when)
+            if following is not None and following <= now:
+                self.fire_stats['coalesced'] += 1
+                self.schedule_alarm(guild_id, name, data, after=now)
+        
+        await self.trigger_alarms(due, scheduled=when)
+    
+    def forget_alarm(self, guild_id, name):
+        """삭제된 알람의 job·음성 파일 정리"""
+        self.unschedule_alarm(guild_id, name)
+        self.remove_voice_clip(guild_id, name)
 
-    def save_alarms(self, alarms):
-        """알람 데이터 저장"""
-        os.makedirs(os.path.dirname(self.alarm_file), exist_ok=True)
-        with open(self.alarm_file, 'w', encoding='utf-8') as f:
-            json.dump(alarms, f, ensure_ascii=False, indent=2)
+    def save_to_google_sheet(self, guild_id, name, data):
+        """구글 시트에 알람 저장 (백그라운드 동기화 대기열에 추가)"""
+        if not self.google_sheet:
+            return
+        
+        self.sheet_sync.upsert(self.sheet_row(guild_id, name, data))
     
-    def save_to_google_sheet(self, name, time, repeat, channel_id, voice_enabled=False):
-        """구글 시트에 알람 저장"""
+    def save_many_to_google_sheet(self, guild_id, alarms):
+        """여러 알람을 구글 시트 대기열에 한 번에 추가 (한 번의 batch_update로 반영)"""
         if not self.google_sheet:
             return
         
-        try:
-            row = [
-                name,
-                time,
-                "매일" if repeat == "daily" else "1회",
-                str(channel_id) or "기본",
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "활성",
-                "[SPEAKER]" if voice_enabled else ""
-            ]
-            self.google_sheet.append_row(row)
-            print(f"[OK] 구글 시트에 알람 '{name}' 추가됨")
-        except Exception as e:
-            print(f"[WARNING] 구글 시트 저장 실패: {e}")
+        self.sheet_sync.upsert_many([self.sheet_row(guild_id, name, data) for name, data in alarms.items()])
+    
+    @staticmethod
+    def sheet_row(guild_id, name, data):
+        """구글 시트 한 행 (A~H열)"""
+        return [
+            name,
+            data['time'],
+            describe_repeat(data.get('repeat', 'once'), data.get('offset', 0)),
+            str(data.get('channel_id') or "기본"),
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "활성",
+            "[SPEAKER]" if data.get('voice', False) else "",
+            str(guild_id)
+        ]
     
-    def delete_from_google_sheet(self, name):
-        """구글 시트에서 알람 삭제"""
+    def delete_from_google_sheet(self, guild_id, name):
+        """구글 시트에서 알람 삭제 (백그라운드 동기화 대기열에 추가)"""
         if not self.google_sheet:
             return
         
-        try:
-            if (cell := self.google_sheet.find(name)):
-                self.google_sheet.delete_rows(cell.row)
-                print(f"[OK] 구글 시트에서 알람 '{name}' 삭제됨")
-        except Exception as e:
-            print(f"[WARNING] 구글 시트 삭제 실패: {e}")
+        self.sheet_sync.delete(name, guild_id)
 
-    def get_alarms(self):
-        """저장된 알람 반환"""
-        try:
-            with open(self.alarm_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {}
+    def get_alarms(self, guild_id):
+        """길드에 저장된 알람 반환"""
+        return self.store.all(guild_id)
+    
+    def default_channel(self, guild):
+        """길드의 알람 기본 채널 (한 번 찾으면 채널이 바뀔 때까지 캐시)"""
+        channel_id = self.default_channels.get(guild.id)
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if channel is not None:
+            return channel
+        
+        channel = self._find_default_channel(guild)
+        if channel is not None:
+            self.default_channels[guild.id] = channel.id
+        return channel
+    
+    def _find_default_channel(self, guild):
+        """설정된 알람 채널 → 시스템 채널 → 메시지를 보낼 수 있는 첫 텍스트 채널"""
+        settings = self.load_alarm_settings()
+        configured = guild.get_channel(settings.get("alarm_channel_id", 0) or 0)
+        candidates = [configured, guild.system_channel, *guild.text_channels]
+        for channel in candidates:
+            if channel is not None and channel.permissions_for(guild.me).send_messages:
+                return channel
+        return None
+    
+    def _invalidate_default_channel(self, guild):
+        self.default_channels.pop(guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self.adopt_legacy_alarms()
+        # 재시작 중 놓친 알람은 여기서 (유예 시간 안이면) 한 번 실행됨
+        self.scheduler.resume()
+    
+    def on_job_missed(self, event):
+        """유예 시간을 넘겨 건너뛴 발동 (해당 알람은 다음 발동 시각으로 다시 등록)"""
+        if not event.job_id.startswith("alarm_slot_"):
+            return
+        when = event.scheduled_run_time
+        keys = self.wheel.pop(when, set())
+        self.fire_stats['missed'] += len(keys)
+        print(f"[WARNING] 알람 {len(keys)}개 발동 누락 (유예 {ALARM_MISFIRE_GRACE}초 초과): {when}")
+        for key in keys:
+            if self.next_fires.get(key) == when:
+                del self.next_fires[key]
+            data = self.store.get(*key)
+            if data is not None:
+                self.schedule_alarm(*key, data)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self._invalidate_default_channel(channel.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self._invalidate_default_channel(channel.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        # 권한 변경으로 보낼 수 없게 된 경우 포함
+        self._invalidate_default_channel(after.guild)
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._invalidate_default_channel(guild)
 
     @commands.command(name="알람ui", help="알람 UI 표시")
     async def alarm_ui(self, ctx_or_interaction):
@@ -430,61 +663,60 @@ class Alarm(commands.Cog):
             await ctx_or_interaction.send(embed=embed, view=view)
 
     @commands.group(name="알람", help="알람 관리 명령어")
+    @commands.guild_only()
     async def alarm(self, ctx):
         if ctx.invoked_subcommand is None:
             embed = discord.Embed(title="[ALARM] 알람 도움말", color=discord.Color.blue())
             embed.add_field(name="UI 관리", value="`!알람ui` - 버튼식 UI 사용", inline=False)
-            embed.add_field(name="추가", value="`!알람 추가 <이름> <시간(HH:MM)> [반복(daily/once)] [음성(y/n)]`", inline=False)
+            embed.add_field(name="추가", value="`!알람 추가 <이름> <시간(HH:MM)> [반복] [음성(y/n)] [오프셋]`", inline=False)
+            embed.add_field(
+                name="반복 규칙",
+                value="`매일` · `1회` · `매주:월,목` · `every:3h` · `\"cron:0 21 * * thu\"` (cron은 시간 자리에 `-`)\n"
+                      "오프셋 `-5` 또는 `5분전`: 예정 시각보다 먼저 알림",
+                inline=False
+            )
             embed.add_field(name="삭제", value="`!알람 삭제 <이름>`", inline=False)
             embed.add_field(name="목록", value="`!알람 목록`", inline=False)
             embed.add_field(name="새로고침", value="`!알람 새로고침`", inline=False)
             embed.add_field(name="초기화", value="`!알람 초기화` - 모든 알람 삭제 (관리자)", inline=False)
+            embed.add_field(name="시트 동기화", value="`!알람 시트` - 구글 시트 반영 대기 상태", inline=False)
+            embed.add_field(name="가져오기", value="`!알람 가져오기` - CSV/JSON 파일을 첨부해 알람 일괄 등록 (관리자)", inline=False)
+            embed.add_field(name="내보내기", value="`!알람 내보내기 [csv/json]` - 알람 목록 파일로 받기", inline=False)
+            embed.add_field(name="지연 통계", value="`!알람 지연` - 발동·전송·음성 시작 지연 백분위", inline=False)
             embed.add_field(name="음성 안내", value="UI 또는 명령어에서 음성 옵션을 'y'로 설정하면 알람 발동 시 음성 채널에서 음성으로 안내됩니다.", inline=False)
             await ctx.send(embed=embed)
 
     @alarm.command(name="추가", help="새 알람 추가")
-    async def add_alarm(self, ctx, name: str, time: str, repeat: str = "once", voice: str = "n"):
-        """알람 추가"""
+    async def add_alarm(self, ctx, name: str, time: str, repeat: str = "once", voice: str = "n", offset: str = "0"):
+        """알람 추가
+
+        반복: 매일, 1회, 매주:월,목, every:3h, "cron:0 21 * * thu" (cron은 시간 자리에 '-')
+        오프셋: -5 또는 5분전 (예정 시각보다 5분 먼저 알림)
+        """
         try:
-            hour, minute = map(int, time.split(':'))
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError("시간 형식이 잘못되었습니다 (00:00-23:59)")
-            
-            repeat = "daily" if repeat.lower() in {"daily", "매일"} else "once"
+            repeat = normalize_repeat(repeat)
+            # cron 규칙은 식에 시각이 들어 있음
+            time = "" if repeat.startswith("cron:") else parse_time(time)
+            offset = parse_offset(offset)
             voice_enabled = voice.lower() in {"y", "yes", "네", "예"}
             
-            alarms = self.get_alarms()
-            alarms[name] = {
+            data = {
                 "time": time,
                 "repeat": repeat,
+                "offset": offset,
                 "created": datetime.now().isoformat(),
                 "voice": voice_enabled
             }
-            self.save_alarms(alarms)
-            
-            # 스케줄러에 등록
-            job_id = f"alarm_{name}"
+            self.store.upsert(ctx.guild.id, name, data)
             
-            # 기존 job이 있으면 제거
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
-            is_once = repeat != 'daily'
-            self.scheduler.add_job(
-                self.trigger_alarm,
-                'cron',
-                hour=hour,
-                minute=minute,
-                id=job_id,
-                args=[None, name, is_once, voice_enabled],
-                replace_existing=True
-            )
+            # 발동 시각표에 등록 (기존 시각은 교체)
+            next_fire = self.schedule_alarm(ctx.guild.id, name, data)
             
-            repeat_text = "매일" if repeat == 'daily' else "1회"
             voice_text = "[SPEAKER] 음성 안내 포함" if voice_enabled else ""
+            next_text = next_fire.strftime("%m/%d %H:%M") if next_fire else "없음"
             embed = discord.Embed(
                 title="[OK] 알람 추가됨",
-                description=f"**이름:** {name}\n**시간:** {time}\n**반복:** {repeat_text}\n{voice_text}",
+                description=f"**이름:** {name}\n**일정:** {describe_schedule(repeat, time, offset)}\n**다음 알림:** {next_text}\n{voice_text}",
                 color=discord.Color.green()
             )
             await ctx.send(embed=embed)
@@ -494,18 +726,10 @@ class Alarm(commands.Cog):
     @alarm.command(name="삭제", help="알람 삭제")
     async def delete_alarm(self, ctx, name: str):
         """알람 삭제"""
-        alarms = self.get_alarms()
-        if name in alarms:
-            # 스케줄러에서도 제거
-            job_id = f"alarm_{name}"
-            if self.scheduler.get_job(job_id):
-                self.scheduler.remove_job(job_id)
-            
-            del alarms[name]
-            self.save_alarms(alarms)
-            
-            # 구글 시트에서도 삭제
-            self.delete_from_google_sheet(name)
+        if self.store.delete(ctx.guild.id, name):
+            # 스케줄러·음성 파일·구글 시트에서도 제거
+            self.forget_alarm(ctx.guild.id, name)
+            self.delete_from_google_sheet(ctx.guild.id, name)
             
             await ctx.send(f"[OK] **{name}** 알람이 삭제되었습니다.")
         else:
@@ -514,47 +738,136 @@ class Alarm(commands.Cog):
     @alarm.command(name="목록", help="모든 알람 표시")
     async def list_alarms(self, ctx):
         """저장된 알람 목록 표시"""
-        alarms = self.get_alarms()
+        alarms = self.get_alarms(ctx.guild.id)
         if not alarms:
             await ctx.send("등록된 알람이 없습니다.")
             return
         
         embed = discord.Embed(title="[ALARM] 알람 목록", color=discord.Color.blue())
         for name, data in alarms.items():
-            repeat_text = "매일" if data["repeat"] == "daily" else "1회"
             voice_enabled = data.get("voice", False)
             voice_text = "[SPEAKER]" if voice_enabled else ""
+            next_fire = self.next_fires.get((ctx.guild.id, name))
+            next_text = f"\n다음: {next_fire.strftime('%m/%d %H:%M')}" if next_fire else ""
             embed.add_field(
                 name=f"{name} {voice_text}",
-                value=f"[TIME] {data['time']} ({repeat_text})",
+                value=f"[TIME] {describe_schedule(data['repeat'], data['time'], data.get('offset', 0))}{next_text}",
                 inline=False
             )
         await ctx.send(embed=embed)
 
-    @alarm.command(name="새로고침", help="알람 스케줄 새로고침")
-    async def refresh_alarms(self, ctx):
-        """알람 스케줄 업데이트"""
-        self.scheduler.remove_all_jobs()
+    @alarm.command(name="가져오기", help="CSV/JSON 파일로 알람 일괄 등록 (관리자 전용)")
+    @commands.has_permissions(administrator=True)
+    async def import_alarms(self, ctx):
+        """첨부한 CSV/JSON 파일의 알람을 한 번에 등록
+
+        전체를 먼저 검증하고 오류가 있으면 아무것도 반영하지 않는다.
+        같은 이름의 알람은 덮어쓴다.
+        """
+        attachment = next(
+            (a for a in ctx.message.attachments if a.filename.lower().endswith(('.csv', '.json'))),
+            None
+        )
+        if attachment is None:
+            await ctx.send(
+                "[WARNING] CSV 또는 JSON 파일을 첨부해 주세요.\n"
+                "CSV 헤더: `name,time,repeat,channel_id,voice,offset` (예: `레이드,21:00,매주:목,,y,-5`)"
+            )
+            return
         
-        alarms = self.get_alarms()
-        active_count = 0
+        alarms, errors = parse_import(attachment.filename, await attachment.read())
+        # 다른 서버의 채널은 지정할 수 없음
         for name, data in alarms.items():
-            hour, minute = map(int, data['time'].split(':'))
-            job_id = f"alarm_{name}"
-            is_once = data['repeat'] != 'daily'
             channel_id = data.get('channel_id')
-            voice_enabled = data.get('voice', False)
-            
-            self.scheduler.add_job(
-                self.trigger_alarm,
-                'cron',
-                hour=hour,
-                minute=minute,
-                id=job_id,
-                args=[channel_id, name, is_once, voice_enabled],
-                replace_existing=True
-            )
-            active_count += 1
+            if channel_id and ctx.guild.get_channel(channel_id) is None:
+                errors.append(f"'{name}': 이 서버에 없는 채널입니다 ({channel_id})")
+        if errors:
+            shown = "\n".join(errors[:10])
+            more = f"\n... 외 {len(errors) - 10}건" if len(errors) > 10 else ""
+            await ctx.send(f"[ERROR] 가져오기 취소 (오류 {len(errors)}건, 아무것도 반영하지 않음)\n{shown}{more}")
+            return
+        
+        # DB는 한 트랜잭션, job은 한 번에 등록, 시트는 한 번의 batch로 반영
+        added = self.store.upsert_many(ctx.guild.id, alarms)
+        for name, data in alarms.items():
+            self.schedule_alarm(ctx.guild.id, name, data)
+        self.save_many_to_google_sheet(ctx.guild.id, alarms)
+        
+        embed = discord.Embed(
+            title="[OK] 알람 가져오기 완료",
+            description=f"총 {len(alarms)}개 (새로 추가 {added}개, 덮어씀 {len(alarms) - added}개)",
+            color=discord.Color.green()
+        )
+        await ctx.send(embed=embed)
+
+    @alarm.command(name="내보내기", help="알람 목록을 CSV/JSON 파일로 받기")
+    async def export_alarm_file(self, ctx, fmt: str = "csv"):
+        """이 서버의 알람을 가져오기와 같은 형식의 파일로 전송"""
+        fmt = fmt.lower()
+        if fmt not in {"csv", "json"}:
+            await ctx.send("[ERROR] 형식은 csv 또는 json만 가능합니다.")
+            return
+        
+        alarms = self.get_alarms(ctx.guild.id)
+        if not alarms:
+            await ctx.send("등록된 알람이 없습니다.")
+            return
+        
+        content = export_alarms(alarms, fmt)
+        filename = f"alarms_{ctx.guild.id}_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+        await ctx.send(f"[OK] 알람 {len(alarms)}개", file=discord.File(io.BytesIO(content), filename=filename))
+
+    @alarm.command(name="시트", help="구글 시트 동기화 상태")
+    async def sheet_status(self, ctx):
+        """구글 시트 동기화 대기열 상태"""
+        if not self.google_sheet:
+            await ctx.send("[WARNING] 구글 시트 연동이 비활성화되어 있습니다.")
+            return
+        
+        stats = self.sheet_sync.get_stats()
+        embed = discord.Embed(title="구글 시트 동기화", color=discord.Color.blue())
+        embed.add_field(name="대기 중", value=f"{stats['pending']}건", inline=True)
+        embed.add_field(name="반영", value=f"{stats['batches']}회 · {stats['rows_written']}건", inline=True)
+        embed.add_field(name="실패", value=f"{stats['errors']}회", inline=True)
+        if stats['retry_in']:
+            embed.add_field(name="재시도", value=f"{stats['retry_in']}초 후", inline=False)
+        if stats['last_error']:
+            embed.add_field(name="마지막 오류", value=stats['last_error'][:200], inline=False)
+        await ctx.send(embed=embed)
+
+    @alarm.command(name="지연", help="알람 발동 지연 통계")
+    async def latency_status(self, ctx):
+        """예정 시각 대비 발동 지연, 메시지 전송·음성 시작 지연 백분위"""
+        labels = {
+            'fire_delay': "발동 지연 (예정 시각 → 실행)",
+            'send': "메시지 전송",
+            'voice_start': "음성 시작 (발동 → 재생)"
+        }
+        embed = discord.Embed(title="[TIME] 알람 지연 통계", color=discord.Color.blue())
+        summaries = self.latency.summary()
+        for metric, label in labels.items():
+            summary = summaries.get(metric)
+            value = (
+                f"p50 {summary['p50']}ms · p90 {summary['p90']}ms · p99 {summary['p99']}ms\n"
+                f"최대 {summary['max']}ms · {summary['count']}건"
+            ) if summary else "기록 없음"
+            embed.add_field(name=label, value=value, inline=False)
+        stats = self.fire_stats
+        embed.add_field(
+            name="발동",
+            value=(
+                f"{stats['fired']}회 · 합쳐진 실행 {stats['coalesced']}회 · 놓침 {stats['missed']}회\n"
+                f"메시지 {stats['messages']}건 · 음성 연속 재생 {stats['voice_batches']}회"
+            ),
+            inline=False
+        )
+        embed.set_footer(text=f"놓친 알람 유예 시간: {ALARM_MISFIRE_GRACE}초")
+        await ctx.send(embed=embed)
+
+    @alarm.command(name="새로고침", help="알람 스케줄 새로고침")
+    async def refresh_alarms(self, ctx):
+        """알람 스케줄 업데이트"""
+        active_count = self.rebuild_jobs(ctx.guild.id)
         
         embed = discord.Embed(
             title="[OK] 알람 새로고침됨",
@@ -566,22 +879,10 @@ class Alarm(commands.Cog):
     @alarm.command(name="초기화", help="모든 알람 초기화 (관리자 전용)")
     @commands.has_permissions(administrator=True)
     async def reset_alarms(self, ctx):
-        """모든 알람 초기화"""
-        # 모든 스케줄러 작업 제거
-        self.scheduler.remove_all_jobs()
-        
-        # JSON 파일 초기화
-        self.save_alarms({})
-        
-        # 구글 시트 초기화
-        if self.google_sheet:
-            try:
-                # 헤더 제외 모든 행 삭제
-                if self.google_sheet.row_count > 1:
-                    self.google_sheet.delete_rows(2, self.google_sheet.row_count)
-                print("[OK] 구글 시트 초기화됨")
-            except Exception as e:
-                print(f"[WARNING] 구글 시트 초기화 실패: {e}")
+        """이 서버의 모든 알람 초기화 (다른 서버의 알람은 유지)"""
+        for name in self.store.clear(ctx.guild.id):
+            self.forget_alarm(ctx.guild.id, name)
+            self.delete_from_google_sheet(ctx.guild.id, name)
         
         embed = discord.Embed(
             title="[DELETE] 알람 초기화 완료",
@@ -590,59 +891,103 @@ class Alarm(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-    async def trigger_alarm(self, channel_id, name, is_once=False, voice_enabled=False):
-        """알람 발동"""
+    def resolve_alarm_channel(self, guild_id, channel_id):
+        """알람을 보낼 텍스트 채널 (지정 채널 → 길드 기본 채널)"""
         channel = None
         
         # channel_id가 정수면 해당 채널 가져오기
         if isinstance(channel_id, int):
             channel = self.bot.get_channel(channel_id)
         
-        # channel이 None이면 설정된 채널이나 첫 번째 텍스트 채널 사용
-        if channel is None:
-            settings = self.load_alarm_settings()
-            fallback_channel_id = settings.get("alarm_channel_id", 0)
-            
+        # channel이 None이면 알람이 속한 길드의 기본 채널 (캐시)
+        if channel is None and guild_id != LEGACY_GUILD:
+            guild = self.bot.get_guild(guild_id)
+            channel = self.default_channel(guild) if guild else None
+        
+        # 길드 구분 이전 알람은 설정된 채널, 없으면 첫 번째 길드의 기본 채널
+        if channel is None and guild_id == LEGACY_GUILD:
+            fallback_channel_id = self.load_alarm_settings().get("alarm_channel_id", 0)
             if fallback_channel_id > 0:
                 channel = self.bot.get_channel(fallback_channel_id)
+            if channel is None and self.bot.guilds:
+                channel = self.default_channel(self.bot.guilds[0])
+        return channel
+    
+    async def trigger_alarms(self, due, scheduled=None):
+        """같은 시각에 울리는 알람 발동
+
+        채널마다 메시지 한 번, 길드마다 음성 연결 한 번으로 묶어서 보낸다
+        (API 호출과 429 응답을 줄임).
+        due: [((guild_id, 이름), 데이터)], scheduled: 예정 발동 시각 (지연 측정용)
+        """
+        started = time_module.monotonic()
+        if scheduled is not None:
+            delay_ms = (self.now() - scheduled).total_seconds() * 1000
+            for _ in due:
+                self.latency.record('fire_delay', delay_ms)
+            if delay_ms > 60_000:
+                print(f"[WARNING] 알람 {len(due)}개 늦게 발동: {delay_ms / 1000:.0f}초 지연")
+        self.fire_stats['fired'] += len(due)
         
-        # 여전히 None이면 첫 번째 길드의 첫 번째 텍스트 채널 사용
-        if channel is None:
-            for guild in self.bot.guilds:
-                for ch in guild.text_channels:
-                    if ch.permissions_for(guild.me).send_messages:
-                        channel = ch
-                        break
-                if channel:
-                    break
-        
-        # 텍스트 채널에 알람 메시지 전송
-        if channel:
-            with suppress(Exception):
-                await channel.send(f"[ALARM] 알람: {name}\n시간이 되었습니다!")
-        
-        # 음성 안내 활성화 시
-        if voice_enabled and channel:
-            guild = channel.guild
-            print(f"[SPEAKER] 음성 알람 준비 중: {name} (길드: {guild.name})")
-            try:
-                await self.play_voice_alarm(guild, name)
-            except Exception as e:
-                print(f"[ERROR] 음성 알람 재생 실패: {e}")
-                import traceback
-                traceback.print_exc()
+        # 채널별로 묶기 (시각표 칸은 set이므로 길드·이름 순으로 정렬해 메시지·음성 순서 고정)
+        due = sorted(due, key=lambda item: item[0])
+        by_channel = {}  # 채널 ID -> (채널, [((guild_id, 이름), 데이터)])
+        for key, data in due:
+            channel = self.resolve_alarm_channel(key[0], data.get('channel_id'))
+            if channel is None:
+                print(f"[WARNING] 알람 '{key[1]}'을(를) 보낼 채널이 없음")
+                continue
+            by_channel.setdefault(channel.id, (channel, []))[1].append((key, data))
+        
+        # 음성 안내는 길드별로 묶기 (한 연결에서 이어서 재생)
+        by_guild = {}  # guild_id -> (길드, [이름])
+        for channel, items in by_channel.values():
+            for (_, name), data in items:
+                if data.get('voice', False):
+                    names = by_guild.setdefault(channel.guild.id, (channel.guild, []))[1]
+                    if name not in names:
+                        names.append(name)
+        
+        await asyncio.gather(
+            *(self.send_alarm_message(channel, items) for channel, items in by_channel.values()),
+            *(self.play_voice_alarms(guild, names, started) for guild, names in by_guild.values())
+        )
         
         # 1회성 알람이면 자동 삭제
-        if is_once:
-            alarms = self.get_alarms()
-            if name in alarms:
-                del alarms[name]
-                self.save_alarms(alarms)
-                
-                # 스케줄러에서 제거
-                job_id = f"alarm_{name}"
-                if self.scheduler.get_job(job_id):
-                    self.scheduler.remove_job(job_id)
+        for (guild_id, name), data in due:
+            if data.get('repeat') == 'once' and self.store.delete(guild_id, name):
+                # 시각표·음성 파일에서 제거
+                self.forget_alarm(guild_id, name)
+    
+    @staticmethod
+    def alarm_notice(data):
+        offset = data.get('offset', 0)
+        return f"{-offset}분 뒤 시작합니다!" if offset < 0 else "시간이 되었습니다!"
+    
+    async def send_alarm_message(self, channel, items):
+        """한 채널의 알람을 메시지 하나로 전송 (2000자를 넘으면 나눠서)"""
+        if len(items) == 1:
+            (_, name), data = items[0]
+            contents = [f"[ALARM] 알람: {name}\n{self.alarm_notice(data)}"]
+        else:
+            contents = []
+            current = f"[ALARM] 알람 {len(items)}개"
+            for (_, name), data in items:
+                line = f"\n- **{name}**: {self.alarm_notice(data)}"
+                if len(current) + len(line) > 1900:
+                    contents.append(current)
+                    current = "[ALARM] (이어서)"
+                current += line
+            contents.append(current)
+        
+        for content in contents:
+            try:
+                send_started = time_module.monotonic()
+                await channel.send(content)
+                self.latency.record('send', (time_module.monotonic() - send_started) * 1000)
+                self.fire_stats['messages'] += 1
+            except Exception as e:
+                print(f"[ERROR] 알람 메시지 전송 실패 (#{channel}): {e}")
     
     def load_alarm_settings(self):
         """알람 설정 로드"""
@@ -653,22 +998,35 @@ class Alarm(commands.Cog):
                     return json.load(f)
         return {}
     
-    def generate_voice_file(self, alarm_name):
-        """TTS로 음성 파일 생성"""
+    def voice_file_path(self, guild_id, alarm_name, ext):
+        """알람 음성 파일 경로
+
+        (길드, 이름)의 해시를 파일 이름으로 사용 (특수문자만 다른 이름끼리 겹치거나
+        빈 파일 이름이 되지 않도록)
+        """
+        digest = hashlib.sha1(f"{guild_id}:{alarm_name}".encode('utf-8')).hexdigest()[:20]
+        return f"data/voice_alarms/{digest}.{ext}"
+    
+    def generate_voice_file(self, guild_id, alarm_name):
+        """TTS로 음성 파일 생성 (이미 만들어 둔 파일이 있으면 재사용)"""
         try:
             # 음성 파일 저장 디렉토리 생성
             os.makedirs("data/voice_alarms", exist_ok=True)
             
-            # 음성 파일 경로 (특수문자 제거)
-            safe_name = "".join(c for c in alarm_name if c.isalnum() or c in ('_', '-'))
-            voice_file = f"data/voice_alarms/{safe_name}.mp3"
+            backend = get_backend()
+            voice_file = self.voice_file_path(guild_id, alarm_name, backend.ext)
+            if os.path.exists(voice_file) and os.path.getsize(voice_file) > 0:
+                ensure_opus(voice_file, resolve_ffmpeg())
+                return voice_file
             
             print(f"[MUSIC] 음성 파일 생성 중: {voice_file}")
             
-            # gTTS로 음성 파일 생성 (한국어)
+            # 설정된 TTS 엔진으로 음성 파일 생성 (한국어, 실패 시 gTTS)
             text = f"{alarm_name} 알람입니다"
-            tts = gTTS(text=text, lang='ko', slow=False)
-            tts.save(voice_file)
+            voice_file, _ = synthesize_to_file(text, voice_file, 'ko', 1.0, backend)
+            
+            # 재생 시 ffmpeg 없이 보낼 수 있도록 Opus로 미리 인코딩
+            ensure_opus(voice_file, resolve_ffmpeg())
             
             print(f"[OK] 음성 파일 생성 완료: {voice_file}")
             return voice_file
@@ -678,99 +1036,82 @@ class Alarm(commands.Cog):
             traceback.print_exc()
             return None
     
-    async def play_voice_alarm(self, guild, alarm_name):
-        """음성 채널에서 알람 음성 재생"""
+    def prerender_voice_clip(self, guild_id, alarm_name):
+        """알람 음성을 백그라운드에서 미리 합성 (발동 시에는 재생만 하도록)"""
+        task = self.voice_clips.get((guild_id, alarm_name))
+        if task and not task.done():
+            return task
+        if task and not task.cancelled() and task.result() and os.path.exists(task.result()):
+            return task
         try:
-            print(f"[SPEAKER] 음성 알람 시작: {alarm_name}")
-            
-            # 봇이 연결된 음성 채널 찾기
-            voice_client = None
-            for vc in self.bot.voice_clients:
-                if vc.guild == guild:
-                    voice_client = vc
-                    print(f"[OK] 기존 음성 채널 발견: {vc.channel}")
-                    break
-            
-            # 음성 채널이 없으면 첫 번째 사람이 있는 음성 채널 찾기
-            if voice_client is None:
-                target_channel = None
-                for channel in guild.voice_channels:
-                    if len(channel.members) > 0:
-                        target_channel = channel
-                        print(f"[VOICE_CALL] 대상 음성 채널 발견: {channel.name} (멤버: {len(channel.members)}명)")
-                        break
-                
-                if target_channel:
-                    try:
-                        voice_client = await target_channel.connect()
-                        print(f"[OK] 음성 채널 연결됨: {target_channel.name}")
-                    except Exception as e:
-                        print(f"[ERROR] 음성 채널 연결 실패: {e}")
-                        return
-                else:
-                    print(f"[WARNING] 음성 채널에 사람이 없음")
-                    return
-            
-            # 음성 파일 생성
-            voice_file = self.generate_voice_file(alarm_name)
-            print(f"[MUSIC] 음성 파일: {voice_file}")
+            task = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(self.generate_voice_file, guild_id, alarm_name)
+            )
+        except RuntimeError:
+            return None  # 이벤트 루프 밖에서는 발동 시 합성
+        self.voice_clips[(guild_id, alarm_name)] = task
+        return task
+    
+    def remove_voice_clip(self, guild_id, alarm_name):
+        """삭제된 알람의 음성 파일 정리 (확장자만 다른 Opus 변환본 포함)"""
+        task = self.voice_clips.pop((guild_id, alarm_name), None)
+        if task and not task.done():
+            task.cancel()
+        base = os.path.splitext(self.voice_file_path(guild_id, alarm_name, "mp3"))[0]
+        for path in glob.glob(f"{glob.escape(base)}.*"):
+            with suppress(OSError):
+                os.remove(path)
+    
+    async def voice_clip(self, guild_id, alarm_name):
+        """알람 음성 파일 (미리 합성 중이면 기다리고, 없으면 지금 합성)"""
+        task = self.prerender_voice_clip(guild_id, alarm_name)
+        if task is not None:
+            return await asyncio.shield(task)
+        return await asyncio.to_thread(self.generate_voice_file, guild_id, alarm_name)
+    
+    async def play_voice_alarms(self, guild, alarm_names, started):
+        """음성 채널에서 길드의 알람 음성을 이어서 재생
+
+        음성 파일은 알람 등록/로드 시 미리 만들어 두므로 보통은 재생만 한다.
+        음성 연결은 TTS와 공유하는 연결 관리자에서 재사용하며,
+        여러 개는 한 번 연결한 채로 이어서 재생하고 유휴 시간이 지나면 자동으로 해제된다.
+        """
+        try:
+            print(f"[SPEAKER] 음성 알람 {len(alarm_names)}개 준비 중 (길드: {guild.name})")
             
-            if not voice_file:
-                print(f"[ERROR] 음성 파일 생성 실패")
+            voice_files = []
+            for alarm_name, voice_file in zip(alarm_names, await asyncio.gather(
+                *(self.voice_clip(guild.id, alarm_name) for alarm_name in alarm_names)
+            )):
+                if not voice_file or not os.path.exists(voice_file):
+                    print(f"[ERROR] 음성 파일 생성 실패: {alarm_name}")
+                    continue
+                voice_files.append(voice_file)
+            if not voice_files:
                 return
             
-            if not os.path.exists(voice_file):
-                print(f"[ERROR] 음성 파일이 존재하지 않음: {voice_file}")
-                return
+            # 발동부터 첫 음성이 나오기까지만 측정 (뒤 파일은 앞 파일 재생 시간만큼 늦게 시작)
+            first_started = False
             
-            if voice_client and not voice_client.is_playing():
-                try:
-                    print(f"[SPEAKER] 음성 재생 시작...")
-                    # ffmpeg 경로 지정
-                    ffmpeg_path = "F:/A/ffmpeg/ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe"
-                    if not os.path.exists(ffmpeg_path):
-                        ffmpeg_path = "ffmpeg"  # 시스템 PATH에서 찾기
-                    
-                    # ffmpeg를 사용하여 음성 재생
-                    audio_source = discord.FFmpegPCMAudio(voice_file, executable=ffmpeg_path)
-                    voice_client.play(
-                        audio_source,
-                        after=lambda e: self._voice_callback(alarm_name, e)
-                    )
-                    
-                    # 재생 완료 대기
-                    max_wait = 30  # 최대 30초 대기
-                    waited = 0
-                    while voice_client.is_playing() and waited < max_wait:
-                        await asyncio.sleep(0.5)
-                        waited += 0.5
-                    
-                    print(f"[OK] 음성 재생 완료: {alarm_name}")
-                    
-                    # 재생 후 자동으로 연결 해제
-                    await asyncio.sleep(1)
-                    if voice_client and voice_client.is_connected():
-                        await voice_client.disconnect()
-                        print(f"[OK] 음성 채널 연결 해제됨")
-                
-                except Exception as e:
-                    print(f"[ERROR] 음성 재생 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
+            def record_first_start(_):
+                nonlocal first_started
+                if not first_started:
+                    first_started = True
+                    self.latency.record('voice_start', (time_module.monotonic() - started) * 1000)
+            
+            played = await self.voice.play_files(
+                guild, voice_files, label="알람", on_start=record_first_start
+            )
+            self.fire_stats['voice_batches'] += 1
+            if played:
+                print(f"[OK] 음성 알람 {played}/{len(voice_files)}개 재생 완료")
             else:
-                print(f"[WARNING] 음성 클라이언트 없음 또는 이미 재생 중")
+                print(f"[WARNING] 음성 알람 재생 불가 (음성 채널에 사람이 없거나 연결 실패)")
         
         except Exception as e:
-            print(f"[ERROR] 음성 채널 접근 실패: {e}")
+            print(f"[ERROR] 음성 알람 재생 실패: {e}")
             import traceback
             traceback.print_exc()
-    
-    def _voice_callback(self, alarm_name, error):
-        """음성 재생 콜백"""
-        if error is None:
-            print(f"[OK] 음성 알람 '{alarm_name}' 재생 완료")
-        else:
-            print(f"[ERROR] 음성 재생 오류 '{alarm_name}': {error}")
 
 async def setup(bot):
     await bot.add_cog(Alarm(bot))
@@ -2,13 +2,16 @@
 import discord
 from discord.ext import commands, tasks
 from discord.ui import Modal, TextInput, View, Button
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment
+import asyncio
 import json
-import os
 import datetime as dt
 from datetime import datetime, timedelta
 from contextlib import suppress
+from config import CHANNEL_RENAME_SPACING, DDAY_REFRESH_CONCURRENCY
+from core.channel_renamer import ChannelRenameScheduler
+from core.dday_store import LEGACY_GUILD, calculate_dday, get_dday_repository
+
+CATEGORY_NAME = "📅 D-DAY"
 
 # D-Day 추가 모달
 class DDayModal(Modal, title="D-Day 추가"):
@@ -48,23 +51,8 @@ class DDayModal(Modal, title="D-Day 추가"):
             # 날짜 형식 검증
             target_date = datetime.strptime(self.date.value, "%Y-%m-%d")
             
-            # 엑셀에 데이터 추가
-            wb = openpyxl.load_workbook(self.cog.excel_file)
-            ws = wb.active
-            
-            row = ws.max_row + 1
-            ws[f"A{row}"] = self.name.value
-            ws[f"B{row}"] = target_date.date()
-            ws[f"C{row}"] = self.cog.calculate_dday(target_date)
-            ws[f"D{row}"] = datetime.now().date()
-            ws[f"E{row}"] = f"활성 - {self.message.value}" if self.message.value else "활성"
-            
-            # 셀 스타일
-            for col in range(1, 6):
-                cell = ws.cell(row=row, column=col)
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            wb.save(self.cog.excel_file)
+            # 메모리에 추가 (엑셀 파일은 백그라운드에서 저장)
+            self.cog.repository.add(interaction.guild.id, self.name.value, target_date, self.message.value)
             
             dday_count = self.cog.calculate_dday(target_date)
             
@@ -85,7 +73,7 @@ class DDayModal(Modal, title="D-Day 추가"):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
             # 채널 업데이트
-            await self.cog.refresh_all_dday_channels()
+            await self.cog.refresh_guild_channels(interaction.guild)
         except ValueError:
             embed = discord.Embed(
                 title="❌ 오류",
@@ -119,22 +107,17 @@ class DDayView(View):
     async def list_button(self, interaction: discord.Interaction, button: Button):
         """목록 보기 버튼"""
         try:
-            wb = openpyxl.load_workbook(self.cog.excel_file)
-            ws = wb.active
-            
-            if ws.max_row <= 1:
+            entries = self.cog.repository.all(interaction.guild.id)
+            if not entries:
                 await interaction.response.send_message("등록된 D-Day가 없습니다.", ephemeral=True)
                 return
             
             embed = discord.Embed(title="📅 D-Day 목록", color=discord.Color.blue())
             
-            for row in range(2, ws.max_row + 1):
-                if not (name := ws[f"A{row}"].value):
-                    continue
-
-                date = ws[f"B{row}"].value or ""
-                dday = ws[f"C{row}"].value
-                status = ws[f"E{row}"].value or ""
+            for entry in entries:
+                name = entry['name']
+                date = entry['date'].strftime("%Y-%m-%d")
+                dday = calculate_dday(entry['date'])
 
                 if dday < 0:
                     text = f"📍 {dday}일 (경과)"
@@ -143,7 +126,7 @@ class DDayView(View):
                 else:
                     text = f"⏳ D+{dday}일"
 
-                message = status.split(" - ", 1)[1] if " - " in status else ""
+                message = entry['message']
                 value = f"{text}\n목표: {date}"
                 if message:
                     value += f"\n💬 {message}"
@@ -158,16 +141,8 @@ class DDayView(View):
     async def refresh_button(self, interaction: discord.Interaction, button: Button):
         """새로고침 버튼"""
         try:
-            wb = openpyxl.load_workbook(self.cog.excel_file)
-            ws = wb.active
-            
-            for row in range(2, ws.max_row + 1):
-                if date_cell := ws[f"B{row}"].value:
-                    if isinstance(date_cell, str):
-                        date_cell = datetime.strptime(date_cell, "%Y-%m-%d")
-                    ws[f"C{row}"] = self.cog.calculate_dday(date_cell)
-            
-            wb.save(self.cog.excel_file)
+            # 엑셀의 D-Day 열을 오늘 기준으로 다시 저장 (백그라운드)
+            self.cog.repository.touch()
             
             embed = discord.Embed(
                 title="✅ D-Day가 새로고침되었습니다",
@@ -208,22 +183,26 @@ class DDayView(View):
             await interaction.response.send_message("❌ 채널 새로고침은 관리자만 사용할 수 있습니다.", ephemeral=True)
             return
         await interaction.response.defer(ephemeral=True, thinking=True)
-        await self.cog.refresh_all_dday_channels()
-        await interaction.followup.send("✅ D-Day 채널이 새로고침되었습니다.", ephemeral=True)
+        queued = await self.cog.refresh_guild_channels(interaction.guild)
+        await interaction.followup.send(f"✅ D-Day 채널 새로고침: {self.cog.rename_status_text(queued)}", ephemeral=True)
 
 class DDayManager(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.excel_file = "data/dday.xlsx"
         self.settings_file = "data/settings.json"
-        self.dday_channels = {}  # 각 D-day별 채널 저장
-        self.dday_category = None  # D-Day 카테고리
-        self.ensure_excel()
+        # 메모리 D-Day 목록·채널 매핑 (길드별, 서버 통계와 공유, 재시작 후에도 유지)
+        self.repository = get_dday_repository(bot)
+        self.categories = {}  # guild_id -> D-Day 카테고리 ID (새로고침마다 카테고리 목록을 뒤지지 않도록)
+        # 채널 이름 변경은 한도(채널당 10분 2회)에 맞춰 나눠서 반영
+        self.renamer = ChannelRenameScheduler(spacing=CHANNEL_RENAME_SPACING)
+        self.renamer.start()
         self.update_dday_channels.start()  # 매일 자정 업데이트 시작
 
-    def cog_unload(self):
-        """Cog 언로드 시 작업 중지"""
+    async def cog_unload(self):
+        """Cog 언로드 시 작업 중지 (남은 변경은 파일에 저장)"""
         self.update_dday_channels.cancel()
+        await self.renamer.stop()
+        await self.repository.flush()
 
     @tasks.loop(time=dt.time(hour=0, minute=0))
     async def update_dday_channels(self):
@@ -234,129 +213,149 @@ class DDayManager(commands.Cog):
     async def before_update(self):
         """봇이 준비될 때까지 대기"""
         await self.bot.wait_until_ready()
+        self.adopt_legacy_ddays()
         # 첫 실행 시 즉시 업데이트
         await self.refresh_all_dday_channels()
+
+    def adopt_legacy_ddays(self):
+        """길드 구분 이전 D-Day를 길드로 옮기기
+
+        D-Day 카테고리가 있는 서버가 하나뿐이면 그 서버로, 없으면 봇이 한 서버에만
+        있을 때 그 서버로 옮긴다. 옮길 수 없으면 그대로 두고 경고만 남긴다.
+        """
+        legacy = self.repository.all(LEGACY_GUILD)
+        if not legacy:
+            return
+
+        candidates = [guild for guild in self.bot.guilds if self.dday_category(guild)]
+        if len(candidates) != 1:
+            candidates = list(self.bot.guilds)
+        if len(candidates) != 1:
+            print(f"[WARNING] 길드를 알 수 없는 D-Day {len(legacy)}개 (서버가 여러 개라 옮기지 않음)")
+            return
+
+        guild = candidates[0]
+        moved = sum(self.repository.move(entry['name'], LEGACY_GUILD, guild.id) for entry in legacy)
+        print(f"[OK] 이전 D-Day {moved}개를 '{guild.name}' 서버로 옮김")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """D-Day 채널이 지워지면 매핑도 삭제 (다음 새로고침에서 다시 생성)"""
+        if self.categories.get(channel.guild.id) == channel.id:
+            del self.categories[channel.guild.id]
+        for entry in self.repository.all(channel.guild.id):
+            if self.repository.channel_id(channel.guild.id, entry['name']) == channel.id:
+                self.repository.remove_channel(channel.guild.id, entry['name'])
+                self.renamer.forget(channel.id)
+
+    def dday_category(self, guild):
+        """서버의 D-Day 카테고리 (없으면 None, 찾은 카테고리 ID는 길드별로 기억)"""
+        category_id = self.categories.get(guild.id)
+        if category_id is not None:
+            category = guild.get_channel(category_id)
+            if category is not None and category.name == CATEGORY_NAME:
+                return category
+        category = discord.utils.get(guild.categories, name=CATEGORY_NAME)
+        if category is None:
+            self.categories.pop(guild.id, None)
+        else:
+            self.categories[guild.id] = category.id
+        return category
+
+    def dday_channel(self, guild, name):
+        """저장된 매핑으로 D-Day 채널 찾기 (채널이 없어졌으면 매핑 삭제)"""
+        channel_id = self.repository.channel_id(guild.id, name)
+        if channel_id is None:
+            return None
+        channel = guild.get_channel(channel_id)
+        if channel is None:
+            self.repository.remove_channel(guild.id, name)
+        return channel
     
     async def create_dday_channels(self, guild):
         """D-Day 카테고리 및 채널 생성"""
         # D-Day 카테고리 찾기 또는 생성
-        self.dday_category = discord.utils.get(guild.categories, name="📅 D-DAY")
-        if not self.dday_category:
-            self.dday_category = await guild.create_category("📅 D-DAY")
-        
-        # D-Day 목록 가져오기
-        wb = openpyxl.load_workbook(self.excel_file)
-        ws = wb.active
+        category = self.dday_category(guild)
+        if category is None:
+            category = await guild.create_category(CATEGORY_NAME)
+            self.categories[guild.id] = category.id
         
-        for row in range(2, ws.max_row + 1):
-            name = ws[f"A{row}"].value
-            if name and name not in self.dday_channels:
-                # 음성 채널 생성 (이름 표시용)
-                channel = await guild.create_voice_channel(
-                    name="🔄 계산중...",
-                    category=self.dday_category,
-                    user_limit=0  # 입장 불가
-                )
-                self.dday_channels[name] = channel
-        
-        # 즉시 업데이트
-        await self.refresh_all_dday_channels()
+        # 없는 채널은 새로고침에서 바로 최종 이름으로 생성
+        await self.refresh_guild_channels(guild, category)
     
-    async def refresh_all_dday_channels(self):
-        """모든 D-Day 채널 업데이트"""
-        try:
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-
-            entries = []  # (name, dday_value)
-
-            # D-Day 값 계산 및 저장
-            for row in range(2, ws.max_row + 1):
-                if not (name := ws[f"A{row}"].value):
+    async def refresh_guild_channels(self, guild, category=None) -> int:
+        """한 서버의 D-Day 채널 업데이트 (새로 예약한 이름 변경 수 반환)"""
+        category = category or self.dday_category(guild)
+        queued = 0
+        for entry in self.repository.all(guild.id):
+            name = entry['name']
+            channel_name = self.dday_channel_name(name, self.calculate_dday(entry['date']))
+            channel = self.dday_channel(guild, name)
+            if channel is None:
+                if category is None:
                     continue
-
-                dday_value = None
-                if date_cell := ws[f"B{row}"].value:
-                    if isinstance(date_cell, str):
-                        date_cell = datetime.strptime(date_cell, "%Y-%m-%d")
-                    dday_value = self.calculate_dday(date_cell)
-                    ws[f"C{row}"] = dday_value
-
-                entries.append((name, dday_value))
-
-            wb.save(self.excel_file)
-
-            # 길드(서버) 정보 가져오기
-            guild = None
-            if self.dday_category and self.dday_category.guild:
-                guild = self.dday_category.guild
-            elif self.dday_channels:
-                first_channel = next(iter(self.dday_channels.values()), None)
-                if first_channel:
-                    guild = first_channel.guild
-            
-            # 길드가 없으면 봇이 속한 첫 번째 길드 사용
-            if not guild and self.bot.guilds:
-                guild = self.bot.guilds[0]
-                # 카테고리 찾기
-                self.dday_category = discord.utils.get(guild.categories, name="📅 D-DAY")
-
-            for name, dday_value in entries:
-                # 채널 확보
-                channel = self.dday_channels.get(name)
-                if not channel and guild and self.dday_category:
-                    with suppress(Exception):
-                        channel = await guild.create_voice_channel(
-                            name="🔄 계산중...",
-                            category=self.dday_category,
-                            user_limit=0
-                        )
-                        self.dday_channels[name] = channel
-
-                if channel and dday_value is not None:
-                    if dday_value < 0:
-                        channel_name = f"✅ {name}: D{dday_value}"
-                    elif dday_value == 0:
-                        channel_name = f"🎉 {name}: D-DAY!"
-                    else:
-                        channel_name = f"📅 {name}: D-{dday_value}"
-
-                    with suppress(Exception):
-                        await channel.edit(name=channel_name)
-                        print(f"D-Day 채널 업데이트 성공: {channel_name}")
-
-        except Exception as e:
-            print(f"D-Day 채널 업데이트 오류: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def ensure_excel(self):
-        """엑셀 파일 초기화"""
-        os.makedirs(os.path.dirname(self.excel_file), exist_ok=True)
-        
-        if not os.path.exists(self.excel_file):
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "D-Day"
-            
-            # 헤더 설정
-            headers = ["이름", "목표날짜", "D-Day", "생성일", "상태"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col)
-                cell.value = header
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            wb.save(self.excel_file)
+                # 음성 채널 생성 (이름 표시용) - 처음부터 최종 이름이라 이름 변경 불필요
+                with suppress(discord.HTTPException):
+                    channel = await guild.create_voice_channel(
+                        name=channel_name,
+                        category=category,
+                        user_limit=0  # 입장 불가
+                    )
+                    self.repository.set_channel(guild.id, name, channel.id)
+                continue
+
+            # 이름이 바뀌는 채널만 변경 예약
+            if self.renamer.request(channel, channel_name):
+                queued += 1
+        return queued
+
+    async def refresh_all_dday_channels(self) -> int:
+        """모든 서버의 D-Day 채널 업데이트 (서버별 동시 실행, 동시 실행 수 제한)"""
+        # 엑셀 D-Day 열은 백그라운드에서 다시 저장
+        self.repository.touch()
+        guilds = [
+            guild for guild_id in self.repository.guilds()
+            if (guild := self.bot.get_guild(guild_id)) is not None
+        ]
+        semaphore = asyncio.Semaphore(DDAY_REFRESH_CONCURRENCY)
+
+        async def refresh(guild):
+            async with semaphore:
+                return await self.refresh_guild_channels(guild)
+
+        queued = 0
+        results = await asyncio.gather(*(refresh(guild) for guild in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                print(f"D-Day 채널 업데이트 오류 ({guild.name}): {result}")
+            else:
+                queued += result
+        return queued
+
+    @staticmethod
+    def dday_channel_name(name: str, dday_value: int) -> str:
+        """D-Day 채널에 표시할 이름"""
+        if dday_value < 0:
+            return f"✅ {name}: D{dday_value}"
+        if dday_value == 0:
+            return f"🎉 {name}: D-DAY!"
+        return f"📅 {name}: D-{dday_value}"
+
+    def rename_status_text(self, queued: int) -> str:
+        """이름 변경 예약 결과 문구"""
+        if not self.renamer.pending:
+            return "변경할 채널 이름이 없습니다." if not queued else "모든 채널 이름이 반영되었습니다."
+        return f"{len(self.renamer.pending)}개 채널 이름 변경 대기 중 (`!디데이 이름대기`로 확인)"
 
     @commands.group(name="디데이", help="D-Day 관리")
+    @commands.guild_only()
     async def dday(self, ctx):
         if ctx.invoked_subcommand is None:
             embed = discord.Embed(title="📅 D-Day 도움말", color=discord.Color.blue())
             embed.add_field(name="UI 관리", value="`!디데이 ui` - 버튼식 UI 사용", inline=False)
             embed.add_field(name="채널 생성", value="`!디데이 채널생성` - D-Day 채널 카테고리 생성", inline=False)
             embed.add_field(name="채널 업데이트", value="`!디데이 채널업데이트` - D-Day 채널 정보 갱신", inline=False)
+            embed.add_field(name="이름 변경 대기", value="`!디데이 이름대기` - 예약된 채널 이름 변경 보기", inline=False)
             embed.add_field(name="추가", value="`!디데이 추가 <이름> <날짜(YYYY-MM-DD)>`", inline=False)
             embed.add_field(name="삭제", value="`!디데이 삭제 <이름>`", inline=False)
             embed.add_field(name="목록", value="`!디데이 목록`", inline=False)
@@ -376,8 +375,36 @@ class DDayManager(commands.Cog):
     async def update_channels(self, ctx):
         """D-Day 채널 정보 갱신"""
         await ctx.send("🔄 D-Day 채널을 업데이트하는 중...")
-        await self.refresh_all_dday_channels()
-        await ctx.send("✅ D-Day 채널이 업데이트되었습니다!")
+        queued = await self.refresh_guild_channels(ctx.guild)
+        await ctx.send(f"✅ D-Day 채널 업데이트: {self.rename_status_text(queued)}")
+
+    @dday.command(name="이름대기", help="예약된 D-Day 채널 이름 변경 보기")
+    async def pending_renames(self, ctx):
+        """한도 때문에 대기 중인 채널 이름 변경"""
+        renames = self.renamer.pending_renames()
+        stats = self.renamer.stats
+        embed = discord.Embed(
+            title="🏷️ 채널 이름 변경 대기",
+            description="디스코드는 채널마다 10분에 2번만 이름을 바꿀 수 있어 나눠서 반영합니다.",
+            color=discord.Color.blue() if renames else discord.Color.green()
+        )
+        for item in renames[:20]:
+            wait = int(item['wait'])
+            eta = f"약 {wait // 60}분 {wait % 60}초 후" if wait else "곧"
+            embed.add_field(
+                name=item['name'],
+                value=f"현재: {item['current']}\n{eta}",
+                inline=False
+            )
+        if len(renames) > 20:
+            embed.add_field(name="...", value=f"외 {len(renames) - 20}개", inline=False)
+        if not renames:
+            embed.add_field(name="대기 없음", value="모든 채널 이름이 최신입니다.", inline=False)
+        embed.set_footer(
+            text=f"변경 {stats['renamed']}회 · 변경 불필요 {stats['unchanged']}회 · "
+                 f"합쳐진 요청 {stats['coalesced']}회 · 실패 {stats['errors']}회"
+        )
+        await ctx.send(embed=embed)
 
     @dday.command(name="ui", help="D-Day UI 버튼 표시")
     @commands.has_permissions(administrator=True)
@@ -411,24 +438,7 @@ class DDayManager(commands.Cog):
         """D-Day 추가"""
         try:
             target_date = datetime.strptime(date, "%Y-%m-%d")
-            
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-            
-            # 새로운 행 추가
-            row = ws.max_row + 1
-            ws[f"A{row}"] = name
-            ws[f"B{row}"] = target_date.date()
-            ws[f"C{row}"] = self.calculate_dday(target_date)
-            ws[f"D{row}"] = datetime.now().date()
-            ws[f"E{row}"] = "활성"
-            
-            # 셀 스타일 설정
-            for col in range(1, 6):
-                cell = ws.cell(row=row, column=col)
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            wb.save(self.excel_file)
+            self.repository.add(ctx.guild.id, name, target_date)
             
             dday_count = self.calculate_dday(target_date)
             dday_text = f"D{dday_count}" if dday_count < 0 else f"D+{dday_count}"
@@ -447,23 +457,13 @@ class DDayManager(commands.Cog):
     async def delete_dday(self, ctx, *, name: str):
         """D-Day 삭제"""
         try:
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-            
-            found = False
-            for row in range(2, ws.max_row + 1):
-                if ws[f"A{row}"].value == name:
-                    ws.delete_rows(row)
-                    found = True
-                    break
-            
-            if found:
-                wb.save(self.excel_file)
+            channel = self.dday_channel(ctx.guild, name)
+            if self.repository.delete(ctx.guild.id, name):
                 # 채널도 삭제
-                if name in self.dday_channels:
+                if channel:
+                    self.renamer.forget(channel.id)
                     try:
-                        await self.dday_channels[name].delete()
-                        del self.dday_channels[name]
+                        await channel.delete()
                     except Exception as e:
                         print(f"채널 삭제 오류: {e}")
                 await ctx.send(f"✅ **{name}** D-Day가 삭제되었습니다.")
@@ -476,21 +476,17 @@ class DDayManager(commands.Cog):
     async def list_dday(self, ctx):
         """D-Day 목록 표시"""
         try:
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-            
-            if ws.max_row <= 1:
+            entries = self.repository.all(ctx.guild.id)
+            if not entries:
                 await ctx.send("등록된 D-Day가 없습니다.")
                 return
             
             embed = discord.Embed(title="📅 D-Day 목록", color=discord.Color.blue())
             
-            for row in range(2, ws.max_row + 1):
-                if not (name := ws[f"A{row}"].value):
-                    continue
-
-                date = ws[f"B{row}"].value or ""
-                dday = ws[f"C{row}"].value
+            for entry in entries:
+                name = entry['name']
+                date = entry['date'].strftime("%Y-%m-%d")
+                dday = self.calculate_dday(entry['date'])
                 
                 if dday < 0:
                     text = f"📍 {dday}일 (경과)"
@@ -527,20 +523,15 @@ class DDayManager(commands.Cog):
                 return
         
         try:
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-            
             embed = discord.Embed(
                 title="📅 D-Day 공지",
                 description="현재 진행 중인 D-Day 목록입니다.",
                 color=discord.Color.gold()
             )
             
-            for row in range(2, ws.max_row + 1):
-                if not (name := ws[f"A{row}"].value):
-                    continue
-
-                dday = ws[f"C{row}"].value
+            for entry in self.repository.all(ctx.guild.id):
+                name = entry['name']
+                dday = self.calculate_dday(entry['date'])
                 
                 if dday < 0:
                     text = f"📍 {dday}일 (경과)"
@@ -560,26 +551,15 @@ class DDayManager(commands.Cog):
     async def refresh_dday(self, ctx):
         """D-Day 값 업데이트"""
         try:
-            wb = openpyxl.load_workbook(self.excel_file)
-            ws = wb.active
-            
-            for row in range(2, ws.max_row + 1):
-                if date_cell := ws[f"B{row}"].value:
-                    if isinstance(date_cell, str):
-                        date_cell = datetime.strptime(date_cell, "%Y-%m-%d")
-                    ws[f"C{row}"] = self.calculate_dday(date_cell)
-            
-            wb.save(self.excel_file)
+            # 엑셀의 D-Day 열을 오늘 기준으로 다시 저장 (백그라운드)
+            self.repository.touch()
             await ctx.send("✅ D-Day가 새로고침되었습니다.")
         except Exception as e:
             await ctx.send(f"❌ 오류: {e}")
 
     def calculate_dday(self, target_date) -> int:
         """D-Day 계산"""
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d")
-        
-        return (target_date - datetime.now()).days
+        return calculate_dday(target_date)
 
     def load_settings(self):
         """설정 로드"""
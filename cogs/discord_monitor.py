@@ -5,10 +5,19 @@
 
 import discord
 from discord.ext import commands, tasks
+import asyncio
 import json
 import re
-from datetime import datetime
-from typing import List, Dict
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List, Dict, Optional
+from config import MONITOR_QUEUE_SIZE, MONITOR_BATCH_SIZE, MONITOR_OVERFLOW_POLICY
+from core.data_analyzer import DataAnalyzer, StreamingAggregator
+from core.ingest_queue import IngestQueue
+
+SEEN_URL_LIMIT = 5000  # 중복 체크용으로 기억하는 최근 메시지 수
+BACKFILL_RETRY_PASSES = 3  # 큐에서 버려진 백필 메시지를 다시 읽는 최대 횟수
 
 class DiscordMonitor(commands.Cog):
     """디스코드 채널 모니터링"""
@@ -22,12 +31,53 @@ class DiscordMonitor(commands.Cog):
             "계산", "DPS", "크리티컬", "무기"
         ]
         self.collected_data = []
+        # 이미 수집한 메시지 (저장 주기와 무관하게 유지, 재시작 후에도 이어서 사용)
+        self.seen_file = "data/monitor_seen.json"
+        self.seen_urls: "OrderedDict[str, None]" = self.load_seen_urls()
+        self.pending_urls = set()  # 큐에 넣었지만 아직 집계하지 않은 메시지
+        self.stored_urls: List[str] = []  # 집계했지만 스케치를 아직 저장하지 않은 메시지
+        # 수집 메시지 증분 집계 (지표 조회 시 전체 재스캔 방지)
+        # 메시지 작성일별 스케치로 data/stats에 저장 (백필한 과거 메시지도 그날 구간에 반영)
+        self.analyzer = DataAnalyzer()
+        self.windows: Dict[date, StreamingAggregator] = {}  # 이번에 반영한 날짜별 구간
+        self.dirty_days = set()  # 저장이 필요한 날짜
+        # 리스너와 저장 작업을 분리하는 수집 큐
+        self.ingest = IngestQueue(
+            self.store_batch,
+            maxsize=MONITOR_QUEUE_SIZE,
+            batch_size=MONITOR_BATCH_SIZE,
+            overflow=MONITOR_OVERFLOW_POLICY,
+            spill_file="data/monitor_spill.jsonl",
+            on_drop=self.on_ingest_drop
+        )
+        # 전체 채널 백필 (체크포인트로 재시작 후 이어서 진행)
+        self.backfill_file = "data/backfill_checkpoints.json"
+        self.backfill_state = self.load_backfill_state()
+        self.backfill_task: Optional[asyncio.Task] = None
+        self.backfill_progress: Dict[int, Dict] = {}
+        # 체크포인트는 저장까지 끝난 메시지 기준으로만 전진
+        self.backfill_scanned: Dict[int, int] = {}  # 채널 ID -> 마지막으로 읽은 메시지 ID
+        self.backfill_inflight: Dict[str, tuple] = {}  # 메시지 주소 -> (채널 ID, 메시지 ID)
+        self.backfill_retry: Dict[int, int] = {}  # 채널 ID -> 큐에서 버려져 다시 읽을 가장 오래된 메시지 ID
+        self.backfill_started_at = None
         
         # 자동 모니터링 시작
         self.auto_monitor.start()
     
-    def cog_unload(self):
+    async def cog_load(self):
+        self.ingest.start()
+        # 중단된 백필이 있으면 봇 준비 후 이어서 진행
+        if self.backfill_state.get('active'):
+            asyncio.create_task(self._resume_backfill())
+    
+    async def cog_unload(self):
         self.auto_monitor.cancel()
+        if self.backfill_task and not self.backfill_task.done():
+            self.backfill_task.cancel()
+        await self.ingest.stop()
+        if self.collected_data:
+            await self.save_collected_data()
+        await self.save_engagement_sketch()
     
     def load_monitored_channels(self) -> List[int]:
         """모니터링할 채널 목록 로드"""
@@ -99,6 +149,32 @@ class DiscordMonitor(commands.Cog):
         embed.description = "\n".join(channels) if channels else "채널 없음"
         await ctx.send(embed=embed)
     
+    def load_seen_urls(self) -> "OrderedDict[str, None]":
+        """이미 수집한 메시지 주소 로드"""
+        try:
+            with open(self.seen_file, 'r', encoding='utf-8') as f:
+                urls = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            urls = []
+        return OrderedDict.fromkeys(urls[-SEEN_URL_LIMIT:])
+    
+    def mark_seen(self, jump_url: str) -> bool:
+        """처음 보는 메시지면 기록하고 True (가장 오래된 기록부터 밀려남)"""
+        if jump_url in self.seen_urls:
+            self.seen_urls.move_to_end(jump_url)
+            return False
+        self.seen_urls[jump_url] = None
+        if len(self.seen_urls) > SEEN_URL_LIMIT:
+            self.seen_urls.popitem(last=False)
+        return True
+    
+    def is_relevant(self, message) -> bool:
+        """수집 대상 메시지인지 확인"""
+        if message.author.bot:
+            return False
+        content_lower = message.content.lower()
+        return any(keyword in content_lower for keyword in self.keywords)
+    
     @commands.Cog.listener()
     async def on_message(self, message):
         """메시지 감지 - 실시간 모니터링"""
@@ -111,14 +187,24 @@ class DiscordMonitor(commands.Cog):
             return
         
         # 키워드 감지
-        content_lower = message.content.lower()
-        if any(keyword in content_lower for keyword in self.keywords):
+        if self.is_relevant(message):
             await self.process_message(message)
     
-    async def process_message(self, message):
-        """메시지 처리 및 저장"""
+    async def process_message(self, message, wait: bool = False) -> bool:
+        """메시지를 수집 큐에 넣기 (이미 수집한 메시지면 False)
+
+        리스너에서는 대기 없이 넣고(큐가 차면 오버플로 정책 적용),
+        스캔처럼 기다릴 수 있는 경우 wait=True로 자리가 날 때까지 대기
+        """
+        # 리스너·자동 스캔·백필이 같은 메시지를 집계에 두 번 넣지 않도록
+        if message.jump_url in self.seen_urls or message.jump_url in self.pending_urls:
+            return False
+        self.pending_urls.add(message.jump_url)
+        
+        # 메시지 작성 시각 (백필한 과거 메시지도 실제 시간대로 집계)
+        created_at = message.created_at.astimezone().replace(tzinfo=None)
         data = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': created_at.isoformat(),
             'server': message.guild.name,
             'channel': message.channel.name,
             'author': str(message.author),
@@ -126,12 +212,47 @@ class DiscordMonitor(commands.Cog):
             'attachments': [att.url for att in message.attachments],
             'jump_url': message.jump_url
         }
-        
-        self.collected_data.append(data)
-        
-        # 로그 출력
-        print(f"[MONITOR] 📌 {message.guild.name} > {message.channel.name}")
-        print(f"[MONITOR] 👤 {message.author}: {message.content[:50]}...")
+        if wait:
+            await self.ingest.put(data)
+        else:
+            self.ingest.offer(data)
+        return True
+    
+    def on_ingest_drop(self, data: Dict):
+        """큐에서 버려진 메시지 정리 (다음 스캔에서 다시 수집되도록)"""
+        self.pending_urls.discard(data['jump_url'])
+        # 백필 메시지면 저장 대기에서 빼고, 채널을 그 메시지부터 다시 읽도록 기록
+        inflight = self.backfill_inflight.pop(data['jump_url'], None)
+        if inflight:
+            channel_id, message_id = inflight
+            self.backfill_retry[channel_id] = min(message_id, self.backfill_retry.get(channel_id, message_id))
+    
+    async def window(self, day: date) -> StreamingAggregator:
+        """날짜 구간 스케치 (메모리에 없으면 저장된 파일, 그것도 없으면 빈 구간)"""
+        if day not in self.windows:
+            sketch = await asyncio.to_thread(
+                self.analyzer.load_engagement_sketch, datetime.combine(day, datetime.min.time())
+            )
+            self.windows.setdefault(day, sketch or StreamingAggregator())
+        return self.windows[day]
+    
+    async def store_batch(self, batch: List[Dict]):
+        """수집 큐 워커가 넘겨준 배치 저장"""
+        for data in batch:
+            self.pending_urls.discard(data['jump_url'])
+            # 집계한 메시지만 기록 (저장된 기록에 있으면 재시작 후에도 건너뜀)
+            if not self.mark_seen(data['jump_url']):
+                continue
+            try:
+                timestamp = datetime.fromisoformat(data['timestamp'])
+            except (ValueError, KeyError, TypeError):
+                timestamp = datetime.now()
+            # 수집한 날이 아니라 메시지 작성일 구간에 반영
+            day = timestamp.date()
+            (await self.window(day)).add(data, timestamp)
+            self.dirty_days.add(day)
+            self.stored_urls.append(data['jump_url'])
+        self.collected_data.extend(batch)
         
         # 데이터 저장 (100개마다)
         if len(self.collected_data) >= 100:
@@ -139,12 +260,39 @@ class DiscordMonitor(commands.Cog):
     
     async def save_collected_data(self):
         """수집된 데이터 저장"""
+        data, self.collected_data = self.collected_data, []
         filename = f"data/collected_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.collected_data, f, ensure_ascii=False, indent=2)
+        await asyncio.to_thread(self._write_json, filename, data)
         
-        print(f"[MONITOR] 💾 {len(self.collected_data)}개 데이터 저장: {filename}")
-        self.collected_data = []
+        print(f"[MONITOR] 💾 {len(data)}개 데이터 저장: {filename}")
+        await self.save_engagement_sketch()
+    
+    async def save_engagement_sketch(self):
+        """변경된 날짜의 참여도 스케치만 통계와 함께 저장"""
+        days, self.dirty_days = self.dirty_days, set()
+        sketches = [
+            # 스레드에 넘길 스냅샷
+            (datetime.combine(day, datetime.min.time()), StreamingAggregator.from_dict(self.windows[day].to_dict()))
+            for day in sorted(days)
+        ]
+        stored, self.stored_urls = self.stored_urls, []
+        for day, sketch in sketches:
+            await asyncio.to_thread(self.analyzer.save_engagement_sketch, sketch, day)
+        # 오늘 구간만 메모리에 두고 저장이 끝난 지난 구간은 해제 (필요하면 파일에서 다시 읽음)
+        today = datetime.now().date()
+        for day in [day for day in self.windows if day != today and day not in self.dirty_days]:
+            del self.windows[day]
+        # 스케치에 반영된 메시지 기록도 함께 저장 (재시작 후 중복 집계 방지)
+        await asyncio.to_thread(self._write_json, self.seen_file, list(self.seen_urls))
+        
+        # 저장이 끝난 백필 메시지만큼 체크포인트 전진
+        if sum(self.backfill_inflight.pop(url, None) is not None for url in stored):
+            await self.save_backfill_state()
+    
+    @staticmethod
+    def _write_json(filename: str, data):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     
     @tasks.loop(hours=1)
     async def auto_monitor(self):
@@ -161,14 +309,9 @@ class DiscordMonitor(commands.Cog):
                 messages = [msg async for msg in channel.history(limit=50)]
                 
                 for message in messages:
-                    if message.author.bot:
-                        continue
-                    
-                    content_lower = message.content.lower()
-                    if any(keyword in content_lower for keyword in self.keywords):
-                        # 중복 체크
-                        if not any(d.get('jump_url') == message.jump_url for d in self.collected_data):
-                            await self.process_message(message)
+                    # 중복은 process_message에서 거름
+                    if self.is_relevant(message):
+                        await self.process_message(message, wait=True)
                 
             except discord.Forbidden:
                 print(f"[MONITOR] ❌ 권한 없음: {channel.name}")
@@ -195,19 +338,218 @@ class DiscordMonitor(commands.Cog):
         await ctx.send(f"🔍 최근 {limit}개 메시지 스캔 중...")
         
         count = 0
-        messages = [msg async for msg in ctx.channel.history(limit=limit)]
-        
-        for message in messages:
-            if message.author.bot:
-                continue
-            
-            content_lower = message.content.lower()
-            if any(keyword in content_lower for keyword in self.keywords):
-                await self.process_message(message)
+        async for message in ctx.channel.history(limit=limit):
+            if self.is_relevant(message) and await self.process_message(message, wait=True):
                 count += 1
         
         await ctx.send(f"✅ {count}개의 관련 메시지를 수집했습니다!")
     
+    # ═══════════════════════════════════════════════════════════════
+    # 전체 채널 백필
+    # ═══════════════════════════════════════════════════════════════
+    
+    def load_backfill_state(self) -> Dict:
+        """백필 체크포인트 로드"""
+        try:
+            with open(self.backfill_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'active': False, 'concurrency': 3, 'channels': {}}
+    
+    async def save_backfill_state(self):
+        """백필 체크포인트 저장
+
+        저장되지 않은 수집 메시지가 남은 채널은 그중 가장 오래된 메시지 직전까지만
+        기록한다 (중간에 종료돼도 다음 실행에서 그 메시지부터 다시 읽음).
+        """
+        oldest_pending: Dict[int, int] = {}
+        for channel_id, message_id in [*self.backfill_inflight.values(), *self.backfill_retry.items()]:
+            oldest_pending[channel_id] = min(message_id, oldest_pending.get(channel_id, message_id))
+        for channel_id, scanned_id in self.backfill_scanned.items():
+            checkpoint = self.backfill_state['channels'].get(str(channel_id))
+            if checkpoint is not None:
+                pending_id = oldest_pending.get(channel_id)
+                checkpoint['last_id'] = pending_id - 1 if pending_id else scanned_id
+        
+        state = json.loads(json.dumps(self.backfill_state))  # 스레드에 넘길 스냅샷
+        await asyncio.to_thread(self._write_json, self.backfill_file, state)
+    
+    async def iter_channel_history(self, channel, after_id: Optional[int]) -> AsyncIterator[discord.Message]:
+        """체크포인트 이후 메시지를 오래된 순으로 스트리밍"""
+        after = discord.Object(id=after_id) if after_id else None
+        async for message in channel.history(limit=None, after=after, oldest_first=True):
+            yield message
+    
+    async def backfill_channel(self, channel, semaphore: asyncio.Semaphore):
+        """채널 하나 백필 (메시지를 메모리에 모으지 않고 흘려보냄)"""
+        checkpoint = self.backfill_state['channels'].setdefault(
+            str(channel.id), {'last_id': None, 'scanned': 0, 'matched': 0}
+        )
+        progress = self.backfill_progress.setdefault(
+            channel.id, {'name': channel.name, 'scanned': 0, 'matched': 0, 'done': False}
+        )
+        
+        async with semaphore:
+            try:
+                async for message in self.iter_channel_history(channel, checkpoint['last_id']):
+                    progress['scanned'] += 1
+                    checkpoint['scanned'] += 1
+                    
+                    if self.is_relevant(message) and await self.process_message(message, wait=True):
+                        self.backfill_inflight[message.jump_url] = (channel.id, message.id)
+                        progress['matched'] += 1
+                        checkpoint['matched'] += 1
+                    
+                    self.backfill_scanned[channel.id] = message.id
+                    if progress['scanned'] % 500 == 0:
+                        await self.save_backfill_state()
+            except discord.Forbidden:
+                print(f"[MONITOR] ❌ 권한 없음: {channel.name}")
+            except Exception as e:
+                print(f"[MONITOR] ⚠️ 백필 오류 ({channel.name}): {e}")
+            finally:
+                progress['done'] = True
+                await self.save_backfill_state()
+    
+    async def run_backfill(self, concurrency: int):
+        """모니터링 채널 전체를 동시에 백필"""
+        self.backfill_state['active'] = True
+        self.backfill_state['concurrency'] = concurrency
+        await self.save_backfill_state()
+        
+        self.backfill_progress = {}
+        self.backfill_started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        channels = [
+            channel for channel_id in self.monitored_channels
+            if (channel := self.bot.get_channel(channel_id))
+        ]
+        print(f"[MONITOR] 📚 백필 시작: {len(channels)}개 채널 (동시 {concurrency})")
+        
+        self.backfill_retry.clear()
+        for attempt in range(BACKFILL_RETRY_PASSES + 1):
+            await asyncio.gather(*(self.backfill_channel(ch, semaphore) for ch in channels))
+            # 큐에 남은 백필 메시지를 저장한 뒤 체크포인트 확정
+            await self.ingest.join()
+            if not self.backfill_retry or attempt == BACKFILL_RETRY_PASSES:
+                break
+            
+            # 큐가 넘쳐 버려진 메시지가 있는 채널은 그 메시지 직전부터 다시 읽기
+            # (이미 수집한 메시지는 seen_urls로 건너뜀)
+            channels = [ch for ch in channels if ch.id in self.backfill_retry]
+            for channel in channels:
+                resume_id = self.backfill_retry.pop(channel.id) - 1
+                self.backfill_state['channels'][str(channel.id)]['last_id'] = resume_id
+                self.backfill_scanned[channel.id] = resume_id
+                self.backfill_progress[channel.id]['done'] = False
+            print(f"[MONITOR] 🔁 큐에서 버려진 메시지 재수집: {len(channels)}개 채널")
+        
+        await self.save_engagement_sketch()
+        self.backfill_state['active'] = False
+        await self.save_backfill_state()
+        
+        stats = self.get_backfill_stats()
+        print(
+            f"[MONITOR] ✅ 백필 완료: {stats['scanned']}개 스캔, {stats['matched']}개 수집 "
+            f"({stats['rate']:.1f}개/초)"
+        )
+    
+    async def _resume_backfill(self):
+        """재시작 후 중단된 백필 이어서 진행"""
+        await self.bot.wait_until_ready()
+        if self.backfill_task and not self.backfill_task.done():
+            return
+        print("[MONITOR] 🔁 중단된 백필을 이어서 진행합니다.")
+        self.backfill_task = asyncio.create_task(
+            self.run_backfill(self.backfill_state.get('concurrency', 3))
+        )
+    
+    def get_backfill_stats(self) -> Dict:
+        """현재 백필 진행 통계"""
+        scanned = sum(p['scanned'] for p in self.backfill_progress.values())
+        matched = sum(p['matched'] for p in self.backfill_progress.values())
+        elapsed = time.monotonic() - self.backfill_started_at if self.backfill_started_at else 0
+        return {
+            'scanned': scanned,
+            'matched': matched,
+            'elapsed': elapsed,
+            'rate': scanned / elapsed if elapsed > 0 else 0,
+            'channels_done': sum(p['done'] for p in self.backfill_progress.values()),
+            'channels_total': len(self.backfill_progress)
+        }
+    
+    @commands.command(name='백필')
+    @commands.has_permissions(administrator=True)
+    async def backfill(self, ctx, concurrency: int = 3):
+        """모니터링 채널 전체 과거 메시지 수집 (체크포인트에서 이어서)
+        
+        사용법: !백필 [동시채널수]
+        """
+        if self.backfill_task and not self.backfill_task.done():
+            await ctx.send("⏳ 이미 백필이 진행 중입니다. `!백필상태`로 확인하세요.")
+            return
+        
+        if not self.monitored_channels:
+            await ctx.send("📭 모니터링 중인 채널이 없습니다.")
+            return
+        
+        concurrency = max(1, min(concurrency, 10))
+        self.backfill_task = asyncio.create_task(self.run_backfill(concurrency))
+        await ctx.send(
+            f"📚 {len(self.monitored_channels)}개 채널 백필을 시작합니다 (동시 {concurrency}개).\n"
+            f"진행 상황은 `!백필상태`, 중지는 `!백필중지`로 확인하세요."
+        )
+    
+    @commands.command(name='백필상태')
+    async def backfill_status(self, ctx):
+        """백필 진행 상황 및 처리량"""
+        running = self.backfill_task is not None and not self.backfill_task.done()
+        stats = self.get_backfill_stats()
+        
+        embed = discord.Embed(
+            title="📚 백필 상태",
+            color=discord.Color.blue() if running else discord.Color.greyple()
+        )
+        embed.add_field(name="상태", value="진행 중" if running else "대기", inline=True)
+        embed.add_field(
+            name="채널",
+            value=f"{stats['channels_done']}/{stats['channels_total']}개 완료",
+            inline=True
+        )
+        embed.add_field(
+            name="처리량",
+            value=f"{stats['rate']:.1f}개/초 ({stats['elapsed']:.0f}초 경과)",
+            inline=True
+        )
+        embed.add_field(
+            name="스캔/수집",
+            value=f"{stats['scanned']}개 스캔 · {stats['matched']}개 수집",
+            inline=False
+        )
+        
+        if self.backfill_progress:
+            lines = [
+                f"{'✅' if p['done'] else '⏳'} #{p['name']}: {p['scanned']}개 ({p['matched']}개 수집)"
+                for p in self.backfill_progress.values()
+            ]
+            embed.add_field(name="채널별", value="\n".join(lines[:15]), inline=False)
+        
+        await ctx.send(embed=embed)
+    
+    @commands.command(name='백필중지')
+    @commands.has_permissions(administrator=True)
+    async def backfill_stop(self, ctx):
+        """진행 중인 백필 중지 (체크포인트는 유지)"""
+        if not self.backfill_task or self.backfill_task.done():
+            await ctx.send("❌ 진행 중인 백필이 없습니다.")
+            return
+        
+        self.backfill_task.cancel()
+        self.backfill_state['active'] = False
+        await self.save_backfill_state()
+        await ctx.send("⏹️ 백필을 중지했습니다. `!백필`로 이어서 진행할 수 있습니다.")
+    
     @commands.command(name='수집통계')
     async def collection_stats(self, ctx):
         """수집 데이터 통계"""
@@ -234,14 +576,24 @@ class DiscordMonitor(commands.Cog):
             inline=True
         )
         
+        queue_stats = self.ingest.get_stats()
+        embed.add_field(
+            name="수집 큐",
+            value=(
+                f"대기 {queue_stats['depth']}/{queue_stats['maxsize']} "
+                f"(최대 {queue_stats['high_watermark']})\n"
+                f"처리 {queue_stats['processed']} · 배치 {queue_stats['batches']}\n"
+                f"버림 {queue_stats['dropped']} · 스필 {queue_stats['spilled']} "
+                f"({queue_stats['overflow']})"
+            ),
+            inline=False
+        )
+        
         # 서버별 통계
-        server_counts = {}
-        for data in self.collected_data:
-            server = data.get('server', 'Unknown')
-            server_counts[server] = server_counts.get(server, 0) + 1
+        server_counts = (await self.window(datetime.now().date())).server_activity
         
         if server_counts:
-            stats = "\n".join([f"• {k}: {v}개" for k, v in server_counts.items()])
+            stats = "\n".join([f"• {k}: {v}개" for k, v in server_counts.most_common(10)])
             embed.add_field(
                 name="서버별 수집량",
                 value=stats,
@@ -249,6 +601,48 @@ class DiscordMonitor(commands.Cog):
             )
         
         await ctx.send(embed=embed)
+    
+    @commands.command(name='수집분석')
+    async def collection_analysis(self, ctx, days: int = 1):
+        """수집 데이터 참여도 분석 (일별 스케치 병합)
+        
+        사용법: !수집분석 [일수]
+        """
+        days = max(1, min(days, 90))
+        today = datetime.now().date()
+        if days == 1:
+            window = await self.window(today)
+        else:
+            # 메모리에 있는 구간(오늘, 아직 저장 전인 날)은 스냅샷으로, 나머지는 저장된 파일에서
+            loaded = {
+                day: StreamingAggregator.from_dict(sketch.to_dict()) for day, sketch in self.windows.items()
+            }
+            window = await asyncio.to_thread(
+                self.analyzer.load_engagement_window, days, datetime.now(), "data/stats", loaded
+            )
+        
+        metrics = window.engagement_metrics()
+        if 'error' in metrics:
+            await ctx.send("📭 아직 수집된 데이터가 없습니다.")
+            return
+        
+        embed = discord.Embed(
+            title=f"📈 수집 데이터 참여도 분석 (최근 {days}일)",
+            color=discord.Color.purple()
+        )
+        embed.add_field(name="총 메시지", value=f"{metrics['total_messages']}개", inline=True)
+        embed.add_field(name="활성 사용자", value=f"약 {metrics['unique_users']}명", inline=True)
+        embed.add_field(name="참여도 점수", value=f"{metrics['engagement_score']}/100", inline=True)
+        
+        if metrics['most_active_users']:
+            users = "\n".join(f"• {k}: {v}개" for k, v in list(metrics['most_active_users'].items())[:5])
+            embed.add_field(name="활발한 사용자", value=users, inline=False)
+        
+        if metrics['peak_hours']:
+            hours = "\n".join(f"• {hour:02d}:00 ({count}개)" for hour, count in metrics['peak_hours'][:3])
+            embed.add_field(name="가장 활동적인 시간", value=hours, inline=False)
+        
+        await ctx.send(embed=embed)
 
 async def setup(bot):
     await bot.add_cog(DiscordMonitor(bot))
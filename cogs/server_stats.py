@@ -3,8 +3,7 @@ import discord
 from discord.ext import commands
 from discord.ui import View, Button, Modal, TextInput
 from config import ADMIN_PASSWORD
-import contextlib
-import os
+from core.dday_store import get_dday_repository
 from datetime import datetime
 
 # 관리자 비밀번호 인증 모달
@@ -64,41 +63,23 @@ class ServerStats(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
-        self.dday_file = "data/dday.xlsx"
+        self.dday_repository = get_dday_repository(bot)  # D-Day 기능과 공유하는 메모리 목록
     
-    def get_dday_data(self):
-        """D-Day 데이터 가져오기"""
-        with contextlib.suppress(Exception):
-            import openpyxl
-            if not os.path.exists(self.dday_file):
-                return []
-            
-            wb = openpyxl.load_workbook(self.dday_file)
-            ws = wb.active
-            dddays = []
-            
-            for row in range(2, ws.max_row + 1):
-                name = ws[f"A{row}"].value
-                target_date = ws[f"B{row}"].value
-                message = ws[f"C{row}"].value
-                
-                if name and target_date:
-                    with contextlib.suppress(Exception):
-                        if isinstance(target_date, str):
-                            target_date = datetime.strptime(target_date, "%Y-%m-%d")
-                        
-                        today = datetime.now()
-                        d_day = (target_date.date() - today.date()).days
-                        
-                        dddays.append({
-                            "name": name,
-                            "date": target_date.strftime("%Y-%m-%d"),
-                            "days": d_day,
-                            "message": message or ""
-                        })
-            
-            return sorted(dddays, key=lambda x: x["days"])
-        return []
+    def get_dday_data(self, guild_id):
+        """서버의 D-Day 데이터 가져오기 (메모리 조회, 파일 읽기 없음)"""
+        if guild_id is None:
+            return []
+        today = datetime.now().date()
+        dddays = [
+            {
+                "name": entry["name"],
+                "date": entry["date"].strftime("%Y-%m-%d"),
+                "days": (entry["date"].date() - today).days,
+                "message": entry["message"]
+            }
+            for entry in self.dday_repository.all(guild_id)
+        ]
+        return sorted(dddays, key=lambda x: x["days"])
     
     def _count_channels(self, guild, channel_type):
         """채널 타입별 개수 반환"""
@@ -200,7 +181,7 @@ class ServerStats(commands.Cog):
         )
         
         # D-Day 정보
-        if (dddays := self.get_dday_data()):
+        if (dddays := self.get_dday_data(guild.id)):
             embed.add_field(
                 name="🎯 D-Day 요약",
                 value=self._get_dday_status_text(dddays),
@@ -269,7 +250,7 @@ class ServerStats(commands.Cog):
     
     async def show_dday_list(self, interaction: discord.Interaction):
         """D-Day 목록 표시"""
-        dddays = self.get_dday_data()
+        dddays = self.get_dday_data(interaction.guild_id)
         
         embed = discord.Embed(
             title="📅 D-Day 목록",
@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import Modal, TextInput, View, Button
 import json
 import os
+import tempfile
+import time
 from contextlib import suppress
-from gtts import gTTS
 import asyncio
 from collections import deque
+from config import (
+    TTS_CACHE_MAX_MB, TTS_COALESCE_MAX_CHARS, TTS_MAX_QUEUE_LATENCY, TTS_SETTINGS_WATCH_INTERVAL
+)
+from core.audio_cache import AudioCache
+from core.opus_audio import ensure_opus
+from core.tts_backends import (
+    BACKENDS, available_backends, benchmark, get_backend, split_sentences, synthesize_to_file
+)
+from core.voice_manager import AudioPipe, get_voice_manager, resolve_ffmpeg
 
 class TTSSettingModal(Modal, title="TTS 채널 설정"):
     """TTS 채팅 채널 설정 모달"""
@@ -107,7 +117,6 @@ class TTSView(View):
         
         tts_enabled = settings.get("tts_enabled", False)
         tts_channel_id = settings.get("tts_channel_id", 0)
-        queue_size = len(self.cog.message_queue)
         
         status_text = "[ON]" if tts_enabled else "[OFF]"
         channel_text = f"<#{tts_channel_id}>" if tts_channel_id > 0 else "설정 안됨"
@@ -118,20 +127,233 @@ class TTSView(View):
         )
         embed.add_field(name="상태", value=status_text, inline=False)
         embed.add_field(name="채팅 채널", value=channel_text, inline=False)
-        embed.add_field(name="대기 메시지", value=f"{queue_size}개", inline=False)
+        embed.add_field(name="대기 메시지", value=self.cog.queue_status_text(interaction.guild), inline=False)
+        embed.add_field(name="음성 캐시", value=self.cog.cache_status_text(), inline=False)
         
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+class GuildTTSPlayer:
+    """길드별 TTS 큐와 재생 태스크
+
+    길드마다 독립적으로 재생하므로 한 서버가 바쁘더라도 다른 서버의 TTS가 밀리지 않는다.
+    큐가 비면 Event를 기다리며 쉬고, 재생 완료는 after 콜백으로 통지받는다.
+    채팅이 몰리면 같은 사람의 연속 메시지를 합치고, 너무 오래 기다린 메시지는 건너뛴다.
+    """
+    
+    GAP_MAX = 1.0  # 큐가 비어 있을 때 메시지 간 간격 (초)
+    GAP_MIN = 0.2  # 큐가 밀렸을 때 최소 간격 (초)
+    
+    def __init__(self, cog, guild):
+        self.cog = cog
+        self.guild = guild
+        self.queue = deque()
+        self.wakeup = asyncio.Event()
+        self.is_playing = False
+        self.wait_times = deque(maxlen=200)  # 최근 재생 메시지의 대기 시간 (초)
+        self.stats = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'dropped_stale': 0,
+            'played': 0,
+            'streamed': 0,
+            'max_depth': 0
+        }
+        self.task = asyncio.create_task(self.run())
+    
+    def enqueue(self, item):
+        """메시지 추가 (재생 중이면 다음 메시지를 미리 합성)
+
+        큐 마지막 메시지와 작성자가 같으면 한 문장으로 합쳐 읽는다.
+        """
+        item.setdefault("enqueued_at", time.monotonic())
+        self.stats['enqueued'] += 1
+        
+        if not self._coalesce(item):
+            self.queue.append(item)
+            self.stats['max_depth'] = max(self.stats['max_depth'], len(self.queue))
+        if self.is_playing:
+            self._prefetch_next()
+        self.wakeup.set()
+    
+    def _coalesce(self, item):
+        """같은 작성자의 연속 메시지를 마지막 항목에 합치기 (합쳤으면 True)"""
+        if not self.queue:
+            return False
+        last = self.queue[-1]
+        if last.get("author_id") != item.get("author_id") or item.get("author_id") is None:
+            return False
+        merged = f"{last['text']}. {item['text']}"
+        if len(merged) > TTS_COALESCE_MAX_CHARS:
+            return False
+        
+        # 이미 합성을 시작했으면 취소하고 합친 문장으로 다시 합성
+        if last["synthesis"] is not None:
+            last["synthesis"].cancel()
+            last["synthesis"] = None
+        last["text"] = merged
+        self.stats['coalesced'] += 1
+        return True
+    
+    def _drop_stale(self):
+        """최대 대기 시간을 넘긴 메시지 건너뛰기"""
+        if TTS_MAX_QUEUE_LATENCY <= 0:
+            return
+        now = time.monotonic()
+        dropped = 0
+        while self.queue and now - self.queue[0]["enqueued_at"] > TTS_MAX_QUEUE_LATENCY:
+            item = self.queue.popleft()
+            if item["synthesis"]:
+                item["synthesis"].cancel()
+            dropped += 1
+        if dropped:
+            self.stats['dropped_stale'] += dropped
+            print(f"[WARNING] TTS 대기 시간 초과로 {dropped}개 메시지 건너뜀 ({self.guild.name})")
+    
+    def _gap(self):
+        """메시지 간 간격 (대기 메시지가 많을수록 짧게)"""
+        return max(self.GAP_MIN, self.GAP_MAX - 0.2 * len(self.queue))
+    
+    def _start_synthesis(self, item):
+        """큐 항목의 음성 합성을 백그라운드에서 시작"""
+        if item["synthesis"] is None:
+            tts_text = f"{item['author_name']}, {item['text']}"
+            item["synthesis"] = asyncio.create_task(self.cog.synthesize(tts_text))
+        return item["synthesis"]
+    
+    def _prefetch_next(self):
+        """대기 중인 다음 메시지 합성 시작 (현재 메시지 재생과 겹치도록)"""
+        if self.queue:
+            self._start_synthesis(self.queue[0])
+    
+    async def run(self):
+        """메시지 큐 처리
+
+        N번째 메시지를 재생하는 동안 N+1번째 메시지를 합성해 두어
+        메시지 사이의 합성 대기 시간을 없앤다.
+        """
+        while True:
+            self._drop_stale()
+            if not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            
+            item = self.queue.popleft()
+            self.is_playing = True
+            try:
+                print(f"[MUSIC] TTS 큐 처리: {item['author_name']} - {item['text']}")
+                
+                # 미리 합성해 두지 않은 긴 메시지는 문장 단위 스트리밍으로 재생
+                if item["synthesis"] is None and self.cog.stream_plan(f"{item['author_name']}, {item['text']}"):
+                    self._prefetch_next()
+                    self.wait_times.append(time.monotonic() - item["enqueued_at"])
+                    await self.cog.play_tts(self.guild, item["text"], item["author_name"])
+                    self.stats['played'] += 1
+                    self.stats['streamed'] += 1
+                    await asyncio.sleep(self._gap())
+                    continue
+                
+                synthesis = self._start_synthesis(item)
+                self._prefetch_next()
+                
+                voice_file = await synthesis
+                if voice_file:
+                    self.wait_times.append(time.monotonic() - item["enqueued_at"])
+                    await self.cog.play_tts(self.guild, item["text"], item["author_name"], voice_file)
+                    self.stats['played'] += 1
+                await asyncio.sleep(self._gap())  # 메시지 간 간격
+            except Exception as e:
+                print(f"[ERROR] TTS 큐 처리 오류: {e}")
+            finally:
+                self.is_playing = False
+    
+    def get_stats(self):
+        """큐 깊이·대기 시간 통계"""
+        waits = sorted(self.wait_times)
+        return {
+            **self.stats,
+            'depth': len(self.queue),
+            'avg_wait': round(sum(waits) / len(waits), 2) if waits else 0.0,
+            'p95_wait': round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 2) if waits else 0.0
+        }
+    
+    def stop(self):
+        """재생 태스크 및 대기 중인 합성 취소"""
+        self.task.cancel()
+        for item in self.queue:
+            if item["synthesis"]:
+                item["synthesis"].cancel()
+        self.queue.clear()
+
+DEFAULT_SETTINGS = {
+    "tts_enabled": False,
+    "tts_channel_id": 0,
+    "tts_speed": 1.0
+}
+
 class TTS(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.settings_file = "data/tts_settings.json"
         self.voice_dir = "data/voice_tts"
-        self.message_queue = deque()
-        self.is_playing = False
-        self.ffmpeg_path = "F:/A/ffmpeg/ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe"
+        self.players = {}  # guild_id -> GuildTTSPlayer
+        self.voice = get_voice_manager(bot)
+        # 설정은 메모리에 보관 (save_settings 또는 파일 변경 감지 시 갱신)
+        self._settings = None
+        self._settings_mtime = None
         
         self.ensure_files()
+        # (텍스트, 언어, 속도, 엔진) 해시로 찾는 음성 캐시 (용량 초과 시 LRU 삭제)
+        self.audio_cache = AudioCache(self.voice_dir, TTS_CACHE_MAX_MB * 1024 * 1024)
+        self.flush_audio_cache.start()
+        if TTS_SETTINGS_WATCH_INTERVAL > 0:
+            self.watch_settings_file.start()
+    
+    def cog_unload(self):
+        self.flush_audio_cache.cancel()
+        self.watch_settings_file.cancel()
+        for player in self.players.values():
+            player.stop()
+        self.players.clear()
+        self.audio_cache.flush()
+    
+    def get_player(self, guild):
+        """길드 전용 재생기 (없으면 생성)"""
+        player = self.players.get(guild.id)
+        if player is None or player.task.done():
+            player = self.players[guild.id] = GuildTTSPlayer(self, guild)
+        return player
+    
+    def queue_status_text(self, guild):
+        """큐 깊이·대기 시간 텍스트"""
+        player = self.players.get(guild.id) if guild else None
+        if player is None:
+            return "0개"
+        stats = player.get_stats()
+        return (
+            f"{stats['depth']}개 (최대 {stats['max_depth']}) · 평균 대기 {stats['avg_wait']}초 / p95 {stats['p95_wait']}초\n"
+            f"재생 {stats['played']} (스트리밍 {stats['streamed']}) · 합침 {stats['coalesced']} · 시간 초과 건너뜀 {stats['dropped_stale']}"
+        )
+    
+    def queue_size(self, guild=None):
+        """대기 메시지 수 (guild가 없으면 전체)"""
+        if guild is not None:
+            player = self.players.get(guild.id)
+            return len(player.queue) if player else 0
+        return sum(len(player.queue) for player in self.players.values())
+    
+    @tasks.loop(minutes=10)
+    async def flush_audio_cache(self):
+        """캐시 인덱스(새 파일·마지막 사용 시각) 저장"""
+        await asyncio.to_thread(self.audio_cache.flush)
+    
+    def cache_status_text(self):
+        """음성 캐시 상태 텍스트"""
+        stats = self.audio_cache.get_stats()
+        return (
+            f"적중 {stats['hits']} / 생성 {stats['misses']} ({stats['hit_rate']})\n"
+            f"{stats['entries']}개 · {stats['size_mb']}MB / {stats['max_mb']}MB"
+        )
     
     def ensure_files(self):
         """파일 및 디렉토리 생성"""
@@ -139,47 +361,66 @@ class TTS(commands.Cog):
         os.makedirs(self.voice_dir, exist_ok=True)
         
         if not os.path.exists(self.settings_file):
-            self.save_settings({
-                "tts_enabled": False,
-                "tts_channel_id": 0,
-                "tts_speed": 1.0
-            })
+            self.save_settings(DEFAULT_SETTINGS)
     
-    def load_settings(self):
-        """설정 로드"""
+    def _read_settings_file(self):
+        """설정 파일 읽기 (파일이 없거나 손상되면 기본값)"""
         try:
+            mtime = os.path.getmtime(self.settings_file)
             with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                return json.load(f), mtime
         except Exception:
-            return {
-                "tts_enabled": False,
-                "tts_channel_id": 0,
-                "tts_speed": 1.0
-            }
+            return dict(DEFAULT_SETTINGS), None
+    
+    @property
+    def settings(self):
+        """메모리에 보관한 설정 (읽기 전용 - 변경은 save_settings로)"""
+        if self._settings is None:
+            self._settings, self._settings_mtime = self._read_settings_file()
+        return self._settings
+    
+    def load_settings(self):
+        """설정 로드 (메모리 캐시의 복사본 - 수정 후 save_settings로 저장)"""
+        return dict(self.settings)
     
     def save_settings(self, settings):
-        """설정 저장"""
+        """설정 저장 (메모리 캐시도 함께 갱신)"""
         os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
         with open(self.settings_file, 'w', encoding='utf-8') as f:
             json.dump(settings, f, ensure_ascii=False, indent=2)
+        self._settings = dict(settings)
+        self._settings_mtime = os.path.getmtime(self.settings_file)
     
-    def generate_tts_file(self, text):
-        """TTS 파일 생성"""
+    @tasks.loop(seconds=max(1, TTS_SETTINGS_WATCH_INTERVAL))
+    async def watch_settings_file(self):
+        """설정 파일이 외부에서 수정되면 다시 읽기"""
         try:
-            # 파일명 안전화 (특수문자 제거)
-            safe_name = "".join(c for c in text[:30] if c.isalnum() or c in ('_', '-'))
-            if not safe_name:
-                safe_name = "tts_temp"
-            
-            voice_file = f"{self.voice_dir}/{safe_name}.mp3"
+            mtime = os.path.getmtime(self.settings_file)
+        except OSError:
+            return
+        if mtime != self._settings_mtime:
+            self._settings, self._settings_mtime = self._read_settings_file()
+            print("[OK] TTS 설정 파일 변경 감지 - 다시 불러옴")
+    
+    def generate_tts_file(self, text, lang='ko', speed=None):
+        """TTS 파일 생성 (캐시에 있으면 재사용)"""
+        try:
+            if speed is None:
+                speed = self.settings.get("tts_speed", 1.0)
             
-            # 이미 존재하면 재사용
-            if os.path.exists(voice_file):
-                return voice_file
+            backend = get_backend(self.settings.get("tts_backend"))
+            key = self.audio_cache.make_key(text, lang, speed, backend.name)
+            if cached := self.audio_cache.lookup(key):
+                return cached
             
-            # gTTS로 음성 파일 생성
-            tts = gTTS(text=text, lang='ko', slow=False)
-            tts.save(voice_file)
+            # 임시 파일에 쓴 뒤 교체해 반쯤 쓴 파일이 캐시되지 않도록
+            voice_file, used = synthesize_to_file(
+                text, self.audio_cache.path_for(key, backend.ext), lang, speed, backend
+            )
+            if used is not backend:
+                # gTTS로 대신 만든 파일은 gTTS 키로 캐시 (요청한 엔진의 음성으로 재사용하지 않도록)
+                key = self.audio_cache.make_key(text, lang, speed, used.name)
+            self._cache_voice_file(key, voice_file, text)
             
             print(f"[MUSIC] 음성 파일 생성: {voice_file}")
             return voice_file
@@ -187,40 +428,109 @@ class TTS(commands.Cog):
             print(f"[ERROR] 음성 파일 생성 실패: {e}")
             return None
     
-    async def play_tts(self, guild, text, author_name):
-        """TTS 음성 재생"""
+    def _cache_voice_file(self, key, voice_file, text):
+        """완성된 음성 파일을 캐시에 등록"""
+        self.audio_cache.store(key, voice_file, text)
+        
+        # 재생할 때마다 ffmpeg를 띄우지 않도록 Opus로 미리 인코딩
+        if opus_file := ensure_opus(voice_file, resolve_ffmpeg()):
+            self.audio_cache.attach(key, opus_file)
+    
+    def _save_streamed_audio(self, key, audio, text):
+        """스트리밍으로 재생한 음성을 캐시에 저장 (다음 재생부터는 파일 재생)"""
+        voice_file = self.audio_cache.path_for(key, "mp3")
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(voice_file), prefix=f"{os.path.basename(voice_file)}.", suffix=".part"
+        )
+        with os.fdopen(fd, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp_file, voice_file)
+        self._cache_voice_file(key, voice_file, text)
+    
+    async def synthesize(self, text, lang='ko', speed=None):
+        """TTS 파일 생성을 스레드 풀에서 실행 (이벤트 루프 차단 방지)"""
+        return await asyncio.to_thread(self.generate_tts_file, text, lang, speed)
+    
+    def stream_plan(self, text, lang='ko'):
+        """스트리밍 재생 계획 (문장이 여럿이고 캐시에 없을 때만, 아니면 None)
+        
+        문장별 mp3를 이어 붙여 ffmpeg에 흘려 보내므로 mp3 엔진에서만 사용
+        """
+        speed = self.settings.get("tts_speed", 1.0)
+        backend = get_backend(self.settings.get("tts_backend"))
+        if backend.ext != "mp3":
+            return None
+        sentences = split_sentences(text)
+        if len(sentences) < 2:
+            return None
+        key = self.audio_cache.make_key(text, lang, speed, backend.name)
+        if self.audio_cache.contains(key):
+            return None
+        return {"backend": backend, "key": key, "lang": lang, "speed": speed, "sentences": sentences}
+    
+    async def stream_tts(self, guild, text, plan):
+        """문장 단위로 합성하면서 바로 재생
+        
+        모든 문장의 합성을 동시에 시작하고, 순서대로 끝나는 대로 파이프에 넣는다.
+        첫 문장이 재생되는 동안 나머지 문장이 합성된다.
+        """
+        backend = plan["backend"]
+        pipe = AudioPipe()
+        chunks = []
+        
+        async def produce():
+            syntheses = [
+                asyncio.create_task(asyncio.to_thread(
+                    backend.synthesize_bytes, sentence, plan["lang"], plan["speed"]
+                ))
+                for sentence in plan["sentences"]
+            ]
+            try:
+                for synthesis in syntheses:
+                    audio = await synthesis
+                    chunks.append(audio)
+                    pipe.write(audio)
+            finally:
+                for synthesis in syntheses:
+                    synthesis.cancel()
+                pipe.close()
+        
+        producer = asyncio.create_task(produce())
+        try:
+            played = await self.voice.play_stream(guild, pipe, label=text)
+        finally:
+            pipe.close()
+        
+        try:
+            await producer
+        except Exception as e:
+            print(f"[ERROR] 스트리밍 합성 실패: {e}")
+            return played
+        
+        if played and len(chunks) == len(plan["sentences"]):
+            await asyncio.to_thread(self._save_streamed_audio, plan["key"], b"".join(chunks), text)
+        return played
+    
+    async def play_tts(self, guild, text, author_name, voice_file=None):
+        """TTS 음성 재생
+
+        voice_file을 넘기면 (미리 합성해 둔 파일) 합성 단계를 건너뛴다.
+        여러 문장으로 된 긴 메시지는 문장 단위로 합성하며 바로 재생한다.
+        음성 연결은 알람과 공유하는 연결 관리자에서 재사용한다.
+        """
         try:
-            # 음성 채널 찾기
-            voice_client = None
-            for vc in self.bot.voice_clients:
-                if vc.guild == guild:
-                    voice_client = vc
-                    break
-            
-            # 음성 채널이 없으면 첫 번째 사람이 있는 음성 채널에 입장
-            if voice_client is None:
-                target_channel = None
-                for channel in guild.voice_channels:
-                    if len(channel.members) > 0:
-                        target_channel = channel
-                        break
-                
-                if not target_channel:
-                    print("[WARNING] 음성 채널에 사람이 없습니다.")
-                    return
-                
-                try:
-                    voice_client = await target_channel.connect()
-                    print(f"[OK] 음성 채널 입장: {target_channel.name}")
-                except Exception as e:
-                    print(f"[ERROR] 음성 채널 입장 실패: {e}")
-                    return
-            
             # 사용자 닉네임 추가 (예: "(사용자) 메시지 내용")
             tts_text = f"{author_name}, {text}"
             
+            if voice_file is None and (plan := self.stream_plan(tts_text)):
+                print(f"[SPEAKER] 음성 스트리밍 재생 시작 ({len(plan['sentences'])}문장): ({author_name}) {text}")
+                if await self.stream_tts(guild, tts_text, plan):
+                    print(f"[OK] 음성 재생 완료: ({author_name}) {text}")
+                return
+            
             # TTS 파일 생성
-            voice_file = self.generate_tts_file(tts_text)
+            if voice_file is None:
+                voice_file = await self.synthesize(tts_text)
             if not voice_file:
                 return
             
@@ -228,41 +538,13 @@ class TTS(commands.Cog):
                 print(f"[ERROR] 음성 파일이 존재하지 않음: {voice_file}")
                 return
             
-            if voice_client and not voice_client.is_playing():
-                try:
-                    # ffmpeg 경로 확인
-                    ffmpeg_path = self.ffmpeg_path
-                    if not os.path.exists(ffmpeg_path):
-                        ffmpeg_path = "ffmpeg"
-                    
-                    print(f"[SPEAKER] 음성 재생 시작: ({author_name}) {text}")
-                    audio_source = discord.FFmpegPCMAudio(voice_file, executable=ffmpeg_path)
-                    voice_client.play(
-                        audio_source,
-                        after=lambda e: self._voice_callback(tts_text, e)
-                    )
-                    
-                    # 재생 완료 대기
-                    max_wait = 30
-                    waited = 0
-                    while voice_client.is_playing() and waited < max_wait:
-                        await asyncio.sleep(0.5)
-                        waited += 0.5
-                    
-                    print(f"[OK] 음성 재생 완료: ({author_name}) {text}")
-                except Exception as e:
-                    print(f"[ERROR] 음성 재생 실패: {e}")
+            print(f"[SPEAKER] 음성 재생 시작: ({author_name}) {text}")
+            if await self.voice.play_file(guild, voice_file, label=tts_text):
+                print(f"[OK] 음성 재생 완료: ({author_name}) {text}")
         
         except Exception as e:
             print(f"[ERROR] TTS 재생 중 오류: {e}")
     
-    def _voice_callback(self, text, error):
-        """음성 재생 콜백"""
-        if error is None:
-            print(f"[OK] TTS '{text}' 재생 완료")
-        else:
-            print(f"[ERROR] 재생 오류 '{text}': {error}")
-    
     @commands.Cog.listener()
     async def on_message(self, message):
         """메시지 감지 및 TTS 재생"""
@@ -274,7 +556,7 @@ class TTS(commands.Cog):
         if message.guild is None:
             return
         
-        settings = self.load_settings()
+        settings = self.settings
         
         # TTS 비활성화 상태면 무시
         if not settings.get("tts_enabled", False):
@@ -284,33 +566,18 @@ class TTS(commands.Cog):
         if message.channel.id != settings.get("tts_channel_id", 0):
             return
         
-        # 메시지 큐에 추가
-        self.message_queue.append((message.guild, message.content, message.author))
-        
-        # 큐 처리 시작
-        await self.process_queue()
-    
-    async def process_queue(self):
-        """메시지 큐 처리"""
-        if self.is_playing or len(self.message_queue) == 0:
-            return
-        
-        self.is_playing = True
-        
-        while len(self.message_queue) > 0:
-            guild, text, author = self.message_queue.popleft()
-            
-            # 텍스트 정제
-            if len(text) > 200:
-                text = text[:200] + "..."
-            
-            # 서버 프로필 닉네임 또는 사용자명 사용
-            author_display_name = author.display_name
-            print(f"[MUSIC] TTS 큐 처리: {author_display_name} - {text}")
-            await self.play_tts(guild, text, author_display_name)
-            await asyncio.sleep(1)  # 메시지 간 간격
+        # 텍스트 정제
+        text = message.content
+        if len(text) > 200:
+            text = text[:200] + "..."
         
-        self.is_playing = False
+        # 길드 전용 큐에 추가 (서버 프로필 닉네임 또는 사용자명 사용)
+        self.get_player(message.guild).enqueue({
+            "text": text,
+            "author_id": message.author.id,
+            "author_name": message.author.display_name,
+            "synthesis": None
+        })
     
     @commands.group(name="tts", help="TTS 음성 채팅")
     async def tts(self, ctx):
@@ -321,6 +588,8 @@ class TTS(commands.Cog):
             embed.add_field(name="켜기", value="`!tts 켜기`", inline=False)
             embed.add_field(name="끄기", value="`!tts 끄기`", inline=False)
             embed.add_field(name="상태", value="`!tts 상태`", inline=False)
+            embed.add_field(name="엔진", value="`!tts 엔진 [gtts|espeak|http]`", inline=False)
+            embed.add_field(name="벤치마크", value="`!tts 벤치 [반복횟수]`", inline=False)
             embed.add_field(name="설명", value="설정된 채팅 채널에 메시지를 보내면 봇이 음성 채널에서 자동으로 읽어줍니다.", inline=False)
             await ctx.send(embed=embed)
     
@@ -397,7 +666,6 @@ class TTS(commands.Cog):
         
         tts_enabled = settings.get("tts_enabled", False)
         tts_channel_id = settings.get("tts_channel_id", 0)
-        queue_size = len(self.message_queue)
         
         status_text = "[ON]" if tts_enabled else "[OFF]"
         channel_text = f"<#{tts_channel_id}>" if tts_channel_id > 0 else "설정 안됨"
@@ -408,9 +676,63 @@ class TTS(commands.Cog):
         )
         embed.add_field(name="상태", value=status_text, inline=False)
         embed.add_field(name="채팅 채널", value=channel_text, inline=False)
-        embed.add_field(name="대기 메시지", value=f"{queue_size}개", inline=False)
+        embed.add_field(name="대기 메시지", value=self.queue_status_text(ctx.guild), inline=False)
+        embed.add_field(name="엔진", value=get_backend(settings.get("tts_backend")).name, inline=False)
+        embed.add_field(name="음성 캐시", value=self.cache_status_text(), inline=False)
+        voice_stats = self.voice.get_stats()
+        embed.add_field(
+            name="음성 연결",
+            value=(
+                f"연결 {voice_stats['connected']}개 · 재사용 {voice_stats['reuses']} / 신규 {voice_stats['connects']}\n"
+                f"유휴 해제 {voice_stats['idle_disconnects']} ({voice_stats['idle_timeout']}초)\n"
+                f"Opus 직접 재생 {voice_stats['opus_plays']} / ffmpeg 재생 {voice_stats['ffmpeg_plays']}"
+            ),
+            inline=False
+        )
         
         await ctx.send(embed=embed)
+    
+    @tts.command(name="엔진", help="TTS 엔진 확인/변경")
+    async def set_backend(self, ctx, name: str = None):
+        """TTS 엔진 변경 (이름 없이 호출하면 현재 엔진과 사용 가능 목록 표시)"""
+        available = available_backends()
+        if name is None:
+            current = get_backend(self.settings.get("tts_backend")).name
+            await ctx.send(f"[INFO] 현재 엔진: `{current}` · 사용 가능: {', '.join(available)}")
+            return
+        
+        name = name.lower()
+        if name not in BACKENDS:
+            await ctx.send(f"[ERROR] 알 수 없는 엔진입니다. 선택: {', '.join(BACKENDS)}")
+            return
+        if name not in available:
+            await ctx.send(f"[WARNING] `{name}` 엔진은 현재 환경에서 사용할 수 없습니다.")
+            return
+        
+        settings = self.load_settings()
+        settings["tts_backend"] = name
+        self.save_settings(settings)
+        await ctx.send(f"[OK] TTS 엔진이 `{name}`(으)로 변경되었습니다.")
+    
+    @tts.command(name="벤치", help="TTS 엔진별 합성 속도 측정")
+    async def benchmark_backends(self, ctx, rounds: int = 1):
+        """사용 가능한 엔진마다 같은 문장을 합성해 첫 음성까지 시간과 처리량 비교"""
+        rounds = max(1, min(rounds, 5))
+        message = await ctx.send("[INFO] TTS 엔진 벤치마크 중...")
+        
+        embed = discord.Embed(title="TTS 엔진 벤치마크", color=discord.Color.blue())
+        for name in available_backends():
+            result = await asyncio.to_thread(benchmark, get_backend(name), None, rounds)
+            if not result['clips']:
+                value = f"실패 {result['errors']}회"
+            else:
+                value = (
+                    f"첫 음성 {result['first_audio_ms']}ms · 평균 {result['avg_ms']}ms · p95 {result['p95_ms']}ms\n"
+                    f"처리량 {result['chars_per_sec']}자/초 · 성공 {result['clips']} / 실패 {result['errors']}"
+                )
+            embed.add_field(name=name, value=value, inline=False)
+        
+        await message.edit(content=None, embed=embed)
 
 async def setup(bot):
     try:
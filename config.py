@@ -21,8 +21,39 @@ DDAY_CHANNEL_ID = safe_int(os.getenv("DDAY_CHANNEL_ID"))
 DATA_DIR = "data"
 EXCEL_FILE = os.path.join(DATA_DIR, "dday.xlsx")
 DB_FILE = os.path.join(DATA_DIR, "tasks.db")
+# 구글 시트 동기화 주기 (초, 변경을 모아서 한 번에 반영)
+SHEET_SYNC_INTERVAL = safe_int(os.getenv("SHEET_SYNC_INTERVAL"), 10)
+# 재시작 등으로 놓친 알람을 늦게라도 울리는 유예 시간 (초, 넘으면 건너뜀)
+ALARM_MISFIRE_GRACE = safe_int(os.getenv("ALARM_MISFIRE_GRACE"), 300)
+# 채널 이름 변경 사이 최소 간격 (초, 채널당 10분 2회 한도는 별도로 지킴)
+CHANNEL_RENAME_SPACING = safe_int(os.getenv("CHANNEL_RENAME_SPACING"), 5)
+# 자정 D-Day 채널 새로고침에서 동시에 처리하는 서버 수
+DDAY_REFRESH_CONCURRENCY = safe_int(os.getenv("DDAY_REFRESH_CONCURRENCY"), 4)
 
 # 명령어 프리픽스
 PREFIX = "!"
 # 관리자 비밀번호
-ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "8458aa")
\ No newline at end of file
+ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "8458aa")
+# 모니터링 수집 큐
+MONITOR_QUEUE_SIZE = safe_int(os.getenv("MONITOR_QUEUE_SIZE"), 1000)
+MONITOR_BATCH_SIZE = safe_int(os.getenv("MONITOR_BATCH_SIZE"), 50)
+# 큐가 가득 찼을 때: drop_oldest (오래된 항목 버림) / spill (디스크에 보관 후 재시작 시 복구)
+MONITOR_OVERFLOW_POLICY = os.getenv("MONITOR_OVERFLOW_POLICY", "drop_oldest")
+
+# TTS 음성 캐시 최대 용량 (MB)
+TTS_CACHE_MAX_MB = safe_int(os.getenv("TTS_CACHE_MAX_MB"), 200)
+# TTS 큐: 최대 대기 시간 (초, 넘기면 건너뜀 / 0이면 제한 없음), 연속 메시지 합치기 최대 길이
+TTS_MAX_QUEUE_LATENCY = safe_int(os.getenv("TTS_MAX_QUEUE_LATENCY"), 30)
+TTS_COALESCE_MAX_CHARS = safe_int(os.getenv("TTS_COALESCE_MAX_CHARS"), 300)
+# TTS 엔진: gtts (Google, 네트워크) / espeak (espeak-ng, 오프라인) / http (로컬 TTS 서버)
+TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts")
+# http 엔진 주소 (POST {text, lang, speed} → 음성 바이트)와 응답 형식
+TTS_HTTP_URL = os.getenv("TTS_HTTP_URL", "")
+TTS_HTTP_FORMAT = os.getenv("TTS_HTTP_FORMAT", "wav")
+# TTS 설정 파일 외부 변경 감지 주기 (초, 0이면 감지 안 함)
+TTS_SETTINGS_WATCH_INTERVAL = safe_int(os.getenv("TTS_SETTINGS_WATCH_INTERVAL"), 5)
+
+# ffmpeg 실행 파일 경로 (없으면 시스템 PATH의 ffmpeg 사용)
+FFMPEG_PATH = os.getenv("FFMPEG_PATH", "F:/A/ffmpeg/ffmpeg-master-latest-win64-gpl/bin/ffmpeg.exe")
+# 음성 채널 유휴 연결 해제 시간 (초)
+VOICE_IDLE_TIMEOUT = safe_int(os.getenv("VOICE_IDLE_TIMEOUT"), 300)
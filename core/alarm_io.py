@@ -0,0 +1,153 @@
+"""
+📥 알람 일괄 가져오기 / 내보내기
+- CSV: 이름,시간,반복,채널ID,음성,오프셋 (헤더 필수, 이름 외의 열은 생략 가능)
+- JSON: alarms.json 형식 {이름: {time, repeat, channel_id, voice, offset}} 또는 [{name, ...}] 목록
+- 반복 규칙·오프셋 형식은 core.recurrence 참고
+- 전체를 먼저 검증하고, 오류가 하나라도 있으면 아무것도 반영하지 않음
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from core.recurrence import normalize_repeat, parse_offset, parse_time
+
+CSV_FIELDS = ['name', 'time', 'repeat', 'channel_id', 'voice', 'offset']
+# 한글 헤더도 허용
+HEADER_ALIASES = {
+    '이름': 'name',
+    '시간': 'time',
+    '반복': 'repeat',
+    '반복유형': 'repeat',
+    '채널': 'channel_id',
+    '채널id': 'channel_id',
+    '음성': 'voice',
+    '오프셋': 'offset'
+}
+MAX_NAME_LENGTH = 50
+MAX_IMPORT_ROWS = 500
+
+_TRUE_VALUES = {'y', 'yes', 'true', '1', '네', '예', 'o'}
+
+
+def validate_alarm(name: Any, raw: Dict[str, Any]) -> Dict[str, Any]:
+    """가져온 알람 한 개를 저장 형식으로 변환 (잘못된 값이면 ValueError)"""
+    name = str(name or "").strip()
+    if not name:
+        raise ValueError("이름이 비어 있습니다")
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"이름이 너무 깁니다 (최대 {MAX_NAME_LENGTH}자)")
+
+    repeat = normalize_repeat(str(raw.get('repeat') or ""))
+    # cron 규칙은 식에 시각이 들어 있음
+    time = "" if repeat.startswith('cron:') else parse_time(raw.get('time') or "")
+    offset = parse_offset(raw.get('offset') or 0)
+
+    channel_id = raw.get('channel_id')
+    if channel_id in (None, "", "기본"):
+        channel_id = None
+    else:
+        try:
+            channel_id = int(channel_id)
+        except (TypeError, ValueError):
+            raise ValueError(f"채널 ID가 숫자가 아닙니다: '{channel_id}'") from None
+
+    voice = raw.get('voice', False)
+    if not isinstance(voice, bool):
+        voice = str(voice).strip().lower() in _TRUE_VALUES
+
+    data = {
+        'time': time,
+        'repeat': repeat,
+        'offset': offset,
+        'created': datetime.now().isoformat(),
+        'voice': voice
+    }
+    if channel_id is not None:
+        data['channel_id'] = channel_id
+    return data
+
+
+def _read_records(filename: str, content: bytes) -> List[Tuple[str, Any, Dict[str, Any]]]:
+    """파일을 (위치, 이름, 원본 값) 목록으로 읽기"""
+    text = content.decode('utf-8-sig')
+    if filename.lower().endswith('.json'):
+        payload = json.loads(text)
+        if isinstance(payload, dict):
+            return [(f"'{name}'", name, raw if isinstance(raw, dict) else {}) for name, raw in payload.items()]
+        if isinstance(payload, list):
+            return [
+                (f"{i}번째 항목", raw.get('name') if isinstance(raw, dict) else None, raw if isinstance(raw, dict) else {})
+                for i, raw in enumerate(payload, 1)
+            ]
+        raise ValueError("JSON은 객체 또는 목록이어야 합니다")
+
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise ValueError("CSV 헤더가 없습니다")
+    reader.fieldnames = [
+        HEADER_ALIASES.get(field.strip().lower(), field.strip().lower()) for field in reader.fieldnames
+    ]
+    missing = {'name'} - set(reader.fieldnames)
+    if missing:
+        raise ValueError(f"CSV에 필수 열이 없습니다: {', '.join(sorted(missing))}")
+    # 헤더가 1행이므로 데이터는 2행부터
+    return [(f"{line}행", row.get('name'), row) for line, row in enumerate(reader, 2)]
+
+
+def parse_import(filename: str, content: bytes) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """가져올 파일 검증
+
+    (이름 -> 알람 데이터, 오류 목록)을 반환한다. 오류가 있으면 반영하지 말 것.
+    """
+    try:
+        records = _read_records(filename, content)
+    except (UnicodeDecodeError, ValueError, csv.Error) as e:
+        return {}, [f"파일을 읽을 수 없습니다: {e}"]
+
+    if len(records) > MAX_IMPORT_ROWS:
+        return {}, [f"한 번에 가져올 수 있는 알람은 최대 {MAX_IMPORT_ROWS}개입니다 ({len(records)}개)"]
+
+    alarms: Dict[str, Dict[str, Any]] = {}
+    errors = []
+    for where, name, raw in records:
+        try:
+            data = validate_alarm(name, raw)
+        except ValueError as e:
+            errors.append(f"{where}: {e}")
+            continue
+        name = str(name).strip()
+        if name in alarms:
+            errors.append(f"{where}: 이름 '{name}'이(가) 파일 안에서 중복됩니다")
+            continue
+        alarms[name] = data
+    if not alarms and not errors:
+        errors.append("가져올 알람이 없습니다")
+    return alarms, errors
+
+
+def export_alarms(alarms: Dict[str, Dict[str, Any]], fmt: str = 'csv') -> bytes:
+    """알람 목록을 CSV 또는 JSON 바이트로 (가져오기와 같은 형식)"""
+    if fmt == 'json':
+        payload = {
+            name: {key: data[key] for key in ('time', 'repeat', 'channel_id', 'voice', 'offset') if key in data}
+            for name, data in alarms.items()
+        }
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for name, data in alarms.items():
+        writer.writerow([
+            name,
+            data['time'],
+            data.get('repeat', 'once'),
+            data.get('channel_id') or "",
+            'y' if data.get('voice') else 'n',
+            data.get('offset', 0)
+        ])
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    return buffer.getvalue().encode('utf-8-sig')
@@ -0,0 +1,206 @@
+"""
+⏰ 알람 저장소 (SQLite)
+- 알람 한 개 = 한 행 (추가/삭제가 파일 전체 재작성 없이 단일 행 작업)
+- 길드별 이름 공간 (길드가 다르면 같은 이름의 알람도 따로 존재)
+- 기존 alarms.json 자동 이전
+- 반복 규칙·오프셋·마지막 발동 시각 저장 (재시작 후 놓친 알람 계산용)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+LEGACY_GUILD = 0  # 길드 구분 이전에 만든 알람 (길드를 알게 되면 옮김)
+
+_TABLE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS alarms (
+        guild_id INTEGER NOT NULL DEFAULT {LEGACY_GUILD},
+        name TEXT NOT NULL,
+        time TEXT NOT NULL,
+        repeat TEXT NOT NULL DEFAULT 'once',
+        channel_id INTEGER,
+        voice INTEGER NOT NULL DEFAULT 0,
+        created TEXT,
+        offset_minutes INTEGER NOT NULL DEFAULT 0,
+        last_fired TEXT,
+        PRIMARY KEY (guild_id, name)
+    )
+"""
+
+
+class AlarmStore:
+    """알람 데이터 저장소
+
+    길드 하나의 알람은 기존 alarms.json과 같은 형식으로 반환한다:
+    {이름: {time, repeat, created, channel_id, voice, offset, last_fired}}
+    repeat은 반복 규칙 문자열 (core.recurrence 참고)
+    """
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_TABLE_SQL)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_alarms_time ON alarms (time)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_alarms_name ON alarms (name)")
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        data = {
+            'time': row['time'],
+            'repeat': row['repeat'],
+            'created': row['created'],
+            'voice': bool(row['voice']),
+            'offset': row['offset_minutes'],
+            'last_fired': row['last_fired']
+        }
+        if row['channel_id'] is not None:
+            data['channel_id'] = row['channel_id']
+        return data
+
+    def get(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """알람 한 개 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM alarms WHERE guild_id = ? AND name = ?", (guild_id, name)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def all(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
+        """길드의 전체 알람 (시간 순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM alarms WHERE guild_id = ? ORDER BY time, name", (guild_id,)
+            ).fetchall()
+        return {row['name']: self._to_dict(row) for row in rows}
+
+    def all_guilds(self) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """모든 길드의 알람 [(guild_id, 이름, 데이터)]"""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM alarms ORDER BY guild_id, time, name").fetchall()
+        return [(row['guild_id'], row['name'], self._to_dict(row)) for row in rows]
+
+    def upsert(self, guild_id: int, name: str, data: Dict[str, Any]) -> None:
+        """알람 추가 또는 덮어쓰기"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO alarms (guild_id, name, time, repeat, channel_id, voice, created, offset_minutes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, name) DO UPDATE SET
+                    time = excluded.time,
+                    repeat = excluded.repeat,
+                    channel_id = excluded.channel_id,
+                    voice = excluded.voice,
+                    created = excluded.created,
+                    offset_minutes = excluded.offset_minutes,
+                    last_fired = NULL
+                """,
+                self._row_values(guild_id, name, data)
+            )
+
+    def upsert_many(self, guild_id: int, alarms: Dict[str, Dict[str, Any]]) -> int:
+        """여러 알람을 한 트랜잭션으로 추가 또는 덮어쓰기 (새로 추가된 개수 반환)"""
+        with self._lock, self._conn:
+            existing = {row['name'] for row in self._conn.execute(
+                "SELECT name FROM alarms WHERE guild_id = ?", (guild_id,)
+            )}
+            self._conn.executemany(
+                """
+                INSERT INTO alarms (guild_id, name, time, repeat, channel_id, voice, created, offset_minutes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, name) DO UPDATE SET
+                    time = excluded.time,
+                    repeat = excluded.repeat,
+                    channel_id = excluded.channel_id,
+                    voice = excluded.voice,
+                    created = excluded.created,
+                    offset_minutes = excluded.offset_minutes,
+                    last_fired = NULL
+                """,
+                [self._row_values(guild_id, name, data) for name, data in alarms.items()]
+            )
+        return len(set(alarms) - existing)
+
+    @staticmethod
+    def _row_values(guild_id: int, name: str, data: Dict[str, Any]) -> tuple:
+        return (
+            guild_id,
+            name,
+            data['time'],
+            data.get('repeat', 'once'),
+            data.get('channel_id'),
+            int(bool(data.get('voice', False))),
+            data.get('created'),
+            int(data.get('offset', 0))
+        )
+
+    def delete(self, guild_id: int, name: str) -> bool:
+        """알람 삭제 (있었으면 True)"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM alarms WHERE guild_id = ? AND name = ?", (guild_id, name)
+            )
+        return cursor.rowcount > 0
+
+    def clear(self, guild_id: int) -> List[str]:
+        """길드의 모든 알람 삭제 (삭제한 이름 반환)"""
+        with self._lock, self._conn:
+            names = [row['name'] for row in self._conn.execute(
+                "SELECT name FROM alarms WHERE guild_id = ?", (guild_id,)
+            )]
+            self._conn.execute("DELETE FROM alarms WHERE guild_id = ?", (guild_id,))
+        return names
+
+    def mark_fired(self, keys: List[Tuple[int, str]], fired_at: str) -> None:
+        """발동한 알람들의 마지막 발동 시각을 한 번에 기록"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE alarms SET last_fired = ? WHERE guild_id = ? AND name = ?",
+                [(fired_at, guild_id, name) for guild_id, name in keys]
+            )
+
+    def move(self, name: str, from_guild: int, to_guild: int) -> bool:
+        """알람을 다른 길드로 옮기기 (대상 길드에 같은 이름이 있으면 False)"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE OR IGNORE alarms SET guild_id = ? WHERE guild_id = ? AND name = ?",
+                (to_guild, from_guild, name)
+            )
+        return cursor.rowcount > 0
+
+    def migrate_json(self, json_file: str) -> int:
+        """기존 alarms.json을 한 트랜잭션으로 옮기고 파일 이름을 바꿔 둠 (옮긴 개수 반환)
+
+        길드 정보가 없으므로 LEGACY_GUILD로 넣고, 봇이 준비되면 길드를 찾아 옮긴다.
+        """
+        if not os.path.exists(json_file):
+            return 0
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                alarms = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[WARNING] 기존 알람 파일 읽기 실패: {e}")
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO alarms (guild_id, name, time, repeat, channel_id, voice, created, offset_minutes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [self._row_values(LEGACY_GUILD, name, data) for name, data in alarms.items()]
+            )
+        os.replace(json_file, f"{json_file}.migrated")
+        print(f"[OK] 알람 {len(alarms)}개를 {self.db_file}로 이전")
+        return len(alarms)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,194 @@
+"""
+🔊 음성 파일 캐시
+- (텍스트, 언어, 속도, 엔진) 해시 기반 파일명
+- 크기/마지막 사용 시각 추적
+- 디스크 용량 제한 LRU 삭제
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+_CACHE_KEY = re.compile(r'[0-9a-f]{64}')  # make_key 결과 (sha256 hex)
+
+
+class AudioCache:
+    """내용 주소 기반 음성 파일 캐시
+
+    같은 문장·언어·속도는 항상 같은 파일을 가리키고, 앞부분만 같은 다른 문장은
+    다른 파일이 된다. 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 삭제.
+    합성 스레드 여러 개에서 동시에 호출해도 안전하다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, index_file: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_file = index_file or os.path.join(cache_dir, "index.json")
+        # key -> {'file', 'size', 'last_access', 'created', 'text', 'companions'} (오래된 사용 순)
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(text: str, lang: str = 'ko', speed: float = 1.0, voice: str = 'gtts') -> str:
+        """캐시 키 (내용 해시 - 엔진이 다르면 다른 파일)"""
+        payload = json.dumps([text, lang, round(float(speed), 2), voice], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str, ext: str = "mp3") -> str:
+        """키에 해당하는 파일 경로"""
+        return os.path.join(self.cache_dir, f"{key}.{ext}")
+
+    def contains(self, key: str) -> bool:
+        """캐시에 있는지만 확인 (적중 통계·사용 순서에 반영하지 않음)"""
+        with self._lock:
+            entry = self.entries.get(key)
+            return bool(entry) and os.path.exists(entry['file'])
+
+    def lookup(self, key: str) -> Optional[str]:
+        """캐시 조회 (적중 시 파일 경로, 아니면 None)"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry and os.path.exists(entry['file']):
+                entry['last_access'] = time.time()
+                self.entries.move_to_end(key)
+                self.hits += 1
+                self._dirty = True
+                return entry['file']
+
+            if entry:
+                # 인덱스에는 있지만 파일이 사라진 경우
+                self._forget(key)
+            self.misses += 1
+            return None
+
+    def store(self, key: str, file_path: str, text: str = "") -> None:
+        """새로 만든 파일을 캐시에 등록하고 용량 초과분 정리"""
+        size = os.path.getsize(file_path)
+        now = time.time()
+        with self._lock:
+            if key in self.entries:
+                self._forget(key)
+
+            self.entries[key] = {
+                'file': file_path,
+                'size': size,
+                'last_access': now,
+                'created': now,
+                'text': text[:50]
+            }
+            self.total_bytes += size
+            # 인덱스는 주기적으로(또는 종료 시) 저장 - 저장 전에 종료돼도 다음 시작 때 파일을 다시 등록함
+            self._dirty = True
+            self._evict()
+
+    def attach(self, key: str, file_path: str) -> None:
+        """항목에 딸린 파일(예: Opus 인코딩본) 등록 - 용량에 합산되고 함께 삭제됨"""
+        size = os.path.getsize(file_path)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return
+            companions = entry.setdefault('companions', [])
+            if file_path in companions:
+                return
+            companions.append(file_path)
+            entry['size'] += size
+            self.total_bytes += size
+            self._dirty = True
+            self._evict()
+
+    def _forget(self, key: str) -> None:
+        entry = self.entries.pop(key)
+        self.total_bytes -= entry['size']
+        self._dirty = True
+
+    def _evict(self) -> None:
+        """용량 제한을 넘으면 LRU 순서로 삭제 (방금 넣은 항목은 유지)"""
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            key, entry = next(iter(self.entries.items()))
+            self._forget(key)
+            for path in [entry['file'], *entry.get('companions', [])]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"[WARNING] 캐시 파일 삭제 실패: {e}")
+            self.evictions += 1
+
+    def _load_index(self) -> None:
+        """인덱스 로드 + 인덱스에 없는 기존 파일도 LRU 대상으로 편입"""
+        entries = {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('entries', {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        known_files = {
+            os.path.abspath(path)
+            for e in entries.values()
+            for path in [e['file'], *e.get('companions', [])]
+        }
+        index_path = os.path.abspath(self.index_file)
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if (os.path.abspath(path).startswith(index_path) or name.endswith('.part')
+                    or not os.path.isfile(path)):
+                continue
+            if os.path.abspath(path) not in known_files:
+                stat = os.stat(path)
+                # 인덱스를 저장하기 전에 종료돼 빠진 캐시 파일(<키>.<확장자>)은 원래 키로 복구
+                stem, _, ext = name.partition('.')
+                key = stem if _CACHE_KEY.fullmatch(stem) and '.' not in ext else f"legacy:{name}"
+                entries[key] = {
+                    'file': path,
+                    'size': stat.st_size,
+                    'last_access': stat.st_mtime,
+                    'created': stat.st_mtime,
+                    'text': ""
+                }
+                self._dirty = True
+
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]['last_access']):
+            if os.path.exists(entry['file']):
+                self.entries[key] = entry
+                self.total_bytes += entry['size']
+        self._evict()
+
+    def flush(self) -> None:
+        """인덱스 저장 (변경이 있을 때만)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_file = f"{self.index_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self.entries}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.index_file)
+            self._dirty = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': f"{(self.hits / total * 100) if total else 0:.1f}%",
+            'entries': len(self.entries),
+            'size_mb': round(self.total_bytes / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+            'evictions': self.evictions
+        }
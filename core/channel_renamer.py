@@ -0,0 +1,160 @@
+"""
+🏷️ 채널 이름 변경 예약
+- 디스코드는 채널 이름 변경을 채널마다 10분에 2번까지만 허용
+- 이미 원하는 이름이면 요청하지 않고, 같은 채널의 대기 요청은 마지막 이름만 반영
+- 채널별 한도와 전체 간격을 지키며 백그라운드에서 하나씩 변경
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+import discord
+
+RENAME_LIMIT = 2        # 채널당 허용 횟수
+RENAME_WINDOW = 600.0   # 한도 기준 시간 (초)
+
+
+class ChannelRenameScheduler:
+    """채널 이름 변경을 한도에 맞춰 나눠 보내는 워커"""
+
+    def __init__(self, spacing: float = 5.0, limit: int = RENAME_LIMIT, window: float = RENAME_WINDOW):
+        self.spacing = spacing  # 서로 다른 채널 사이에도 두는 최소 간격
+        self.limit = limit
+        self.window = window
+        # 채널 ID -> (채널, 원하는 이름)
+        self.pending: "OrderedDict[int, Tuple[Any, str]]" = OrderedDict()
+        self.history: Dict[int, deque] = {}  # 채널 ID -> 최근 변경 시각 (monotonic)
+        self.last_edit = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {
+            'requested': 0,
+            'unchanged': 0,
+            'coalesced': 0,
+            'renamed': 0,
+            'errors': 0,
+            'last_error': ""
+        }
+
+    # ---- 요청 (즉시 반환) ----
+
+    def request(self, channel, name: str) -> bool:
+        """채널 이름 변경 예약 (변경이 필요 없으면 False)"""
+        self.stats['requested'] += 1
+        if channel.name == name:
+            # 대기 중이던 다른 이름도 더 이상 필요 없음
+            self.pending.pop(channel.id, None)
+            self.stats['unchanged'] += 1
+            return False
+        if channel.id in self.pending:
+            self.stats['coalesced'] += 1
+        self.pending[channel.id] = (channel, name)
+        self._wake()
+        return True
+
+    def forget(self, channel_id: int) -> None:
+        """삭제된 채널의 대기 요청 제거"""
+        self.pending.pop(channel_id, None)
+        self.history.pop(channel_id, None)
+
+    def _wake(self) -> None:
+        if self._wakeup:
+            self._wakeup.set()
+
+    # ---- 한도 계산 ----
+
+    def ready_at(self, channel_id: int, now: Optional[float] = None) -> float:
+        """이 채널 이름을 바꿀 수 있는 가장 이른 시각 (monotonic)"""
+        now = time.monotonic() if now is None else now
+        recent = self.history.get(channel_id)
+        while recent and recent[0] <= now - self.window:
+            recent.popleft()
+        ready = now
+        if recent and len(recent) >= self.limit:
+            ready = recent[0] + self.window
+        return max(ready, self.last_edit + self.spacing)
+
+    def pending_renames(self) -> List[Dict[str, Any]]:
+        """대기 중인 변경 목록 (예상 대기 시간 순)"""
+        now = time.monotonic()
+        renames = [
+            {
+                'channel': channel,
+                'current': channel.name,
+                'name': name,
+                'wait': max(0.0, self.ready_at(channel_id, now) - now)
+            }
+            for channel_id, (channel, name) in self.pending.items()
+        ]
+        return sorted(renames, key=lambda item: item['wait'])
+
+    # ---- 워커 ----
+
+    def start(self) -> None:
+        if self._worker and not self._worker.done():
+            return
+        self._wakeup = asyncio.Event()
+        if self.pending:
+            self._wakeup.set()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            if not self.pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            channel_id, ready = min(
+                ((channel_id, self.ready_at(channel_id, now)) for channel_id in self.pending),
+                key=lambda item: item[1]
+            )
+            if ready > now:
+                # 기다리는 동안 새 요청이 오면 순서를 다시 계산
+                self._wakeup.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=ready - now)
+                continue
+
+            await self._rename(channel_id)
+
+    async def _rename(self, channel_id: int) -> None:
+        channel, name = self.pending.pop(channel_id)
+        if channel.name == name:
+            self.stats['unchanged'] += 1
+            return
+
+        now = time.monotonic()
+        self.last_edit = now
+        self.history.setdefault(channel_id, deque()).append(now)
+        try:
+            await channel.edit(name=name)
+            self.stats['renamed'] += 1
+            print(f"[OK] 채널 이름 변경: {name}")
+        except discord.NotFound:
+            self.forget(channel_id)
+        except discord.HTTPException as e:
+            self.stats['errors'] += 1
+            self.stats['last_error'] = str(e)
+            if e.status == 429:
+                # 다른 곳에서 이미 이름을 바꿨음 → 한도가 찬 것으로 보고 다시 예약
+                recent = self.history[channel_id]
+                recent.extend([now] * max(0, self.limit - len(recent)))
+                self.pending.setdefault(channel_id, (channel, name))
+            print(f"[WARNING] 채널 이름 변경 실패 ({name}): {e}")
+        except Exception as e:
+            # 예상하지 못한 오류도 기록만 하고 다음 요청을 계속 처리
+            self.stats['errors'] += 1
+            self.stats['last_error'] = str(e)
+            print(f"[ERROR] 채널 이름 변경 오류 ({name}): {e}")
@@ -9,10 +9,125 @@ import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from array import array
+import base64
+import hashlib
+import math
+import re
 import statistics
 import os
 from core.cache_manager import memory_cache
 
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 순수 파이썬 집계로 대체
+    np = None
+
+DAYS = ['월', '화', '수', '목', '금', '토', '일']
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+# 시각 뒤의 UTC 오프셋 (+09:00, -0500, Z)
+_TZ_SUFFIX = re.compile(r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)(?:Z|[+-]\d{2}:?\d{2})$')
+
+
+def _parse_epochs(timestamps: List[Any]) -> List[int]:
+    """ISO 타임스탬프를 epoch 초로 변환 (잘못된 값은 제외, 벽시계 시각 기준)"""
+    epochs = []
+    for value in timestamps:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            continue
+        epochs.append(
+            (parsed.toordinal() - _EPOCH_ORDINAL) * 86400
+            + parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+        )
+    return epochs
+
+
+def timestamps_to_epoch(timestamps: List[Any]):
+    """타임스탬프 배치를 epoch 초 int64 배열로 한 번에 변환
+
+    numpy가 ISO 문자열을 일괄 파싱하고, 형식이 섞여 실패할 때만 개별 파싱한다.
+    numpy는 오프셋이 붙은 문자열을 UTC로 바꾸므로, 개별 파싱과 같은 벽시계 시각이
+    되도록 오프셋을 먼저 떼어 낸다.
+    """
+    if np is None:
+        return _parse_epochs(timestamps)
+    timestamps = [
+        _TZ_SUFFIX.sub(r'\1', value) if isinstance(value, str) else value for value in timestamps
+    ]
+    try:
+        parsed = np.array(timestamps, dtype='datetime64[us]')
+    except (ValueError, TypeError):
+        return np.array(_parse_epochs(timestamps), dtype=np.int64)
+    parsed = parsed[~np.isnat(parsed)]
+    return parsed.astype('datetime64[s]').astype(np.int64)
+
+
+def bucket_timestamps(timestamps: List[Any]) -> Dict[str, Any]:
+    """요일×시간, 시간별, 일별 히스토그램 (bincount 기반 열 단위 집계)
+
+    반환값의 weekday_hour는 [요일][시간] 7×24, hourly는 24칸,
+    daily는 first_day부터의 일별 카운트
+    """
+    epochs = timestamps_to_epoch(timestamps)
+    
+    if np is None:
+        weekday_hour = [[0] * 24 for _ in range(7)]
+        hourly = [0] * 24
+        day_counts = Counter()
+        for epoch in epochs:
+            day, hour = epoch // 86400, epoch % 86400 // 3600
+            weekday_hour[(day + 3) % 7][hour] += 1  # 1970-01-01은 목요일
+            hourly[hour] += 1
+            day_counts[day] += 1
+        first_day = min(day_counts) if day_counts else 0
+        daily = [day_counts[d] for d in range(first_day, max(day_counts) + 1)] if day_counts else []
+    else:
+        days = epochs // 86400
+        hours = epochs % 86400 // 3600
+        weekdays = (days + 3) % 7  # 1970-01-01은 목요일
+        weekday_hour = np.bincount(weekdays * 24 + hours, minlength=168).reshape(7, 24)
+        hourly = np.bincount(hours, minlength=24)
+        first_day = int(days.min()) if len(days) else 0
+        daily = np.bincount(days - first_day) if len(days) else np.zeros(0, dtype=np.int64)
+    
+    return {
+        'weekday_hour': weekday_hour,
+        'hourly': hourly,
+        'daily': daily,
+        'first_day': (_EPOCH + timedelta(days=int(first_day))).date(),
+        'total': len(epochs)
+    }
+
+
+def format_heatmap(weekday_hour) -> Dict[str, List[Dict]]:
+    """7×24 행렬을 시각화용 딕셔너리 목록으로 변환"""
+    return {
+        'heatmap': [
+            {
+                'day': DAYS[day_idx],
+                'hour': f"{hour:02d}:00",
+                'count': int(weekday_hour[day_idx][hour]),
+                'day_idx': day_idx,
+                'hour_idx': hour
+            }
+            for day_idx in range(7)
+            for hour in range(24)
+        ]
+    }
+
+
+def format_daily(buckets: Dict[str, Any]) -> Dict[str, int]:
+    """일별 히스토그램을 {YYYY-MM-DD: count}로 변환"""
+    first_day = buckets['first_day']
+    return {
+        (first_day + timedelta(days=offset)).isoformat(): int(count)
+        for offset, count in enumerate(buckets['daily'])
+        if count
+    }
+
 class DataAnalyzer:
     """데이터 분석 엔진"""
     
@@ -108,41 +223,29 @@ class DataAnalyzer:
         
         return trends
     
+    def time_buckets(self, discord_data: List[Dict]) -> Dict[str, Any]:
+        """메시지 목록의 시간대 히스토그램 (열 단위 집계)"""
+        return bucket_timestamps([msg.get('timestamp') for msg in discord_data])
+    
     def generate_heatmap_data(self, discord_data: List[Dict]) -> Dict[str, List[Dict]]:
         """Discord 활동 히트맵 데이터 생성"""
-        heatmap = defaultdict(lambda: defaultdict(int))
-        
-        for msg in discord_data:
-            try:
-                timestamp = datetime.fromisoformat(msg['timestamp'])
-                hour = timestamp.hour
-                day = timestamp.weekday()  # 0=월요일
-                
-                heatmap[day][hour] += 1
-            except (ValueError, KeyError):
-                continue
-        
-        # 시각화 형식으로 변환
-        result = []
-        days = ['월', '화', '수', '목', '금', '토', '일']
-        
-        for day_idx in range(7):
-            for hour in range(24):
-                result.append({
-                    'day': days[day_idx],
-                    'hour': f"{hour:02d}:00",
-                    'count': heatmap[day_idx][hour],
-                    'day_idx': day_idx,
-                    'hour_idx': hour
-                })
-        
-        return {'heatmap': result}
+        return format_heatmap(self.time_buckets(discord_data)['weekday_hour'])
+    
+    def generate_daily_activity(self, discord_data: List[Dict]) -> Dict[str, int]:
+        """일별 메시지 수"""
+        return format_daily(self.time_buckets(discord_data))
     
-    def calculate_engagement_metrics(self, discord_data: List[Dict]) -> Dict[str, Any]:
-        """참여도 지표 계산"""
+    def calculate_engagement_metrics(self, discord_data: List[Dict], approximate: bool = False) -> Dict[str, Any]:
+        """참여도 지표 계산
+
+        approximate=True면 전체 Counter 대신 고정 메모리 스케치로 계산
+        """
         if not discord_data:
             return {'error': '데이터 없음'}
         
+        if approximate:
+            return self.build_engagement_sketch(discord_data).engagement_metrics()
+        
         # 사용자별 메시지 수
         user_messages = Counter(msg.get('author', '불명') for msg in discord_data)
         
@@ -150,13 +253,8 @@ class DataAnalyzer:
         channel_activity = Counter(msg.get('channel', '불명') for msg in discord_data)
         
         # 시간대별 활동
-        hour_activity = defaultdict(int)
-        for msg in discord_data:
-            try:
-                timestamp = datetime.fromisoformat(msg['timestamp'])
-                hour_activity[timestamp.hour] += 1
-            except (ValueError, KeyError):
-                continue
+        hourly = self.time_buckets(discord_data)['hourly']
+        hour_activity = {hour: int(count) for hour, count in enumerate(hourly) if count}
         
         # 평균 메시지 길이
         message_lengths = [
@@ -180,28 +278,59 @@ class DataAnalyzer:
             'engagement_score': self._calculate_engagement_score(user_messages, message_lengths)
         }
     
+    def build_engagement_sketch(self, discord_data: List[Dict]) -> 'StreamingAggregator':
+        """메시지 목록을 병합 가능한 스케치로 요약"""
+        sketch = StreamingAggregator()
+        for msg in discord_data:
+            sketch.add(msg)
+        return sketch
+    
+    def merge_engagement_sketches(self, sketches: List['StreamingAggregator']) -> 'StreamingAggregator':
+        """여러 구간의 스케치 병합"""
+        merged = StreamingAggregator()
+        for sketch in sketches:
+            merged.merge(sketch)
+        return merged
+    
+    def save_engagement_sketch(self, sketch: 'StreamingAggregator', day: datetime,
+                               stats_dir: str = "data/stats") -> str:
+        """일별 스케치를 통계 디렉토리에 저장"""
+        os.makedirs(stats_dir, exist_ok=True)
+        filename = os.path.join(stats_dir, f"engagement_{day.strftime('%Y%m%d')}.json")
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({'date': day.strftime('%Y-%m-%d'), 'sketch': sketch.to_dict()}, f, ensure_ascii=False)
+        return filename
+    
+    def load_engagement_sketch(self, day: datetime, stats_dir: str = "data/stats") -> Optional['StreamingAggregator']:
+        """저장된 일별 스케치 로드 (없으면 None)"""
+        filename = os.path.join(stats_dir, f"engagement_{day.strftime('%Y%m%d')}.json")
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                return StreamingAggregator.from_dict(json.load(f)['sketch'])
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            return None
+    
+    def load_engagement_window(self, days: int = 7, end: Optional[datetime] = None,
+                               stats_dir: str = "data/stats",
+                               loaded: Optional[Dict[Any, 'StreamingAggregator']] = None) -> 'StreamingAggregator':
+        """최근 N일 스케치를 병합해 하나의 구간으로 반환
+
+        loaded: 날짜(date) -> 스케치. 아직 저장하지 않은 구간은 파일 대신 이것을 사용
+        """
+        end = end or datetime.now()
+        loaded = loaded or {}
+        sketches = []
+        for offset in range(days):
+            day = end - timedelta(days=offset)
+            if (sketch := loaded.get(day.date()) or self.load_engagement_sketch(day, stats_dir)):
+                sketches.append(sketch)
+        return self.merge_engagement_sketches(sketches)
+    
     def _calculate_engagement_score(self, user_messages: Counter, message_lengths: List[int]) -> float:
         """참여도 점수 계산 (0-100)"""
-        # 활성 사용자 비중 (최대 40점)
-        if user_messages:
-            active_users_ratio = min(len(user_messages), 100) / 100 * 40
-        else:
-            active_users_ratio = 0
-        
-        # 메시지 길이 (최대 30점)
         avg_length = statistics.mean(message_lengths) if message_lengths else 0
-        length_score = min(avg_length / 100, 1) * 30
-        
-        # 메시지 분포 (최대 30점)
-        # 고르게 분포되어 있으면 높은 점수
-        if user_messages:
-            variance = statistics.variance(user_messages.values()) if len(user_messages) > 1 else 0
-            distribution_score = max(0, 30 - (variance / 100))
-        else:
-            distribution_score = 0
-        
-        total_score = active_users_ratio + length_score + distribution_score
-        return round(min(total_score, 100), 2)
+        variance = statistics.variance(user_messages.values()) if len(user_messages) > 1 else 0
+        return engagement_score(len(user_messages), avg_length, variance)
     
     def compare_builds(self, build1: Dict, build2: Dict) -> Dict[str, Any]:
         """두 빌드 비교 분석"""
@@ -243,6 +372,327 @@ class DataAnalyzer:
         return comparison
 
 
+def engagement_score(unique_users: int, avg_length: float, variance: float) -> float:
+    """참여도 점수 계산 (0-100)
+
+    전체 메시지 목록 대신 요약 통계만 받으므로 증분 집계기에서도 사용
+    """
+    # 활성 사용자 비중 (최대 40점)
+    active_users_ratio = min(unique_users, 100) / 100 * 40 if unique_users else 0
+    
+    # 메시지 길이 (최대 30점)
+    length_score = min(avg_length / 100, 1) * 30
+    
+    # 메시지 분포 (최대 30점)
+    # 고르게 분포되어 있으면 높은 점수
+    distribution_score = max(0, 30 - (variance / 100)) if unique_users else 0
+    
+    total_score = active_users_ratio + length_score + distribution_score
+    return round(min(total_score, 100), 2)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 근사 스케치 (고정 메모리, 시간 구간끼리 병합 가능)
+# ═══════════════════════════════════════════════════════════════
+
+def _hash64(key: str) -> int:
+    """문자열의 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HyperLogLog:
+    """고유 항목 수 근사 (HyperLogLog)
+
+    레지스터 2^p 바이트만 사용하며, 표준 오차는 약 1.04/sqrt(2^p)
+    (p=12 → 4KB, 약 1.6%)
+    """
+    
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+    
+    def add(self, key: str) -> None:
+        h = _hash64(key)
+        idx = h >> (64 - self.p)
+        rest = (h << self.p) & 0xFFFFFFFFFFFFFFFF
+        rank = 64 - self.p + 1 if rest == 0 else 64 - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+    
+    def count(self) -> int:
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        estimate = alpha * self.m * self.m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.m and zeros:
+            # 작은 범위 보정 (linear counting)
+            estimate = self.m * math.log(self.m / zeros)
+        return int(round(estimate))
+    
+    def merge(self, other: 'HyperLogLog') -> None:
+        if other.p != self.p:
+            raise ValueError("정밀도(p)가 다른 HyperLogLog는 병합할 수 없습니다")
+        self.registers = bytearray(max(a, b) for a, b in zip(self.registers, other.registers))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'p': self.p, 'registers': base64.b64encode(bytes(self.registers)).decode('ascii')}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HyperLogLog':
+        hll = cls(data['p'])
+        hll.registers = bytearray(base64.b64decode(data['registers']))
+        return hll
+
+
+class CountMinSketch:
+    """빈도 근사 (Count-Min)
+
+    추정값은 실제 빈도 이상이며, 오차는 전체 합의 약 e/width 이내
+    """
+    
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.tables = [array('Q', [0]) * width for _ in range(depth)]
+    
+    def _indexes(self, key: str):
+        h = _hash64(key)
+        h1, h2 = h & 0xFFFFFFFF, h >> 32
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+    
+    def add(self, key: str, count: int = 1) -> int:
+        """빈도 추가 후 추가 전 추정값 반환"""
+        indexes = self._indexes(key)
+        before = min(table[i] for table, i in zip(self.tables, indexes))
+        for table, i in zip(self.tables, indexes):
+            table[i] += count
+        return before
+    
+    def estimate(self, key: str) -> int:
+        return min(table[i] for table, i in zip(self.tables, self._indexes(key)))
+    
+    def inner_product(self, other: 'CountMinSketch') -> int:
+        """두 스트림 빈도 벡터의 내적 근사 (Σ f1(x)·f2(x))"""
+        self._check_shape(other)
+        return min(
+            sum(a * b for a, b in zip(t1, t2))
+            for t1, t2 in zip(self.tables, other.tables)
+        )
+    
+    def merge(self, other: 'CountMinSketch') -> None:
+        self._check_shape(other)
+        for t1, t2 in zip(self.tables, other.tables):
+            for i, value in enumerate(t2):
+                if value:
+                    t1[i] += value
+    
+    def _check_shape(self, other: 'CountMinSketch') -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("크기가 다른 Count-Min 스케치는 병합할 수 없습니다")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'tables': [base64.b64encode(t.tobytes()).decode('ascii') for t in self.tables]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CountMinSketch':
+        cms = cls(data['width'], data['depth'])
+        for i, encoded in enumerate(data['tables']):
+            cms.tables[i] = array('Q')
+            cms.tables[i].frombytes(base64.b64decode(encoded))
+        return cms
+
+
+class SpaceSaving:
+    """상위 k개 빈출 항목 근사 (Space-Saving)
+
+    최대 k개 카운터만 유지하며, 실제 빈도가 전체의 1/k를 넘는 항목은 반드시 포함
+    """
+    
+    def __init__(self, k: int = 50):
+        self.k = k
+        self.counters: Dict[str, int] = {}
+    
+    def add(self, key: str, count: int = 1) -> None:
+        if key in self.counters:
+            self.counters[key] += count
+        elif len(self.counters) < self.k:
+            self.counters[key] = count
+        else:
+            # 가장 작은 카운터를 새 항목이 물려받음
+            victim = min(self.counters, key=self.counters.get)
+            self.counters[key] = self.counters.pop(victim) + count
+    
+    def __getitem__(self, key: str) -> int:
+        return self.counters.get(key, 0)
+    
+    def __len__(self) -> int:
+        return len(self.counters)
+    
+    def __bool__(self) -> bool:
+        return bool(self.counters)
+    
+    def _floor(self) -> int:
+        """추적하지 않는 항목의 빈도 상한"""
+        return min(self.counters.values()) if len(self.counters) >= self.k else 0
+    
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return Counter(self.counters).most_common(n)
+    
+    def merge(self, other: 'SpaceSaving') -> None:
+        floor_self, floor_other = self._floor(), other._floor()
+        merged = {
+            key: self.counters.get(key, floor_self) + other.counters.get(key, floor_other)
+            for key in set(self.counters) | set(other.counters)
+        }
+        self.k = max(self.k, other.k)
+        self.counters = dict(Counter(merged).most_common(self.k))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'k': self.k, 'counters': self.counters}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SpaceSaving':
+        sketch = cls(data['k'])
+        sketch.counters = dict(data['counters'])
+        return sketch
+
+
+class StreamingAggregator:
+    """메시지 스트림 증분 집계기
+
+    메시지가 들어올 때마다 스케치와 요일×시간 히트맵을 갱신하므로,
+    지표 조회 시 전체 기록을 다시 훑지 않는다. 사용자/채널/서버 수와 관계없이
+    메모리 사용량이 일정하며, 다른 구간의 집계기와 병합할 수 있다.
+    """
+    
+    def __init__(self, top_k: int = 50):
+        self.total_messages = 0
+        self.total_length = 0
+        self.unique_users = HyperLogLog()
+        self.user_frequency = CountMinSketch()
+        self.user_messages = SpaceSaving(top_k)
+        self.channel_activity = SpaceSaving(top_k)
+        self.server_activity = SpaceSaving(top_k)
+        self.hour_activity = [0] * 24
+        self.heatmap = [[0] * 24 for _ in range(7)]  # [요일][시간], 0=월요일
+        # 사용자별 메시지 수 제곱합 근사 (분산을 O(1)로 계산하기 위함)
+        self._user_square_sum = 0
+    
+    def add(self, record: Dict[str, Any], timestamp: Optional[datetime] = None) -> None:
+        """메시지 한 건 반영
+
+        timestamp를 넘기면 ISO 문자열 파싱을 건너뛴다.
+        """
+        if timestamp is None:
+            try:
+                timestamp = datetime.fromisoformat(record['timestamp'])
+            except (ValueError, KeyError, TypeError):
+                timestamp = None
+        
+        author = record.get('author', '불명')
+        previous = self.user_frequency.add(author)
+        self._user_square_sum += 2 * previous + 1
+        self.unique_users.add(author)
+        self.user_messages.add(author)
+        
+        self.channel_activity.add(record.get('channel', '불명'))
+        self.server_activity.add(record.get('server', 'Unknown'))
+        self.total_messages += 1
+        self.total_length += len(record.get('content', ''))
+        
+        if timestamp is not None:
+            self.hour_activity[timestamp.hour] += 1
+            self.heatmap[timestamp.weekday()][timestamp.hour] += 1
+    
+    def merge(self, other: 'StreamingAggregator') -> None:
+        """다른 구간의 집계 결과 병합"""
+        # (a+b)^2 = a^2 + b^2 + 2ab → 교차항은 Count-Min 내적으로 근사
+        cross = self.user_frequency.inner_product(other.user_frequency)
+        self._user_square_sum += other._user_square_sum + 2 * cross
+        
+        self.total_messages += other.total_messages
+        self.total_length += other.total_length
+        self.unique_users.merge(other.unique_users)
+        self.user_frequency.merge(other.user_frequency)
+        self.user_messages.merge(other.user_messages)
+        self.channel_activity.merge(other.channel_activity)
+        self.server_activity.merge(other.server_activity)
+        self.hour_activity = [a + b for a, b in zip(self.hour_activity, other.hour_activity)]
+        self.heatmap = [
+            [a + b for a, b in zip(row, other_row)]
+            for row, other_row in zip(self.heatmap, other.heatmap)
+        ]
+    
+    def _user_variance(self, users: int) -> float:
+        """사용자별 메시지 수의 표본 분산"""
+        if users < 2:
+            return 0
+        mean = self.total_messages / users
+        return max(0, (self._user_square_sum - users * mean * mean) / (users - 1))
+    
+    def engagement_metrics(self) -> Dict[str, Any]:
+        """calculate_engagement_metrics와 같은 형식의 참여도 지표 (근사)"""
+        if not self.total_messages:
+            return {'error': '데이터 없음'}
+        
+        unique_users = max(1, self.unique_users.count())
+        avg_length = self.total_length / self.total_messages
+        
+        return {
+            'total_messages': self.total_messages,
+            'unique_users': unique_users,
+            'messages_per_user': round(self.total_messages / unique_users, 2),
+            'most_active_users': dict(self.user_messages.most_common(10)),
+            'most_active_channels': dict(self.channel_activity.most_common(10)),
+            'peak_hours': sorted(
+                [(hour, count) for hour, count in enumerate(self.hour_activity) if count],
+                key=lambda x: x[1],
+                reverse=True
+            )[:5],
+            'average_message_length': round(avg_length, 2),
+            'engagement_score': engagement_score(unique_users, avg_length, self._user_variance(unique_users)),
+            'approximate': True
+        }
+    
+    def heatmap_data(self) -> Dict[str, List[Dict]]:
+        """generate_heatmap_data와 같은 형식의 히트맵"""
+        return format_heatmap(self.heatmap)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장용 직렬화"""
+        return {
+            'total_messages': self.total_messages,
+            'total_length': self.total_length,
+            'user_square_sum': self._user_square_sum,
+            'unique_users': self.unique_users.to_dict(),
+            'user_frequency': self.user_frequency.to_dict(),
+            'user_messages': self.user_messages.to_dict(),
+            'channel_activity': self.channel_activity.to_dict(),
+            'server_activity': self.server_activity.to_dict(),
+            'hour_activity': self.hour_activity,
+            'heatmap': self.heatmap
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StreamingAggregator':
+        aggregator = cls()
+        aggregator.total_messages = data['total_messages']
+        aggregator.total_length = data['total_length']
+        aggregator._user_square_sum = data['user_square_sum']
+        aggregator.unique_users = HyperLogLog.from_dict(data['unique_users'])
+        aggregator.user_frequency = CountMinSketch.from_dict(data['user_frequency'])
+        aggregator.user_messages = SpaceSaving.from_dict(data['user_messages'])
+        aggregator.channel_activity = SpaceSaving.from_dict(data['channel_activity'])
+        aggregator.server_activity = SpaceSaving.from_dict(data['server_activity'])
+        aggregator.hour_activity = list(data['hour_activity'])
+        aggregator.heatmap = [list(row) for row in data['heatmap']]
+        return aggregator
+
+
 class AnalysisReporter:
     """분석 보고서 생성기"""
     
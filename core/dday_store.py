@@ -0,0 +1,257 @@
+"""
+📅 D-Day 저장소
+- 시작할 때 XLSX를 한 번만 읽고, 이후 조회는 메모리에서 (이벤트 루프 차단 없음)
+- 변경은 잠시 모았다가 스레드에서 XLSX 전체를 다시 저장 (write-behind)
+- D-Day 열은 저장할 때 그날 기준으로 다시 계산
+- 길드(서버)별 목록, D-Day 채널 매핑은 같은 파일의 '채널' 시트에 저장 (재시작 후에도 유지)
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import suppress
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import openpyxl
+from openpyxl.styles import Alignment, Font, PatternFill
+
+from config import EXCEL_FILE
+
+HEADERS = ["이름", "목표날짜", "D-Day", "생성일", "상태", "길드ID"]
+CHANNEL_SHEET = "채널"
+CHANNEL_HEADERS = ["길드ID", "이름", "채널ID"]
+LEGACY_GUILD = 0  # 길드 구분 이전에 만든 D-Day (길드를 알게 되면 옮김)
+
+Key = Tuple[int, str]  # (길드 ID, 이름)
+
+
+def calculate_dday(target_date) -> int:
+    """D-Day 계산 (목표 날짜 - 현재, 일 단위)"""
+    if isinstance(target_date, str):
+        target_date = datetime.strptime(target_date, "%Y-%m-%d")
+    return (target_date - datetime.now()).days
+
+
+def _to_id(value) -> int:
+    """엑셀 셀 값을 디스코드 ID로 (비어 있거나 잘못되면 0)"""
+    with suppress(TypeError, ValueError):
+        return int(str(value).strip())
+    return 0
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """엑셀 셀 값(날짜/문자열)을 자정 기준 datetime으로"""
+    if isinstance(value, datetime):
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if hasattr(value, 'year'):
+        return datetime(value.year, value.month, value.day)
+    with suppress(TypeError, ValueError):
+        return datetime.strptime(str(value).strip()[:10], "%Y-%m-%d")
+    return None
+
+
+class DDayRepository:
+    """메모리 D-Day 목록 + XLSX 지연 저장
+
+    항목: {guild_id, name, date(datetime), created(datetime), message}
+    채널 매핑: (길드 ID, 이름) -> D-Day 표시용 음성 채널 ID
+    """
+
+    def __init__(self, excel_file: str = EXCEL_FILE, flush_delay: float = 1.0):
+        self.excel_file = excel_file
+        self.flush_delay = flush_delay
+        self.entries: Dict[Key, Dict[str, Any]] = {}
+        self.channels: Dict[Key, int] = {}
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()
+        self.stats = {'writes': 0, 'errors': 0}
+        self.load()
+
+    # ---- 조회 (메모리) ----
+
+    def all(self, guild_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """길드의 D-Day (등록 순서, guild_id가 None이면 전체)"""
+        return [
+            dict(entry) for entry in self.entries.values()
+            if guild_id is None or entry['guild_id'] == guild_id
+        ]
+
+    def get(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get((guild_id, name))
+        return dict(entry) if entry else None
+
+    def guilds(self) -> Set[int]:
+        """D-Day가 있는 길드 ID"""
+        return {guild_id for guild_id, _ in self.entries}
+
+    def channel_id(self, guild_id: int, name: str) -> Optional[int]:
+        """D-Day 채널 ID (없으면 None)"""
+        return self.channels.get((guild_id, name))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ---- 변경 (메모리에 반영 후 저장 예약) ----
+
+    def add(self, guild_id: int, name: str, target_date: datetime, message: str = "") -> Dict[str, Any]:
+        """D-Day 추가 (길드에 같은 이름이 있으면 덮어씀)"""
+        entry = {
+            'guild_id': guild_id,
+            'name': name,
+            'date': _to_datetime(target_date),
+            'created': _to_datetime(datetime.now()),
+            'message': message or ""
+        }
+        self.entries[(guild_id, name)] = entry
+        self.touch()
+        return dict(entry)
+
+    def delete(self, guild_id: int, name: str) -> bool:
+        """D-Day 삭제 (채널 매핑 포함, 있었으면 True)"""
+        if self.entries.pop((guild_id, name), None) is None:
+            return False
+        self.channels.pop((guild_id, name), None)
+        self.touch()
+        return True
+
+    def set_channel(self, guild_id: int, name: str, channel_id: int) -> None:
+        """D-Day 채널 매핑 저장"""
+        if self.channels.get((guild_id, name)) != channel_id:
+            self.channels[(guild_id, name)] = channel_id
+            self.touch()
+
+    def remove_channel(self, guild_id: int, name: str) -> None:
+        """D-Day 채널 매핑 삭제 (채널이 지워졌을 때)"""
+        if self.channels.pop((guild_id, name), None) is not None:
+            self.touch()
+
+    def move(self, name: str, from_guild: int, to_guild: int) -> bool:
+        """D-Day를 다른 길드로 옮기기 (대상 길드에 같은 이름이 있으면 False)"""
+        if (to_guild, name) in self.entries or (from_guild, name) not in self.entries:
+            return False
+        entry = self.entries.pop((from_guild, name))
+        entry['guild_id'] = to_guild
+        self.entries[(to_guild, name)] = entry
+        if (channel_id := self.channels.pop((from_guild, name), None)) is not None:
+            self.channels[(to_guild, name)] = channel_id
+        self.touch()
+        return True
+
+    def touch(self) -> None:
+        """저장 예약 (D-Day 열 재계산 포함)"""
+        self._dirty = True
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖(초기화·스크립트)에서는 바로 저장
+            self._write(self.all(), dict(self.channels))
+            self._dirty = False
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        # 짧은 시간 안의 변경을 한 번의 저장으로 모음
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """대기 중인 변경을 스레드에서 저장
+
+        저장하는 동안 들어온 변경(touch)도 이어서 저장한다.
+        """
+        while self._dirty:
+            self._dirty = False
+            try:
+                await asyncio.to_thread(self._write, self.all(), dict(self.channels))
+            except Exception as e:
+                self._dirty = True
+                self.stats['errors'] += 1
+                print(f"[ERROR] D-Day 파일 저장 실패: {e}")
+                return
+
+    # ---- 파일 (블로킹, 스레드에서 호출) ----
+
+    def load(self) -> None:
+        """XLSX 읽기 (시작할 때 한 번)"""
+        os.makedirs(os.path.dirname(self.excel_file) or ".", exist_ok=True)
+        if not os.path.exists(self.excel_file):
+            self._write([], {})
+            return
+
+        wb = openpyxl.load_workbook(self.excel_file)
+        ws = wb.worksheets[0]
+        entries = {}
+        # 길드ID 열이 없던 이전 파일은 LEGACY_GUILD
+        for name, date, _, created, status, guild in ws.iter_rows(min_row=2, max_col=6, values_only=True):
+            target = _to_datetime(date)
+            if not name or target is None:
+                continue
+            status = str(status or "")
+            guild_id = _to_id(guild)
+            entries[(guild_id, str(name))] = {
+                'guild_id': guild_id,
+                'name': str(name),
+                'date': target,
+                'created': _to_datetime(created) or target,
+                'message': status.split(" - ", 1)[1] if " - " in status else ""
+            }
+        channels = {}
+        if CHANNEL_SHEET in wb.sheetnames:
+            for guild, name, channel_id in wb[CHANNEL_SHEET].iter_rows(min_row=2, max_col=3, values_only=True):
+                key = (_to_id(guild), str(name or ""))
+                if key in entries and _to_id(channel_id):
+                    channels[key] = _to_id(channel_id)
+        self.entries = entries
+        self.channels = channels
+        print(f"[OK] D-Day {len(entries)}개 로드 (채널 {len(channels)}개)")
+
+    @staticmethod
+    def _fill_sheet(ws, headers: List[str], rows: List[List[Any]]) -> None:
+        for col, header in enumerate(headers, 1):
+            cell = ws.cell(row=1, column=col, value=header)
+            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+            cell.font = Font(bold=True, color="FFFFFF")
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+
+        for row, values in enumerate(rows, 2):
+            for col, value in enumerate(values, 1):
+                cell = ws.cell(row=row, column=col, value=value)
+                cell.alignment = Alignment(horizontal="center", vertical="center")
+
+    def _write(self, entries: List[Dict[str, Any]], channels: Dict[Key, int]) -> None:
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "D-Day"
+        # 디스코드 ID는 엑셀 숫자 정밀도(15자리)를 넘으므로 문자열로 저장
+        self._fill_sheet(ws, HEADERS, [
+            [
+                entry['name'],
+                entry['date'].date(),
+                calculate_dday(entry['date']),
+                entry['created'].date(),
+                f"활성 - {entry['message']}" if entry['message'] else "활성",
+                str(entry['guild_id'])
+            ]
+            for entry in entries
+        ])
+        self._fill_sheet(wb.create_sheet(CHANNEL_SHEET), CHANNEL_HEADERS, [
+            [str(guild_id), name, str(channel_id)] for (guild_id, name), channel_id in channels.items()
+        ])
+
+        # 저장 중 종료돼도 기존 파일이 깨지지 않도록 임시 파일에 쓰고 교체
+        with self._write_lock:
+            tmp_file = f"{self.excel_file}.part"
+            wb.save(tmp_file)
+            os.replace(tmp_file, self.excel_file)
+        self.stats['writes'] += 1
+
+
+def get_dday_repository(bot) -> DDayRepository:
+    """봇 전체에서 공유하는 D-Day 저장소 (D-Day·서버 통계 기능 공용)"""
+    repository = getattr(bot, 'dday_repository', None)
+    if repository is None:
+        repository = bot.dday_repository = DDayRepository()
+    return repository
@@ -0,0 +1,230 @@
+"""
+📥 유한 크기 비동기 수집 큐
+- 게이트웨이 리스너와 저장 작업 분리
+- 배치 단위 저장
+- 오버플로 정책 (drop_oldest / spill)
+"""
+
+import asyncio
+import json
+import os
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+OVERFLOW_POLICIES = ('drop_oldest', 'spill')
+
+
+class IngestQueue:
+    """유한 크기 큐와 배치 워커
+
+    리스너는 offer()로 즉시 반환하고, 워커가 모아서 handler(batch)를 호출한다.
+    큐가 가득 차면 overflow 정책에 따라 가장 오래된 항목을 버리거나
+    (drop_oldest) 디스크에 기록해 두었다가 큐가 비면 다시 넣는다 (spill).
+    버린 항목은 on_drop(item)으로 알려 호출한 쪽이 상태를 정리할 수 있게 한다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[None]],
+        maxsize: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+        overflow: str = 'drop_oldest',
+        spill_file: str = "data/ingest_spill.jsonl",
+        on_drop: Optional[Callable[[Any], None]] = None
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 오버플로 정책: {overflow}")
+
+        self.handler = handler
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.spill_file = spill_file
+        self.on_drop = on_drop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._worker: Optional[asyncio.Task] = None
+        self._collecting: List[Any] = []  # 큐에서 꺼내 모으는 중인 배치
+        self._handling = False
+        self._stopping = False
+        self.stats = {
+            'enqueued': 0,
+            'processed': 0,
+            'dropped': 0,
+            'spilled': 0,
+            'recovered': 0,
+            'batches': 0,
+            'errors': 0,
+            'high_watermark': 0
+        }
+
+    def start(self) -> None:
+        """워커 시작 (스필된 항목 복구 포함)"""
+        if self._worker and not self._worker.done():
+            return
+        self._stopping = False
+        self._recover_spill()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """워커 종료 후 남은 항목 처리
+
+        처리 중인 배치는 끝까지 기다리고, 모으던 배치와 큐에 남은 항목은
+        직접 처리한다 (이미 꺼낸 항목이 종료 중에 사라지지 않도록).
+        """
+        self._stopping = True
+        if self._worker:
+            if not self._handling:
+                # 다음 항목을 기다리는 중이면 바로 중단
+                self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        remaining, self._collecting = self._collecting, []
+        while not self.queue.empty():
+            remaining.append(self.queue.get_nowait())
+        for start in range(0, len(remaining), self.batch_size):
+            await self._handle(remaining[start:start + self.batch_size])
+        for _ in remaining:
+            self.queue.task_done()
+
+    async def join(self) -> None:
+        """지금까지 넣은 항목이 모두 처리될 때까지 대기"""
+        await self.queue.join()
+
+    def offer(self, item: Any) -> bool:
+        """대기 없이 항목 추가 (리스너용)
+
+        큐가 가득 차면 오버플로 정책을 적용하고 False 반환
+        """
+        try:
+            self.queue.put_nowait(item)
+            self._mark_enqueued()
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow == 'spill':
+            self._spill(item)
+            return False
+
+        # drop_oldest: 가장 오래된 항목을 버리고 새 항목 추가
+        try:
+            dropped = self.queue.get_nowait()
+            self.queue.task_done()
+            self._drop(dropped)
+        except asyncio.QueueEmpty:
+            pass
+        self.queue.put_nowait(item)
+        self._mark_enqueued()
+        return False
+
+    async def put(self, item: Any) -> None:
+        """자리가 날 때까지 대기 후 추가 (백필 등 기다릴 수 있는 생산자용)"""
+        await self.queue.put(item)
+        self._mark_enqueued()
+
+    def _mark_enqueued(self) -> None:
+        self.stats['enqueued'] += 1
+        self.stats['high_watermark'] = max(self.stats['high_watermark'], self.queue.qsize())
+
+    async def _run(self) -> None:
+        """배치 워커 루프"""
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            batch = self._collecting
+            batch.append(await self.queue.get())
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self._collecting = []
+            self._handling = True
+            try:
+                await self._handle(batch)
+            finally:
+                self._handling = False
+                for _ in batch:
+                    self.queue.task_done()
+
+            # 버스트가 지나가면 스필된 항목을 이어서 복구
+            if self.overflow == 'spill' and self.queue.empty() and os.path.exists(self.spill_file):
+                self._recover_spill()
+
+    async def _handle(self, batch: List[Any]) -> None:
+        try:
+            await self.handler(batch)
+            self.stats['processed'] += len(batch)
+            self.stats['batches'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"❌ 수집 배치 처리 오류: {e}")
+
+    def _spill(self, item: Any) -> None:
+        """넘친 항목을 디스크에 기록"""
+        try:
+            os.makedirs(os.path.dirname(self.spill_file), exist_ok=True)
+            with open(self.spill_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            self.stats['spilled'] += 1
+        except Exception as e:
+            print(f"❌ 스필 기록 실패: {e}")
+            self._drop(item)
+
+    def _drop(self, item: Any) -> None:
+        """버린 항목 기록 후 on_drop 호출"""
+        self.stats['dropped'] += 1
+        if self.on_drop is None:
+            return
+        try:
+            self.on_drop(item)
+        except Exception as e:
+            print(f"❌ 버린 항목 처리 오류: {e}")
+
+    def _recover_spill(self) -> None:
+        """스필 파일의 항목을 큐에 다시 넣기 (넣지 못한 항목은 파일에 남김)"""
+        if not os.path.exists(self.spill_file):
+            return
+
+        try:
+            with open(self.spill_file, 'r', encoding='utf-8') as f:
+                lines = [line for line in f if line.strip()]
+        except Exception as e:
+            print(f"❌ 스필 파일 읽기 실패: {e}")
+            return
+
+        restored = 0
+        for line in lines:
+            if self.queue.full():
+                break
+            try:
+                self.queue.put_nowait(json.loads(line))
+                restored += 1
+            except json.JSONDecodeError:
+                restored += 1  # 손상된 줄은 건너뜀
+
+        rest = lines[restored:]
+        if rest:
+            with open(self.spill_file, 'w', encoding='utf-8') as f:
+                f.writelines(rest)
+        else:
+            os.remove(self.spill_file)
+        self.stats['recovered'] += restored
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 통계"""
+        return {
+            **self.stats,
+            'depth': self.queue.qsize(),
+            'maxsize': self.maxsize,
+            'overflow': self.overflow
+        }
@@ -0,0 +1,37 @@
+"""
+⏱️ 지연 시간 기록
+- 항목별 최근 측정값만 보관 (메모리 고정)
+- 백분위(p50/p90/p99) 요약
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+
+class LatencyTracker:
+    """항목 이름별 지연 시간(ms) 기록기"""
+
+    def __init__(self, maxlen: int = 500):
+        self.maxlen = maxlen
+        self.samples: Dict[str, deque] = {}
+
+    def record(self, metric: str, ms: float) -> None:
+        """측정값 추가 (가장 오래된 값부터 밀려남)"""
+        self.samples.setdefault(metric, deque(maxlen=self.maxlen)).append(ms)
+
+    def percentiles(self, metric: str, points: Iterable[int] = (50, 90, 99)) -> Optional[Dict[str, float]]:
+        """항목의 백분위 요약 (측정값이 없으면 None)"""
+        values = sorted(self.samples.get(metric, ()))
+        if not values:
+            return None
+        summary = {
+            f"p{p}": round(values[min(len(values) - 1, int(len(values) * p / 100))], 1)
+            for p in points
+        }
+        summary['max'] = round(values[-1], 1)
+        summary['count'] = len(values)
+        return summary
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """모든 항목의 백분위 요약"""
+        return {metric: self.percentiles(metric) for metric in self.samples if self.samples[metric]}
@@ -0,0 +1,93 @@
+"""
+🎼 Opus 사전 인코딩
+- 음성 파일을 한 번만 Ogg Opus로 변환해 캐시 옆에 보관
+- 재생 시 ffmpeg 프로세스 없이 Opus 패킷을 그대로 전송
+"""
+
+import io
+import os
+import subprocess
+import tempfile
+from typing import Iterator, Optional
+
+import discord
+from discord.oggparse import OggError, OggStream
+
+OPUS_SUFFIX = ".opus.ogg"
+
+
+def opus_path_for(voice_file: str) -> str:
+    """음성 파일에 대응하는 Opus 파일 경로"""
+    return os.path.splitext(voice_file)[0] + OPUS_SUFFIX
+
+
+def ensure_opus(voice_file: str, ffmpeg: str) -> Optional[str]:
+    """Opus 파일이 없으면 변환 (실패 시 None → 호출 측에서 ffmpeg 재생으로 대체)
+
+    블로킹 함수이므로 스레드에서 호출할 것
+    """
+    opus_file = opus_path_for(voice_file)
+    try:
+        source_mtime = os.path.getmtime(voice_file)
+    except OSError:
+        # 원본이 캐시 정리 등으로 지워졌으면 이미 만든 Opus 파일 사용
+        return opus_file if os.path.exists(opus_file) else None
+    try:
+        if os.path.getmtime(opus_file) >= source_mtime:
+            return opus_file
+    except OSError:
+        pass  # 아직 변환하지 않음
+
+    # 같은 파일을 동시에 변환해도 서로의 임시 파일을 덮어쓰지 않도록 호출마다 따로 생성
+    fd, tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(opus_file) or ".", prefix=f"{os.path.basename(opus_file)}.", suffix=".part"
+    )
+    os.close(fd)
+    command = [
+        ffmpeg, '-y', '-loglevel', 'error',
+        '-i', voice_file,
+        '-c:a', 'libopus', '-b:a', '64k',
+        '-ar', '48000', '-ac', '2',
+        '-frame_duration', '20',  # 디스코드 전송 단위 (20ms)
+        '-f', 'ogg', tmp_file
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True, timeout=30)
+        os.replace(tmp_file, opus_file)
+        return opus_file
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"[WARNING] Opus 변환 실패 ({voice_file}): {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return None
+
+
+class OggOpusSource(discord.AudioSource):
+    """미리 인코딩한 Ogg Opus 파일을 그대로 보내는 오디오 소스
+
+    파일을 메모리로 읽어 패킷 단위로 넘기므로 재생 중 외부 프로세스가 필요 없다.
+    """
+
+    def __init__(self, opus_file: str):
+        with open(opus_file, 'rb') as f:
+            self._buffer = io.BytesIO(f.read())
+        self._packets = self._iter_audio_packets()
+
+    def _iter_audio_packets(self) -> Iterator[bytes]:
+        try:
+            for packet in OggStream(self._buffer).iter_packets():
+                # 헤더 패킷(OpusHead/OpusTags)은 오디오가 아니므로 건너뜀
+                if packet.startswith(b'OpusHead') or packet.startswith(b'OpusTags'):
+                    continue
+                yield packet
+        except OggError as e:
+            print(f"[WARNING] Opus 파일 파싱 오류: {e}")
+
+    def read(self) -> bytes:
+        return next(self._packets, b'')
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self._buffer.close()
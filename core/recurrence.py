@@ -0,0 +1,172 @@
+"""
+🔁 알람 반복 규칙
+- once / daily / weekly:mon,thu / every:3 (N시간마다) / cron:<분 시 일 월 요일>
+- 오프셋(분): 음수면 예정 시각보다 먼저 (-5 = 5분 전 미리 알림)
+- 다음 발동 시각 계산은 APScheduler CronTrigger 사용
+- cron 요일 숫자는 표준 crontab 기준 (0·7 = 일요일)
+"""
+
+import re
+from datetime import datetime, timedelta, tzinfo
+from typing import Optional
+
+from apscheduler.triggers.cron import CronTrigger
+
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+WEEKDAY_NAMES = dict(zip(WEEKDAYS, "월화수목금토일"))
+_WEEKDAY_ALIASES = {**{day: day for day in WEEKDAYS}, **{name: day for day, name in WEEKDAY_NAMES.items()}}
+_REPEAT_ALIASES = {'daily': 'daily', '매일': 'daily', 'once': 'once', '1회': 'once', '': 'once'}
+_EVERY_PATTERN = re.compile(r'^(?:every:)?(\d+)(?:h|시간|시간마다)?$')
+MAX_OFFSET_MINUTES = 24 * 60
+# 표준 crontab 요일 번호 (APScheduler from_crontab은 0 = 월요일로 해석)
+_CRON_WEEKDAYS = ['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat']
+
+
+def _cron_weekday_field(field: str) -> str:
+    """cron 요일 필드의 숫자를 요일 이름으로 (0·7 = 일요일, 이름은 그대로)
+
+    예: 4 → thu, 1-5 → mon,tue,wed,thu,fri, 0,6 → sun,sat, */2 → sun,tue,thu,sat
+    """
+    names = []
+    for item in field.split(','):
+        base, _, step = item.partition('/')
+        if not any(ch.isdigit() for ch in base) and not (base == '*' and step):
+            names.append(item)  # 요일 이름 또는 * (번호 차이 없음)
+            continue
+        if base == '*':
+            first, last = 0, 6
+        elif '-' in base:
+            first, last = (int(part) for part in base.split('-', 1))
+        else:
+            first = last = int(base)
+        if not (0 <= first <= 7 and 0 <= last <= 7 and first <= last):
+            raise ValueError(f"요일 범위가 잘못되었습니다: '{item}' (0-7, 0·7 = 일요일)")
+        for day in range(first, last + 1, int(step) if step else 1):
+            name = _CRON_WEEKDAYS[day % 7]
+            if name not in names:
+                names.append(name)
+    return ','.join(names)
+
+
+def cron_trigger(expr: str, timezone: Optional[tzinfo] = None) -> CronTrigger:
+    """표준 crontab 식(분 시 일 월 요일)으로 트리거 만들기"""
+    fields = expr.split()
+    if len(fields) == 5:
+        fields[4] = _cron_weekday_field(fields[4])
+    return CronTrigger.from_crontab(" ".join(fields), timezone=timezone)
+
+
+def normalize_repeat(text: str) -> str:
+    """사용자 입력을 저장 형식의 반복 규칙으로 (잘못되면 ValueError)
+
+    예: 매일, 1회, 매주:월,목, weekly:mon, every:3h, 3시간마다, cron:0 21 * * thu
+    """
+    text = (text or "").strip()
+    lowered = text.lower()
+    if lowered in _REPEAT_ALIASES:
+        return _REPEAT_ALIASES[lowered]
+
+    if lowered.startswith('cron:'):
+        expr = " ".join(text[5:].split())
+        try:
+            cron_trigger(expr)
+        except ValueError as e:
+            raise ValueError(f"cron 식이 잘못되었습니다: '{expr}' ({e})") from None
+        return f"cron:{expr}"
+
+    for prefix in ('weekly:', '매주:'):
+        if lowered.startswith(prefix):
+            days = [day.strip() for day in re.split(r'[,·\s]+', lowered[len(prefix):]) if day.strip()]
+            if not days or any(day not in _WEEKDAY_ALIASES for day in days):
+                raise ValueError(f"요일이 잘못되었습니다: '{text}' (예: 매주:월,목)")
+            ordered = sorted({_WEEKDAY_ALIASES[day] for day in days}, key=WEEKDAYS.index)
+            return f"weekly:{','.join(ordered)}"
+
+    match = _EVERY_PATTERN.match(lowered)
+    if match and (lowered.startswith('every:') or not lowered.isdigit()):
+        hours = int(match.group(1))
+        if not 1 <= hours <= 23 or 24 % hours:
+            # 하루에 나누어떨어지지 않으면 자정에서 간격이 어긋남 (예: 5시간마다 21시 → 1시)
+            raise ValueError("N시간마다의 N은 24의 약수여야 합니다 (1, 2, 3, 4, 6, 8, 12)")
+        return f"every:{hours}"
+
+    raise ValueError(f"반복 규칙이 잘못되었습니다: '{text}' (매일/1회/매주:월,목/every:3h/cron:분 시 일 월 요일)")
+
+
+def parse_time(text: str) -> str:
+    """HH:MM 검증 후 두 자리 형식으로"""
+    try:
+        hour, minute = map(int, str(text).strip().split(':'))
+    except ValueError:
+        raise ValueError(f"시간 형식이 잘못되었습니다: '{text}' (HH:MM)") from None
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"시간 범위가 잘못되었습니다: '{text}' (00:00-23:59)")
+    return f"{hour:02d}:{minute:02d}"
+
+
+def parse_offset(text) -> int:
+    """오프셋(분) 입력 해석: -5, 5분전, 5분 전 → -5 / +10, 10분후 → 10"""
+    if isinstance(text, int):
+        minutes = text
+    else:
+        raw = str(text or "0").replace(" ", "")
+        match = re.match(r'^([+-]?\d+)(분)?(전|후)?$', raw)
+        if not match:
+            raise ValueError(f"오프셋이 잘못되었습니다: '{text}' (예: -5, 5분전)")
+        minutes = int(match.group(1))
+        if match.group(3) == '전':
+            minutes = -abs(minutes)
+        elif match.group(3) == '후':
+            minutes = abs(minutes)
+    if abs(minutes) > MAX_OFFSET_MINUTES:
+        raise ValueError(f"오프셋은 최대 ±{MAX_OFFSET_MINUTES}분입니다")
+    return minutes
+
+
+def build_trigger(repeat: str, time: str, timezone: Optional[tzinfo] = None) -> CronTrigger:
+    """반복 규칙의 기준 시각 트리거 (오프셋 적용 전)"""
+    if repeat.startswith('cron:'):
+        return cron_trigger(repeat[5:], timezone=timezone)
+
+    hour, minute = map(int, time.split(':'))
+    if repeat.startswith('weekly:'):
+        return CronTrigger(day_of_week=repeat[7:], hour=hour, minute=minute, timezone=timezone)
+    if repeat.startswith('every:'):
+        step = int(repeat[6:])
+        return CronTrigger(hour=f"{hour % step}/{step}", minute=minute, timezone=timezone)
+    # daily / once: 매일 같은 시각 (once는 한 번 울리면 삭제)
+    return CronTrigger(hour=hour, minute=minute, timezone=timezone)
+
+
+def next_fire_time(repeat: str, time: str, offset: int, after: datetime,
+                   timezone: Optional[tzinfo] = None) -> Optional[datetime]:
+    """after보다 뒤의 첫 발동 시각 (오프셋 적용)"""
+    delta = timedelta(minutes=offset)
+    trigger = build_trigger(repeat, time, timezone)
+    # 기준 시각 + 오프셋 > after  ⇔  기준 시각 > after - 오프셋
+    base = trigger.get_next_fire_time(None, after - delta + timedelta(microseconds=1))
+    return base + delta if base else None
+
+
+def describe_repeat(repeat: str, offset: int = 0) -> str:
+    """반복 규칙 표시 문구 (시간 제외)"""
+    if repeat == 'daily':
+        text = "매일"
+    elif repeat.startswith('weekly:'):
+        text = "매주 " + "·".join(WEEKDAY_NAMES[day] for day in repeat[7:].split(','))
+    elif repeat.startswith('every:'):
+        text = f"{repeat[6:]}시간마다"
+    elif repeat.startswith('cron:'):
+        text = f"cron `{repeat[5:]}`"
+    else:
+        text = "1회"
+    if offset:
+        text += f" · {abs(offset)}분 {'전' if offset < 0 else '후'}"
+    return text
+
+
+def describe_schedule(repeat: str, time: str, offset: int = 0) -> str:
+    """시각과 반복 규칙 표시 문구 (cron은 식에 시각이 들어 있음)"""
+    if repeat.startswith('cron:'):
+        return describe_repeat(repeat, offset)
+    return f"{time} ({describe_repeat(repeat, offset)})"
@@ -0,0 +1,236 @@
+"""
+📤 구글 시트 지연 동기화
+- 명령 처리 중에는 변경 내용만 기록 (이벤트 루프 차단 없음)
+- 주기마다 모아서 batch_update 한 번으로 반영
+- 실패 시 지수 백오프 재시도, 재시작해도 outbox 파일에서 이어서 처리
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def column_letter(index: int) -> str:
+    """1부터 시작하는 열 번호를 A, B, ..., AA 형식으로"""
+    letters = ""
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
+class SheetSyncWorker:
+    """시트 변경 내용을 모아서 주기적으로 반영하는 백그라운드 워커
+
+    key_columns 열(기본: 첫 열)의 값을 키로 행을 추가·교체·삭제한다. 같은 키의
+    변경이 여러 번 쌓이면 마지막 것만 반영하고, 한 주기의 변경은 시트 전체를
+    한 번 읽고 batch_update 한 번으로 쓴다. 키 열이 나중에 추가되어 첫 열 외의
+    키 값이 비어 있는 이전 행은 첫 열 값만으로 매칭한다.
+    """
+
+    def __init__(
+        self,
+        sheet,
+        outbox_file: str = "data/sheet_outbox.json",
+        interval: float = 10.0,
+        max_backoff: float = 300.0,
+        header_rows: int = 1,
+        key_columns: Tuple[int, ...] = (0,)
+    ):
+        self.sheet = sheet
+        self.outbox_file = outbox_file
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.header_rows = header_rows
+        self.key_columns = key_columns
+        # 키 -> 행 (None이면 삭제)
+        self.pending: "OrderedDict[str, Optional[List[str]]]" = OrderedDict()
+        self._version = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.failures = 0
+        self.next_retry = 0.0
+        self.stats = {
+            'queued': 0,
+            'batches': 0,
+            'rows_written': 0,
+            'errors': 0,
+            'last_error': ""
+        }
+        self._load_outbox()
+
+    # ---- 변경 기록 (이벤트 루프에서 호출, 즉시 반환) ----
+
+    def row_key(self, row: List[str]) -> str:
+        """행의 키 (key_columns 열 값)"""
+        return "\x1f".join(row[i] if i < len(row) else "" for i in self.key_columns)
+
+    def upsert(self, row: List[Any]) -> None:
+        """행 추가 또는 교체"""
+        self.upsert_many([row])
+
+    def upsert_many(self, rows: List[List[Any]]) -> None:
+        """여러 행 추가 또는 교체 (outbox도 한 번만 저장)"""
+        for row in rows:
+            row = [str(value) for value in row]
+            self._queue(self.row_key(row), row)
+        self._flush_later()
+
+    def legacy_key(self, key: str) -> str:
+        """첫 키 열만 채워진 이전 형식 행의 키"""
+        first = key.split("\x1f", 1)[0]
+        return "\x1f".join([first] + [""] * (len(self.key_columns) - 1))
+
+    def delete(self, *key_values: Any) -> None:
+        """행 삭제 (key_columns 순서대로 값 전달)"""
+        self._record("\x1f".join(str(value) for value in key_values), None)
+
+    def _record(self, key: str, row: Optional[List[str]]) -> None:
+        self._queue(key, row)
+        self._flush_later()
+
+    def _queue(self, key: str, row: Optional[List[str]]) -> None:
+        self.pending.pop(key, None)
+        self.pending[key] = row
+        self._version += 1
+        self.stats['queued'] += 1
+
+    def _flush_later(self) -> None:
+        self._save_outbox()
+        if self._wakeup:
+            self._wakeup.set()
+
+    # ---- 워커 ----
+
+    def start(self) -> None:
+        if self._worker and not self._worker.done():
+            return
+        self._wakeup = asyncio.Event()
+        if self.pending:
+            self._wakeup.set()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self, flush: bool = True) -> None:
+        """워커 종료 (flush=True면 남은 변경을 한 번 더 반영 시도)"""
+        if self._worker:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if flush and self.pending:
+            await self.sync_once()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # 짧은 시간 안에 들어온 변경을 한 번에 모으기
+            await asyncio.sleep(self.interval)
+            delay = self.next_retry - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._wakeup.clear()
+            if not await self.sync_once():
+                self._wakeup.set()  # 백오프 후 재시도
+
+    async def sync_once(self) -> bool:
+        """대기 중인 변경을 한 번에 반영 (성공 시 True)"""
+        if not self.pending:
+            return True
+        snapshot = OrderedDict(self.pending)
+        version = self._version
+        try:
+            written = await asyncio.to_thread(self._apply, snapshot)
+        except Exception as e:
+            self.failures += 1
+            backoff = min(self.max_backoff, self.interval * (2 ** self.failures))
+            self.next_retry = time.monotonic() + backoff
+            self.stats['errors'] += 1
+            self.stats['last_error'] = str(e)
+            print(f"[WARNING] 구글 시트 동기화 실패 ({backoff:.0f}초 후 재시도): {e}")
+            return False
+
+        self.failures = 0
+        self.next_retry = 0.0
+        self.stats['batches'] += 1
+        self.stats['rows_written'] += written
+        # 반영하는 동안 새로 들어온 변경은 남겨 둠
+        if version == self._version:
+            self.pending.clear()
+        else:
+            for key, row in snapshot.items():
+                if key in self.pending and self.pending[key] == row:
+                    del self.pending[key]
+        self._save_outbox()
+        return True
+
+    def _apply(self, changes: "OrderedDict[str, Optional[List[str]]]") -> int:
+        """시트를 한 번 읽고 변경을 적용한 전체 표를 batch_update 한 번으로 쓰기 (블로킹)"""
+        values = self.sheet.get_all_values()
+        header = values[:self.header_rows]
+        body = values[self.header_rows:]
+        old_length = len(values)
+
+        rows = OrderedDict((self.row_key(row), row) for row in body if any(row))
+        for key, row in changes.items():
+            # 정확히 맞는 행이 없으면 키 열이 비어 있는 이전 행을 같은 행으로 봄 (제자리 교체)
+            if key not in rows and (legacy := self.legacy_key(key)) in rows:
+                rows = OrderedDict((key if k == legacy else k, v) for k, v in rows.items())
+            if row is None:
+                rows.pop(key, None)
+            else:
+                rows[key] = row
+
+        table = header + list(rows.values())
+        width = max((len(row) for row in table), default=1)
+        # 삭제로 줄어든 만큼은 빈 행으로 덮어씀
+        padded = [row + [""] * (width - len(row)) for row in table]
+        padded += [[""] * width for _ in range(max(0, old_length - len(table)))]
+        if not padded:
+            return 0
+
+        self.sheet.batch_update([{
+            'range': f"A1:{column_letter(width)}{len(padded)}",
+            'values': padded
+        }])
+        return len(changes)
+
+    # ---- outbox (재시작 후 이어서 처리) ----
+
+    def _save_outbox(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.outbox_file) or ".", exist_ok=True)
+            if not self.pending:
+                if os.path.exists(self.outbox_file):
+                    os.remove(self.outbox_file)
+                return
+            tmp_file = f"{self.outbox_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(list(self.pending.items()), f, ensure_ascii=False)
+            os.replace(tmp_file, self.outbox_file)
+        except OSError as e:
+            print(f"[WARNING] 시트 outbox 저장 실패: {e}")
+
+    def _load_outbox(self) -> None:
+        try:
+            with open(self.outbox_file, 'r', encoding='utf-8') as f:
+                self.pending = OrderedDict((key, row) for key, row in json.load(f))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            print(f"[WARNING] 시트 outbox 읽기 실패: {e}")
+            return
+        if self.pending:
+            print(f"[OK] 시트 동기화 대기 {len(self.pending)}건 복구")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """동기화 통계"""
+        return {
+            **self.stats,
+            'pending': len(self.pending),
+            'failures': self.failures,
+            'retry_in': max(0.0, round(self.next_retry - time.monotonic(), 1))
+        }
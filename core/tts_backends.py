@@ -0,0 +1,257 @@
+"""
+🗣️ TTS 엔진
+- 공통 인터페이스 (gTTS / espeak-ng / 로컬 HTTP 서버)
+- 엔진별 합성 벤치마크 (첫 음성까지 시간, 처리량)
+"""
+
+import io
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from gtts import gTTS
+
+from config import TTS_BACKEND, TTS_HTTP_FORMAT, TTS_HTTP_URL
+
+BENCHMARK_SAMPLES = [
+    "안녕하세요",
+    "오늘 레이드는 저녁 아홉 시에 시작합니다",
+    "보스 체력이 절반 남았습니다. 모두 위치를 확인해 주세요.",
+    "다음 주 점검 일정과 보상 내용을 공지 채널에 올려두었으니 확인 부탁드립니다."
+]
+
+
+class TTSBackend:
+    """TTS 엔진 인터페이스
+
+    synthesize()는 블로킹 함수이므로 스레드에서 호출할 것
+    """
+
+    name = "base"
+    ext = "mp3"
+
+    def is_available(self) -> bool:
+        """현재 환경에서 사용 가능한지"""
+        return True
+
+    def synthesize(self, text: str, out_path: str, lang: str = 'ko', speed: float = 1.0) -> None:
+        """text를 음성으로 합성해 out_path에 저장 (실패 시 예외)"""
+        raise NotImplementedError
+
+    def synthesize_bytes(self, text: str, lang: str = 'ko', speed: float = 1.0) -> bytes:
+        """text를 음성으로 합성해 바이트로 반환 (기본: 임시 파일 경유)"""
+        with tempfile.TemporaryDirectory(prefix="tts_") as tmp_dir:
+            out_path = os.path.join(tmp_dir, f"speech.{self.ext}")
+            self.synthesize(text, out_path, lang, speed)
+            with open(out_path, 'rb') as f:
+                return f.read()
+
+
+class GTTSBackend(TTSBackend):
+    """Google TTS (네트워크 필요)"""
+
+    name = "gtts"
+    ext = "mp3"
+
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        gTTS(text=text, lang=lang, slow=speed < 1.0).save(out_path)
+
+    def synthesize_bytes(self, text, lang='ko', speed=1.0):
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang, slow=speed < 1.0).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakBackend(TTSBackend):
+    """espeak-ng 로컬 엔진 (오프라인, 음질은 낮지만 지연이 짧음)"""
+
+    name = "espeak"
+    ext = "wav"
+    base_wpm = 175  # espeak 기본 속도 (분당 단어)
+
+    def __init__(self):
+        self.executable = shutil.which("espeak-ng") or shutil.which("espeak")
+
+    def is_available(self):
+        return self.executable is not None
+
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        if not self.executable:
+            raise RuntimeError("espeak-ng가 설치되어 있지 않습니다.")
+        subprocess.run(
+            [self.executable, '-v', lang, '-s', str(int(self.base_wpm * speed)), '-w', out_path, text],
+            check=True, capture_output=True, timeout=30
+        )
+
+
+class HTTPBackend(TTSBackend):
+    """로컬 TTS 서버 (POST {text, lang, speed} → 음성 바이트)"""
+
+    name = "http"
+
+    def __init__(self, url: str = TTS_HTTP_URL, ext: str = TTS_HTTP_FORMAT):
+        self.url = url
+        self.ext = ext
+
+    def is_available(self):
+        return bool(self.url)
+
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        if not self.url:
+            raise RuntimeError("TTS_HTTP_URL이 설정되지 않았습니다.")
+        response = requests.post(
+            self.url,
+            json={'text': text, 'lang': lang, 'speed': speed},
+            timeout=30
+        )
+        response.raise_for_status()
+        with open(out_path, 'wb') as f:
+            f.write(response.content)
+
+
+_SENTENCE_END = re.compile(r'(?<=[.!?。？！~…])\s+|\n+')
+
+
+def split_sentences(text: str, min_chars: int = 10) -> List[str]:
+    """문장 경계로 나누기 (너무 짧은 조각은 다음 문장에 붙임)"""
+    sentences = []
+    pending = ""
+    for part in _SENTENCE_END.split(text):
+        part = part.strip()
+        if not part:
+            continue
+        pending = f"{pending} {part}" if pending else part
+        if len(pending) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {pending}"
+        else:
+            sentences.append(pending)
+    return sentences
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (GTTSBackend, EspeakBackend, HTTPBackend)
+}
+_instances: Dict[str, TTSBackend] = {}
+_resolved: Dict[str, TTSBackend] = {}  # 요청한 이름 -> 실제로 쓸 엔진
+
+
+def _instance(name: str) -> TTSBackend:
+    backend = _instances.get(name)
+    if backend is None:
+        backend = _instances[name] = BACKENDS[name]()
+    return backend
+
+
+def get_backend(name: Optional[str] = None) -> TTSBackend:
+    """이름으로 엔진 조회 (없거나 사용할 수 없으면 gTTS)
+
+    메시지마다 호출되므로 확인 결과를 이름별로 기억해 대체 경고는 한 번만 출력
+    """
+    requested = (name or TTS_BACKEND).lower()
+    backend = _resolved.get(requested)
+    if backend is None:
+        backend = _resolved[requested] = _resolve(requested)
+    return backend
+
+
+def _resolve(name: str) -> TTSBackend:
+    if name not in BACKENDS:
+        print(f"[WARNING] 알 수 없는 TTS 엔진 '{name}', gtts 사용")
+        return _instance(GTTSBackend.name)
+
+    backend = _instance(name)
+    if not backend.is_available() and name != GTTSBackend.name:
+        print(f"[WARNING] TTS 엔진 '{name}' 사용 불가, gtts 사용")
+        return _instance(GTTSBackend.name)
+    return backend
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 엔진 이름 목록"""
+    return [name for name in BACKENDS if _instance(name).is_available()]
+
+
+def synthesize_to_file(text: str, out_path: str, lang: str = 'ko', speed: float = 1.0,
+                       backend: Optional[TTSBackend] = None) -> Tuple[str, TTSBackend]:
+    """임시 파일에 합성한 뒤 교체 (반쯤 쓴 파일이 남지 않도록)
+
+    선택한 엔진이 실패하면 gTTS로 한 번 더 시도한다. 대체 엔진의 확장자가
+    다를 수 있으므로 실제로 저장한 파일 경로와 합성한 엔진을 함께 반환
+    """
+    backend = backend or get_backend()
+    # 같은 파일을 동시에 만들어도 서로의 임시 파일을 덮어쓰지 않도록 호출마다 따로 생성
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(out_path) or ".", prefix=f"{os.path.basename(out_path)}.", suffix=".part"
+    )
+    os.close(fd)
+    try:
+        try:
+            backend.synthesize(text, tmp_path, lang, speed)
+        except Exception as e:
+            if backend.name == GTTSBackend.name:
+                raise
+            print(f"[WARNING] TTS 엔진 '{backend.name}' 실패, gtts로 재시도: {e}")
+            backend = get_backend(GTTSBackend.name)
+            out_path = os.path.splitext(out_path)[0] + f".{backend.ext}"
+            backend.synthesize(text, tmp_path, lang, speed)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return out_path, backend
+
+
+def benchmark(backend: TTSBackend, samples: Optional[List[str]] = None, rounds: int = 1) -> Dict[str, Any]:
+    """엔진 합성 성능 측정 (블로킹)
+
+    - first_audio_ms: 첫 문장이 재생 가능한 파일이 될 때까지 걸린 시간 (콜드 스타트 포함)
+    - avg_ms / p95_ms: 문장당 합성 시간
+    - chars_per_sec: 초당 합성한 글자 수 (처리량)
+    """
+    samples = samples or BENCHMARK_SAMPLES
+    latencies = []
+    errors = 0
+    total_chars = 0
+    first_audio_ms = None
+
+    with tempfile.TemporaryDirectory(prefix="tts_bench_") as tmp_dir:
+        started = time.perf_counter()
+        for i in range(rounds):
+            for j, text in enumerate(samples):
+                out_path = os.path.join(tmp_dir, f"{i}_{j}.{backend.ext}")
+                t0 = time.perf_counter()
+                try:
+                    backend.synthesize(text, out_path)
+                except Exception as e:
+                    errors += 1
+                    print(f"[WARNING] 벤치마크 합성 실패 ({backend.name}): {e}")
+                    continue
+                elapsed = (time.perf_counter() - t0) * 1000
+                latencies.append(elapsed)
+                total_chars += len(text)
+                if first_audio_ms is None:
+                    first_audio_ms = (time.perf_counter() - started) * 1000
+        wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'backend': backend.name,
+        'clips': len(latencies),
+        'errors': errors,
+        'first_audio_ms': round(first_audio_ms, 1) if first_audio_ms is not None else None,
+        'avg_ms': round(sum(latencies) / len(latencies), 1) if latencies else None,
+        'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1) if latencies else None,
+        'chars_per_sec': round(total_chars / wall, 1) if wall > 0 else 0.0
+    }
@@ -0,0 +1,256 @@
+"""
+🎧 음성 연결 관리자
+- 길드별 음성 연결 재사용 (TTS·알람 공용)
+- 재생 직렬화 (동시에 두 소리가 겹치지 않도록)
+- 일정 시간 사용하지 않으면 자동 연결 해제
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import suppress
+from typing import Any, Callable, Dict, List, Optional
+
+import discord
+
+from config import FFMPEG_PATH, VOICE_IDLE_TIMEOUT
+from core.opus_audio import OggOpusSource, ensure_opus
+
+
+def resolve_ffmpeg() -> str:
+    """설정된 ffmpeg 경로 (없으면 시스템 PATH의 ffmpeg)"""
+    return FFMPEG_PATH if FFMPEG_PATH and os.path.exists(FFMPEG_PATH) else "ffmpeg"
+
+
+class AudioPipe:
+    """합성 중인 음성 바이트를 ffmpeg 입력으로 넘기는 메모리 파이프
+
+    이벤트 루프에서 write()로 조각을 넣고, ffmpeg 입력 스레드가 read()로 꺼낸다.
+    close() 전까지 read()는 다음 조각을 기다린다.
+    """
+
+    def __init__(self):
+        self._chunks = bytearray()
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def write(self, data: bytes) -> None:
+        with self._cond:
+            self._chunks += data
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        with self._cond:
+            while not self._chunks and not self._closed:
+                self._cond.wait()
+            if size < 0:
+                size = len(self._chunks)
+            data = bytes(self._chunks[:size])
+            del self._chunks[:size]
+            return data
+
+
+class VoiceSessionManager:
+    """길드별 음성 연결 풀
+
+    연결을 재생마다 새로 맺지 않고 유지하다가, idle_timeout 동안 아무것도
+    재생하지 않으면 그때 연결을 끊는다.
+    """
+
+    def __init__(self, bot, idle_timeout: int = VOICE_IDLE_TIMEOUT):
+        self.bot = bot
+        self.idle_timeout = idle_timeout
+        self.last_used: Dict[int, float] = {}
+        self._connect_locks: Dict[int, asyncio.Lock] = {}
+        self._play_locks: Dict[int, asyncio.Lock] = {}
+        self._reaper: Optional[asyncio.Task] = None
+        self.stats = {
+            'connects': 0,
+            'reuses': 0,
+            'idle_disconnects': 0,
+            'plays': 0,
+            'opus_plays': 0,
+            'ffmpeg_plays': 0,
+            'stream_plays': 0
+        }
+
+    def touch(self, guild) -> None:
+        """마지막 사용 시각 갱신"""
+        self.last_used[guild.id] = time.monotonic()
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    async def acquire(self, guild) -> Optional[discord.VoiceClient]:
+        """길드의 음성 연결 (기존 연결 재사용, 없으면 사람이 있는 첫 채널에 입장)"""
+        self._ensure_reaper()
+        lock = self._connect_locks.setdefault(guild.id, asyncio.Lock())
+
+        async with lock:
+            voice_client = guild.voice_client
+            if voice_client and voice_client.is_connected():
+                self.stats['reuses'] += 1
+                self.touch(guild)
+                return voice_client
+
+            target_channel = next(
+                (channel for channel in guild.voice_channels if len(channel.members) > 0),
+                None
+            )
+            if not target_channel:
+                print("[WARNING] 음성 채널에 사람이 없습니다.")
+                return None
+
+            try:
+                voice_client = await target_channel.connect()
+            except Exception as e:
+                print(f"[ERROR] 음성 채널 입장 실패: {e}")
+                return None
+
+            self.stats['connects'] += 1
+            self.touch(guild)
+            print(f"[OK] 음성 채널 입장: {target_channel.name}")
+            return voice_client
+
+    async def play(self, guild, source: discord.AudioSource, label: str = "", timeout: float = 30,
+                   on_start: Optional[Callable[[], None]] = None) -> bool:
+        """오디오 재생 후 끝날 때까지 대기 (같은 길드에서는 순서대로 재생)
+
+        on_start는 재생을 시작한 직후 호출된다 (재생 시작 지연 측정용)
+        """
+        lock = self._play_locks.setdefault(guild.id, asyncio.Lock())
+
+        async with lock:
+            return await self._play_locked(guild, source, label, timeout, on_start)
+
+    async def _play_locked(self, guild, source: discord.AudioSource, label: str, timeout: float,
+                           on_start: Optional[Callable[[], None]]) -> bool:
+        """재생 잠금을 잡은 상태에서 한 개 재생"""
+        voice_client = await self.acquire(guild)
+        if not voice_client:
+            source.cleanup()
+            return False
+
+        # 재생 완료는 after 콜백(음성 스레드)에서 Event로 통지
+        loop = asyncio.get_running_loop()
+        finished = asyncio.Event()
+
+        def after(error):
+            if error is not None:
+                print(f"[ERROR] 재생 오류 '{label}': {error}")
+            loop.call_soon_threadsafe(finished.set)
+
+        try:
+            voice_client.play(source, after=after)
+        except Exception as e:
+            print(f"[ERROR] 음성 재생 실패 '{label}': {e}")
+            source.cleanup()
+            return False
+        if on_start:
+            on_start()
+
+        try:
+            await asyncio.wait_for(finished.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            voice_client.stop()
+
+        self.stats['plays'] += 1
+        self.touch(guild)
+        return True
+
+    async def _file_source(self, voice_file: str) -> discord.AudioSource:
+        """음성 파일 오디오 소스
+
+        Opus 파일이 있으면(없으면 한 번 변환) ffmpeg 없이 패킷을 바로 보내고,
+        변환할 수 없을 때만 ffmpeg 실시간 인코딩으로 재생
+        """
+        opus_file = await asyncio.to_thread(ensure_opus, voice_file, resolve_ffmpeg())
+        if opus_file:
+            try:
+                source = OggOpusSource(opus_file)
+                self.stats['opus_plays'] += 1
+                return source
+            except OSError as e:
+                print(f"[WARNING] Opus 파일 열기 실패, ffmpeg로 재생: {e}")
+
+        self.stats['ffmpeg_plays'] += 1
+        return discord.FFmpegPCMAudio(voice_file, executable=resolve_ffmpeg())
+
+    async def play_file(self, guild, voice_file: str, label: str = "", timeout: float = 30,
+                        on_start: Optional[Callable[[], None]] = None) -> bool:
+        """음성 파일 재생"""
+        source = await self._file_source(voice_file)
+        return await self.play(guild, source, label, timeout, on_start)
+
+    async def play_files(self, guild, voice_files: List[str], label: str = "", timeout: float = 30,
+                         on_start: Optional[Callable[[int], None]] = None) -> int:
+        """여러 음성 파일을 한 연결에서 이어서 재생 (재생한 개수 반환)
+
+        재생 잠금을 끝까지 잡고 있으므로 중간에 다른 재생이 끼어들지 않는다.
+        on_start는 각 파일 재생을 시작할 때 파일 순서(0부터)와 함께 호출된다.
+        """
+        lock = self._play_locks.setdefault(guild.id, asyncio.Lock())
+        played = 0
+
+        async with lock:
+            for index, voice_file in enumerate(voice_files):
+                source = await self._file_source(voice_file)
+                callback = (lambda index=index: on_start(index)) if on_start else None
+                if not await self._play_locked(guild, source, f"{label} {index + 1}/{len(voice_files)}", timeout, callback):
+                    break
+                played += 1
+        return played
+
+    async def play_stream(self, guild, pipe: AudioPipe, label: str = "", timeout: float = 120) -> bool:
+        """파이프로 들어오는 음성을 받는 즉시 재생 (합성이 끝나기 전에 시작)"""
+        source = discord.FFmpegPCMAudio(pipe, pipe=True, executable=resolve_ffmpeg())
+        self.stats['stream_plays'] += 1
+        try:
+            return await self.play(guild, source, label, timeout)
+        finally:
+            # 재생이 실패해도 ffmpeg 입력 스레드가 멈춰 있지 않도록
+            pipe.close()
+
+    async def _reap_idle(self) -> None:
+        """유휴 연결 정리"""
+        interval = max(5, min(30, self.idle_timeout / 2))
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for voice_client in list(self.bot.voice_clients):
+                guild = voice_client.guild
+                # 관리자가 모르는 연결은 지금부터 유휴 시간 계산
+                idle = now - self.last_used.setdefault(guild.id, now)
+                if voice_client.is_playing() or idle < self.idle_timeout:
+                    continue
+                lock = self._play_locks.get(guild.id)
+                if lock and lock.locked():
+                    continue
+                with suppress(Exception):
+                    await voice_client.disconnect()
+                    self.stats['idle_disconnects'] += 1
+                    print(f"[OK] 유휴 음성 연결 해제: {guild.name}")
+                self.last_used.pop(guild.id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 통계"""
+        return {
+            **self.stats,
+            'connected': len(self.bot.voice_clients),
+            'idle_timeout': self.idle_timeout
+        }
+
+
+def get_voice_manager(bot) -> VoiceSessionManager:
+    """봇 전체에서 공유하는 음성 연결 관리자"""
+    manager = getattr(bot, 'voice_sessions', None)
+    if manager is None:
+        manager = bot.voice_sessions = VoiceSessionManager(bot)
+    return manager
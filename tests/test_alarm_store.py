@@ -0,0 +1,24 @@
+import json
+
+from core.alarm_store import LEGACY_GUILD, AlarmStore
+
+
+def test_migrates_baseline_alarms_json(tmp_path):
+    json_file = tmp_path / "alarms.json"
+    json_file.write_text(json.dumps({
+        "레이드": {"time": "21:00", "repeat": "daily", "created": "2024-01-01T00:00:00",
+                 "channel_id": 10, "voice": True},
+        "점검": {"time": "06:00", "repeat": "once", "created": "2024-01-02T00:00:00",
+               "channel_id": None, "voice": False}
+    }), encoding='utf-8')
+    store = AlarmStore(str(tmp_path / "tasks.db"))
+
+    assert store.migrate_json(str(json_file)) == 2
+    alarms = store.all(LEGACY_GUILD)
+    assert list(alarms) == ["점검", "레이드"]
+    assert alarms["레이드"] == {
+        'time': "21:00", 'repeat': "daily", 'created': "2024-01-01T00:00:00",
+        'voice': True, 'offset': 0, 'last_fired': None, 'channel_id': 10
+    }
+    assert not json_file.exists() and (tmp_path / "alarms.json.migrated").exists()
+    store.close()
@@ -0,0 +1,34 @@
+import json
+
+from core.audio_cache import AudioCache
+
+
+def _write(path, size):
+    with open(path, 'wb') as f:
+        f.write(b"x" * size)
+
+
+def test_store_defers_index_write_until_flush(tmp_path):
+    cache = AudioCache(str(tmp_path), max_bytes=1024)
+    key = cache.make_key("안녕하세요")
+    path = cache.path_for(key)
+    _write(path, 10)
+
+    cache.store(key, path, "안녕하세요")
+    assert not (tmp_path / "index.json").exists()
+
+    cache.flush()
+    with open(tmp_path / "index.json", encoding='utf-8') as f:
+        assert key in json.load(f)['entries']
+
+
+def test_unflushed_file_is_recovered_under_its_key(tmp_path):
+    cache = AudioCache(str(tmp_path), max_bytes=1024)
+    key = cache.make_key("안녕하세요")
+    path = cache.path_for(key)
+    _write(path, 10)
+    cache.store(key, path)
+    # 인덱스를 저장하지 않고 종료
+
+    restarted = AudioCache(str(tmp_path), max_bytes=1024)
+    assert restarted.lookup(key) == path
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+from datetime import datetime
+
+from core.dday_store import DDayRepository
+
+
+def test_touch_during_slow_write_is_saved(tmp_path):
+    repo = DDayRepository(str(tmp_path / "dday.xlsx"), flush_delay=0)
+    writing = threading.Event()
+    release = threading.Event()
+    saved = []
+    write = repo._write
+
+    def slow_write(entries, channels):
+        writing.set()
+        release.wait(5)
+        write(entries, channels)
+        saved.append([entry['name'] for entry in entries])
+
+    repo._write = slow_write
+
+    async def run():
+        repo.add(1, "first", datetime(2030, 1, 1))
+        await asyncio.to_thread(writing.wait, 5)
+        # 첫 저장이 끝나기 전에 들어온 변경
+        repo.add(1, "second", datetime(2030, 1, 2))
+        release.set()
+        await repo._flush_task
+
+    asyncio.run(run())
+    assert saved[-1] == ["first", "second"]
+    assert not repo._dirty
+    assert [entry['name'] for entry in DDayRepository(str(tmp_path / "dday.xlsx")).all(1)] == ["first", "second"]
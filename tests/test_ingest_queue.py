@@ -0,0 +1,32 @@
+import asyncio
+
+from core.ingest_queue import IngestQueue
+
+
+async def _noop(batch):
+    pass
+
+
+def test_drop_oldest_reports_evicted_item():
+    async def run():
+        dropped = []
+        queue = IngestQueue(_noop, maxsize=2, on_drop=dropped.append)
+        for item in ('a', 'b', 'c'):
+            queue.offer(item)
+        return dropped, queue.stats['dropped']
+
+    assert asyncio.run(run()) == (['a'], 1)
+
+
+def test_failed_spill_reports_item(tmp_path):
+    async def run():
+        dropped = []
+        # 디렉터리 경로라 파일로 열 수 없음 → 스필 실패
+        queue = IngestQueue(
+            _noop, maxsize=1, overflow='spill', spill_file=str(tmp_path), on_drop=dropped.append
+        )
+        queue.offer('a')
+        queue.offer('b')
+        return dropped, queue.stats['dropped']
+
+    assert asyncio.run(run()) == (['b'], 1)
@@ -0,0 +1,24 @@
+from core.opus_audio import ensure_opus, opus_path_for
+
+
+def test_uses_cached_opus_when_source_is_gone(tmp_path):
+    voice_file = str(tmp_path / "clip.mp3")
+    opus_file = opus_path_for(voice_file)
+    with open(opus_file, 'wb') as f:
+        f.write(b"OggS")
+
+    # 원본 mp3는 캐시에서 정리된 상태
+    assert ensure_opus(voice_file, "ffmpeg-not-needed") == opus_file
+
+
+def test_missing_source_without_opus_returns_none(tmp_path):
+    assert ensure_opus(str(tmp_path / "clip.mp3"), "ffmpeg-not-needed") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_conversion_leaves_no_temp_file(tmp_path):
+    voice_file = tmp_path / "clip.mp3"
+    voice_file.write_bytes(b"not audio")
+
+    assert ensure_opus(str(voice_file), str(tmp_path / "missing-ffmpeg")) is None
+    assert [path.name for path in tmp_path.iterdir()] == ["clip.mp3"]
@@ -0,0 +1,34 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from core.recurrence import next_fire_time, normalize_repeat
+
+SEOUL = ZoneInfo('Asia/Seoul')
+MONDAY_NOON = datetime(2026, 10, 19, 12, 0, tzinfo=SEOUL)
+
+
+@pytest.mark.parametrize('expr, expected', [
+    ('0 21 * * 4', datetime(2026, 10, 22, 21, 0, tzinfo=SEOUL)),    # 목요일
+    ('0 21 * * thu', datetime(2026, 10, 22, 21, 0, tzinfo=SEOUL)),
+    ('0 21 * * 0', datetime(2026, 10, 25, 21, 0, tzinfo=SEOUL)),    # 일요일
+    ('0 21 * * 7', datetime(2026, 10, 25, 21, 0, tzinfo=SEOUL)),
+    ('0 9 * * 1-5', datetime(2026, 10, 20, 9, 0, tzinfo=SEOUL)),    # 평일
+    ('0 9 * * 6,0', datetime(2026, 10, 24, 9, 0, tzinfo=SEOUL)),    # 주말
+])
+def test_cron_numeric_weekdays_follow_crontab(expr, expected):
+    repeat = normalize_repeat(f"cron:{expr}")
+    assert next_fire_time(repeat, "", 0, MONDAY_NOON, SEOUL) == expected
+
+
+@pytest.mark.parametrize('expr', ['0 21 * * 8', '0 21 * * 5-2'])
+def test_cron_rejects_bad_weekday_numbers(expr):
+    with pytest.raises(ValueError):
+        normalize_repeat(f"cron:{expr}")
+
+
+def test_every_requires_divisor_of_24():
+    assert normalize_repeat('every:6') == 'every:6'
+    with pytest.raises(ValueError):
+        normalize_repeat('every:5')
@@ -0,0 +1,86 @@
+import asyncio
+
+from core.sheet_sync import SheetSyncWorker
+
+HEADER = ['이름', '시간', '반복유형', '채널ID', '생성일', '상태', '음성', '길드ID']
+
+
+class FakeSheet:
+    """gspread Worksheet 대신 쓰는 메모리 시트 (get_all_values / batch_update만 구현)"""
+
+    def __init__(self, rows=None, fail_times=0):
+        self.rows = [list(row) for row in (rows or [])]
+        self.batch_calls = 0
+        self.fail_times = fail_times
+
+    def get_all_values(self):
+        return [list(row) for row in self.rows]
+
+    def batch_update(self, data, **kwargs):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise ConnectionError("quota exceeded")
+        self.batch_calls += 1
+        for update in data:
+            start = update['range'].split(':')[0]
+            first_row = int(''.join(c for c in start if c.isdigit()))
+            for offset, values in enumerate(update['values']):
+                index = first_row - 1 + offset
+                while len(self.rows) <= index:
+                    self.rows.append([])
+                self.rows[index] = list(values)
+        # 뒤쪽 빈 행 정리 (실제 시트에서 빈 칸으로 덮어쓴 것과 같은 상태)
+        while self.rows and not any(self.rows[-1]):
+            self.rows.pop()
+
+
+def alarm_row(name, guild_id, time="21:00"):
+    return [name, time, "daily", "10", "", "활성", "X", str(guild_id)]
+
+
+def test_one_batch_update_per_interval(tmp_path):
+    sheet = FakeSheet([HEADER])
+    worker = SheetSyncWorker(
+        sheet, outbox_file=str(tmp_path / "outbox.json"), interval=0.05, key_columns=(0, 7)
+    )
+
+    async def run():
+        worker.start()
+        for index in range(5):
+            worker.upsert(alarm_row(f"alarm{index}", 1))
+        worker.upsert(alarm_row("alarm0", 1, time="22:00"))  # 같은 키는 마지막 것만
+        await asyncio.sleep(0.2)
+        await worker.stop()
+
+    asyncio.run(run())
+    assert sheet.batch_calls == 1
+    assert len(sheet.rows) == 6
+    assert {row[0]: row[1] for row in sheet.rows[1:]}["alarm0"] == "22:00"
+    assert not (tmp_path / "outbox.json").exists()
+
+
+def test_outbox_replayed_after_failure(tmp_path):
+    outbox = str(tmp_path / "outbox.json")
+    sheet = FakeSheet([HEADER], fail_times=1)
+    worker = SheetSyncWorker(sheet, outbox_file=outbox, key_columns=(0, 7))
+    worker.upsert(alarm_row("a", 1))
+
+    assert asyncio.run(worker.sync_once()) is False
+    assert worker.pending and (tmp_path / "outbox.json").exists()
+
+    # 재시작: outbox에서 복구해 반영
+    restarted = SheetSyncWorker(sheet, outbox_file=outbox, key_columns=(0, 7))
+    assert asyncio.run(restarted.sync_once()) is True
+    assert sheet.rows == [HEADER, alarm_row("a", 1)]
+    assert not restarted.pending and not (tmp_path / "outbox.json").exists()
+
+
+def test_legacy_row_matched_by_key_column(tmp_path):
+    # 길드ID 열이 생기기 전의 7열 행
+    sheet = FakeSheet([HEADER, ["old", "08:00", "daily", "10", "", "활성", "X"], alarm_row("b", 2)])
+    worker = SheetSyncWorker(sheet, outbox_file=str(tmp_path / "outbox.json"), key_columns=(0, 7))
+    worker.upsert(alarm_row("old", 1, time="09:00"))
+
+    assert asyncio.run(worker.sync_once()) is True
+    # 새 행을 추가하지 않고 이전 행을 제자리에서 교체
+    assert sheet.rows == [HEADER, alarm_row("old", 1, time="09:00"), alarm_row("b", 2)]
@@ -0,0 +1,77 @@
+import os
+import threading
+
+import pytest
+
+import core.tts_backends as tts_backends
+from core.tts_backends import GTTSBackend, TTSBackend, synthesize_to_file
+
+
+class SlowBackend(TTSBackend):
+    """두 호출이 동시에 임시 파일을 쓰도록 맞춰 두는 엔진"""
+
+    name = "slow"
+    ext = "wav"
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+        self.paths = []
+
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        self.paths.append(out_path)
+        with open(out_path, 'w') as f:
+            f.write(text)
+        self.barrier.wait(5)
+
+
+class BrokenBackend(TTSBackend):
+    name = "broken"
+    ext = "wav"
+
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        raise RuntimeError("engine crashed")
+
+
+class FakeGTTS(GTTSBackend):
+    def synthesize(self, text, out_path, lang='ko', speed=1.0):
+        with open(out_path, 'w') as f:
+            f.write(f"gtts:{text}")
+
+
+def test_concurrent_synthesis_uses_separate_temp_files(tmp_path):
+    backend = SlowBackend(threading.Barrier(2))
+    out_path = str(tmp_path / "same.wav")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(synthesize_to_file("hi", out_path, backend=backend)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(backend.paths)) == 2
+    assert [path for path, _ in results] == [out_path, out_path]
+    assert os.listdir(tmp_path) == ["same.wav"]
+
+
+def test_fallback_reports_backend_that_produced_file(tmp_path, monkeypatch):
+    monkeypatch.setitem(tts_backends._instances, GTTSBackend.name, FakeGTTS())
+    monkeypatch.setattr(tts_backends, '_resolved', {})
+
+    path, used = synthesize_to_file("hi", str(tmp_path / "clip.wav"), backend=BrokenBackend())
+
+    assert used.name == GTTSBackend.name
+    assert path == str(tmp_path / "clip.mp3")
+    assert os.listdir(tmp_path) == ["clip.mp3"]
+
+
+def test_failed_synthesis_leaves_no_temp_file(tmp_path, monkeypatch):
+    class BrokenGTTS(GTTSBackend):
+        def synthesize(self, text, out_path, lang='ko', speed=1.0):
+            raise RuntimeError("offline")
+
+    with pytest.raises(RuntimeError):
+        synthesize_to_file("hi", str(tmp_path / "clip.mp3"), backend=BrokenGTTS())
+    assert os.listdir(tmp_path) == []